@@ -1,14 +1,20 @@
 from . import errors
 from .base import AggregateMeta
 from .base import Batch
+from .base import BridgeLatencyMetrics
+from .base import BridgeMetrics
 from .base import Cluster
 from .base import ColumnMeta
+from .base import CompletionTracker
+from .base import ConcurrentExecution
 from .base import Consistency
+from .base import DecodeOptions
 from .base import DseGssapiAuthenticator
 from .base import DseGssapiAuthenticatorProxy
 from .base import DsePlaintextAuthenticator
 from .base import DsePlaintextAuthenticatorProxy
 from .base import FunctionMeta
+from .base import HistogramMetrics
 from .base import HostListenerEvent
 from .base import IndexMeta
 from .base import KeyspaceMeta
@@ -18,10 +24,12 @@ from .base import LogMessage
 from .base import MaterializedViewMeta
 from .base import Metadata
 from .base import NestedTypeMeta
+from .base import PreparedCacheMetrics
 from .base import PreparedStatement
 from .base import ProtocolVersion
 from .base import Result
 from .base import Row
+from .base import RowFactory
 from .base import Session
 from .base import SessionMetrics
 from .base import SpeculativeExecutionMetrics
@@ -29,6 +37,8 @@ from .base import SpeculativeExecutionPolicy
 from .base import SSLVerifyFlags
 from .base import Statement
 from .base import TableMeta
+from .base import TableScan
+from .base import TokenRange
 from .base import UserTypeFieldMeta
 from .base import UserTypeMeta
 from .base import ValueType
@@ -52,9 +62,19 @@ __all__ = (
     "ProtocolVersion",
     "PreparedStatement",
     "Batch",
+    "CompletionTracker",
+    "ConcurrentExecution",
+    "TableScan",
+    "TokenRange",
+    "DecodeOptions",
     "Result",
     "Row",
+    "RowFactory",
     "SessionMetrics",
+    "BridgeMetrics",
+    "BridgeLatencyMetrics",
+    "HistogramMetrics",
+    "PreparedCacheMetrics",
     "ColumnMeta",
     "IndexMeta",
     "TableMeta",
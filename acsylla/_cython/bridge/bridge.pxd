@@ -0,0 +1,21 @@
+cdef class Bridge:
+    cdef:
+        PosixToPython* posix_to_python
+        object loop
+        object _read_socket
+        object _write_socket
+        int refs
+        uint64_t next_token
+        dict targets
+        Log2Histogram drain_batch_size
+        # Time in microseconds spent per drain pass.
+        Log2Histogram drain_duration
+
+    cdef uint64_t register(self, object target)
+    cdef void unregister(self, uint64_t token)
+    cdef void release(self)
+    cdef bint closed(self)
+    cdef void _handle_entry(self, BridgeEntry entry)
+
+    @staticmethod
+    cdef Bridge acquire(object loop)
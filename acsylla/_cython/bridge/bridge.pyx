@@ -0,0 +1,193 @@
+import socket
+
+
+# Upper bound of wakeup bytes consumed by a single `recv` call, big enough
+# for draining all of the pending notifications at once.
+cdef enum:
+    BRIDGE_RECV_SIZE = 65536
+
+
+# Bridges in use, one per event loop.
+cdef dict _bridges = {}
+
+
+cdef class Bridge:
+    """ Wakeup path between the driver threads and one event loop.
+
+    Shared by all of the clusters, loggers, host listeners and completion
+    trackers running on the same loop, the driver threads publish tagged
+    entries that are handled in a single drain pass triggered through one
+    file descriptor.
+    """
+
+    def __cinit__(self):
+        self.posix_to_python = NULL
+
+    def __dealloc__(self):
+        if self.posix_to_python != NULL:
+            # Freed once the late driver callbacks are done with it.
+            self.posix_to_python.close()
+            self.posix_to_python.release()
+
+    @staticmethod
+    cdef Bridge acquire(object loop):
+        """ Returns the bridge of the loop, creating it if needed. Each
+        call must be paired with a `release`.
+        """
+        cdef Bridge bridge
+
+        # Bridges whose loop was closed without releasing them can't be
+        # used anymore, the ones still referenced are freed by their owners.
+        for closed_loop in [other for other in _bridges if other.is_closed()]:
+            del _bridges[closed_loop]
+
+        bridge = _bridges.get(loop)
+        if bridge is None:
+            bridge = Bridge.__new__(Bridge)
+            bridge.loop = loop
+            bridge.refs = 0
+            bridge.next_token = 1
+            bridge.targets = {}
+            bridge._read_socket, bridge._write_socket = socket.socketpair()
+            bridge.posix_to_python = new PosixToPython(bridge._write_socket.fileno())
+            loop.add_reader(bridge._read_socket, bridge._handle_events)
+            _bridges[loop] = bridge
+
+        bridge.refs += 1
+        return bridge
+
+    cdef void release(self):
+        self.refs -= 1
+        if self.refs > 0 or self._read_socket is None:
+            return
+
+        if _bridges.get(self.loop) is self:
+            del _bridges[self.loop]
+        if not self.loop.is_closed():
+            self.loop.remove_reader(self._read_socket)
+        self._read_socket.close()
+        self._read_socket = None
+        # Late completions are dropped from now on, so they never write
+        # into a reused file descriptor.
+        self.posix_to_python.close()
+        if not self.loop.is_closed():
+            # Hands over the ones published before closing.
+            self._drain_events()
+        self._write_socket.close()
+        self._write_socket = None
+
+        # The submitted requests still in flight will never be completed.
+        for target in list(self.targets.values()):
+            if isinstance(target, CompletionTracker):
+                (<CompletionTracker>target)._abandon()
+
+    cdef bint closed(self):
+        return self._read_socket is None
+
+    cdef uint64_t register(self, object target):
+        """ Returns the token used by the driver threads for addressing
+        their messages to `target`.
+        """
+        cdef uint64_t token = self.next_token
+        self.next_token += 1
+        self.targets[token] = target
+        return token
+
+    cdef void unregister(self, uint64_t token):
+        self.targets.pop(token, None)
+
+    def _handle_events(self):
+        """ Function called from the Asyncio Loop because some
+        data was added into the queue, it gets from the queue
+        the data and calls the corresponding CallbackWrappers,
+        loggers and host listeners.
+
+        All of the pending wakeup bytes are consumed with a single read,
+        the queue is drained until is empty so wakeups that were coalesced
+        by the driver threads are not lost.
+        """
+        cdef bytes _ = self._read_socket.recv(BRIDGE_RECV_SIZE)
+        self._drain_events()
+
+    def _drain_events(self):
+        """ Takes all of the entries published by the driver threads
+        in one batch and handles them without any lock held.
+
+        Since the driver threads only wake up the loop when the queue
+        was empty, the drain is scheduled again while there are entries
+        published after the batch was taken.
+        """
+        cdef vector[BridgeEntry] batch
+        cdef int64_t pending
+        cdef size_t i
+        cdef uint64_t start = monotonic_ns()
+
+        pending = self.posix_to_python.drain(batch)
+        for i in range(batch.size()):
+            self._handle_entry(batch[i])
+
+        self.drain_batch_size.record(batch.size())
+        self.drain_duration.record((monotonic_ns() - start) // 1000)
+
+        if pending > 0 and self._read_socket is not None:
+            self.loop.call_soon(self._drain_events)
+
+    cdef void _handle_entry(self, BridgeEntry entry):
+        cdef CallbackWrapper cb_wrapper = None
+
+        target = None
+        if entry.tag == BRIDGE_COMPLETION:
+            cb_wrapper = <CallbackWrapper> entry.data
+        else:
+            target = self.targets.get(entry.token)
+        try:
+            if entry.tag == BRIDGE_COMPLETION:
+                cb_wrapper.cluster.queue_delay.record((monotonic_ns() - entry.enqueued_ns) // 1000)
+                cb_wrapper.set_result()
+            elif entry.tag == BRIDGE_LOG_MESSAGE:
+                if target is not None:
+                    (<Logger>target).handle_message(<CassLogMessage*> entry.data)
+            elif entry.tag == BRIDGE_HOST_EVENT:
+                if target is not None:
+                    (<HostListener>target).handle_message(<HostListenerMessage*> entry.data)
+            elif entry.tag == BRIDGE_SUBMIT_COMPLETION:
+                if target is not None:
+                    (<CompletionTracker>target).cluster.queue_delay.record((monotonic_ns() - entry.enqueued_ns) // 1000)
+                    (<CompletionTracker>target)._complete(<SubmitError*> entry.data)
+        except Exception as exc:
+            # A failing handler must not prevent the rest of the batch
+            # from being handled.
+            self.loop.call_exception_handler({
+                'message': 'Exception in acsylla bridge handler',
+                'exception': exc,
+            })
+        finally:
+            if entry.tag == BRIDGE_COMPLETION:
+                # Reference taken when the wrapper was attached to its future.
+                Py_DECREF(cb_wrapper)
+            elif entry.tag == BRIDGE_LOG_MESSAGE:
+                free_log_message(<CassLogMessage*> entry.data)
+            elif entry.tag == BRIDGE_HOST_EVENT:
+                free_host_listener_message(<HostListenerMessage*> entry.data)
+            elif entry.tag == BRIDGE_SUBMIT_COMPLETION and entry.data != NULL:
+                free_submit_error(<SubmitError*> entry.data)
+
+
+cdef histogram_metrics(Log2Histogram* histogram):
+    """ Returns a `acsylla.HistogramMetrics` snapshot of the histogram. """
+    from acsylla import HistogramMetrics
+    return HistogramMetrics(
+        count=histogram.count,
+        min=histogram.min,
+        max=histogram.max,
+        mean=histogram.sum // histogram.count if histogram.count else 0,
+        percentile_50th=histogram.percentile(50),
+        percentile_95th=histogram.percentile(95),
+        percentile_99th=histogram.percentile(99),
+        percentile_999th=histogram.percentile(99.9),
+        buckets=[
+            (log2_histogram_bucket_upper_bound(i), histogram.buckets[i])
+            for i in range(LOG2_HISTOGRAM_BUCKETS)
+            if histogram.buckets[i] > 0
+        ]
+    )
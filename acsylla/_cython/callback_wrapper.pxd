@@ -1,8 +1,19 @@
 cdef class CallbackWrapper:
     cdef:
-        object future
+        object loop
+        # Keeps the bridge alive until the completion is handed over.
+        Bridge bridge
         Cluster cluster
+        int state
+        object callback
+        object callback_context
+        list callbacks
+        object cancel_message
+        CallbackContainer* container
+        public bint _asyncio_future_blocking
     cdef void set_result(self)
+    cdef void _schedule_callbacks(self)
+    cdef _attach(self, CassFuture* cass_future, Cluster cluster, bint materialize, bint tracing_enabled)
 
     @staticmethod
-    cdef CallbackWrapper new_(CassFuture* cass_future, Cluster cluster)
+    cdef CallbackWrapper new_(CassFuture* cass_future, Cluster cluster, bint materialize=*, bint tracing_enabled=*)
@@ -1,32 +1,146 @@
+cdef enum:
+    CALLBACK_WRAPPER_PENDING = 0
+    CALLBACK_WRAPPER_FINISHED = 1
+    CALLBACK_WRAPPER_CANCELLED = 2
+
+
 cdef class CallbackWrapper:
+    """ Awaitable completed by the bridge once the driver has finished
+    the request.
+
+    Implements the subset of the `asyncio.Future` protocol used by the
+    asyncio tasks, so it can be awaited directly without allocating a
+    future and a coroutine per request. It carries no result, once
+    resolved the caller reads it from the `CassFuture`, or from the
+    container when the result was materialized by the driver IO thread.
+    """
+
+    def __cinit__(self):
+        self.container = NULL
+
+    def __dealloc__(self):
+        if self.container != NULL:
+            if self.container.result != NULL:
+                # Materialized but never claimed, e.g. cancelled requests.
+                cass_result_free(<CassResult*>self.container.result)
+            del self.container
+
+    def __await__(self):
+        return self
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.state == CALLBACK_WRAPPER_PENDING:
+            self._asyncio_future_blocking = True
+            return self
+        self.result()
+        raise StopIteration
 
-    async def __await__(self):
-        result = await self.future
-        return result
-    
     cdef void set_result(self):
-        if self.future.done():
+        if self.state != CALLBACK_WRAPPER_PENDING:
             return
 
-        self.future.set_result(None)
+        self.state = CALLBACK_WRAPPER_FINISHED
+        self._schedule_callbacks()
+
+    cdef void _schedule_callbacks(self):
+        if self.callback is not None:
+            self.loop.call_soon(self.callback, self, context=self.callback_context)
+            self.callback = None
+            self.callback_context = None
+        if self.callbacks is not None:
+            for callback, context in self.callbacks:
+                self.loop.call_soon(callback, self, context=context)
+            self.callbacks = None
+
+    def get_loop(self):
+        return self.loop
+
+    def done(self):
+        return self.state != CALLBACK_WRAPPER_PENDING
+
+    def cancelled(self):
+        return self.state == CALLBACK_WRAPPER_CANCELLED
+
+    def cancel(self, msg=None):
+        if self.state != CALLBACK_WRAPPER_PENDING:
+            return False
+
+        self.state = CALLBACK_WRAPPER_CANCELLED
+        self.cancel_message = msg
+        self._schedule_callbacks()
+        return True
+
+    def result(self):
+        if self.state == CALLBACK_WRAPPER_CANCELLED:
+            raise asyncio.CancelledError(self.cancel_message)
+        if self.state == CALLBACK_WRAPPER_PENDING:
+            raise asyncio.InvalidStateError("Result is not ready.")
+        return None
+
+    def exception(self):
+        self.result()
+        return None
+
+    def add_done_callback(self, fn, *, context=None):
+        if self.state != CALLBACK_WRAPPER_PENDING:
+            self.loop.call_soon(fn, self, context=context)
+        elif self.callback is None and self.callbacks is None:
+            # The awaiting task is almost always the only one waiting
+            # for the completion, keep it out of a list.
+            self.callback = fn
+            self.callback_context = context
+        else:
+            if self.callbacks is None:
+                self.callbacks = []
+            self.callbacks.append((fn, context))
+
+    def remove_done_callback(self, fn):
+        cdef int removed = 0
+        if self.callback is not None and self.callback == fn:
+            self.callback = None
+            self.callback_context = None
+            removed += 1
+        if self.callbacks is not None:
+            remaining = [(callback, context) for callback, context in self.callbacks if callback != fn]
+            removed += len(self.callbacks) - len(remaining)
+            self.callbacks = remaining or None
+        return removed
 
     @staticmethod
-    cdef CallbackWrapper new_(CassFuture* cass_future, Cluster cluster):
+    cdef CallbackWrapper new_(CassFuture* cass_future, Cluster cluster, bint materialize=False, bint tracing_enabled=False):
         cdef CallbackWrapper cb_wrapper
 
-        cb_wrapper = CallbackWrapper()
-        cb_wrapper.future = cluster.loop.create_future()
-        Py_INCREF(cb_wrapper)
+        cb_wrapper = CallbackWrapper.__new__(CallbackWrapper)
+        cb_wrapper._attach(cass_future, cluster, materialize, tracing_enabled)
+        return cb_wrapper
+
+    cdef _attach(self, CassFuture* cass_future, Cluster cluster, bint materialize, bint tracing_enabled):
+        """ Registers the wrapper for being resolved by the bridge once the
+        driver has finished the request.
+        """
+        self.loop = cluster.loop
+        self.bridge = cluster.bridge
+        self.cluster = cluster
+        self.state = CALLBACK_WRAPPER_PENDING
+        Py_INCREF(self)
 
         cdef CallbackContainer* container
-        container = new CallbackContainer(<PosixToPython*>cluster.posix_to_python, <void*>cb_wrapper)
+        container = new CallbackContainer(cluster.bridge.posix_to_python, <void*>self)
+        container.coalesce_wakeups = cluster.coalesce_wakeups
+        if materialize:
+            container.materialize = True
+            container.tracing_enabled = tracing_enabled
+            self.container = container
         error = cass_future_set_callback(
             cass_future,
             <CassFutureCallback>posix_to_python_callback,
             <void*>container
         )
         if error != CASS_OK:
-            Py_DECREF(cb_wrapper)
+            self.container = NULL
+            del container
+            Py_DECREF(self)
             raise_if_error(error)
-
-        return cb_wrapper
@@ -1,10 +1,13 @@
 cdef class Cluster:
     cdef:
-        PosixToPython* posix_to_python
+        Bridge bridge
         CassCluster* cass_cluster
         CassSsl* ssl
         Logger logger
         HostListener host_listener
-        object _read_socket
-        object _write_socket
         object loop
+        bint coalesce_wakeups
+        bint materialize_results
+        # Time in microseconds from the driver callback until the
+        # completion is resolved by the event loop.
+        Log2Histogram queue_delay
@@ -1,5 +1,4 @@
 import random
-import socket
 
 
 cdef class Cluster:
@@ -11,52 +10,28 @@ cdef class Cluster:
             cass_log_set_callback(NULL, NULL)
             self.logger.destroy()
             self.logger = None
-        if self.loop and self.loop.is_running() and self._read_socket:
-            self.loop.remove_reader(self._read_socket)
+        if self.bridge is not None:
+            self.bridge.release()
+            self.bridge = None
             self.loop = None
-            self._read_socket.close()
-            self._read_socket = None
-        if self._write_socket:
-            self._write_socket.close()
-            self._write_socket = None
 
     def __dealloc__(self):
+        # Releases the bridge of clusters never destroyed explicitly,
+        # otherwise their event loop and its sockets would be kept alive.
+        self.destroy()
         cass_cluster_free(self.cass_cluster)
-        del self.posix_to_python
         if self.ssl != NULL:
             cass_ssl_free(self.ssl)
 
     def __cinit__(self):
         self.loop = asyncio.get_running_loop()
-        self._read_socket, self._write_socket = socket.socketpair()
-        self.loop.add_reader(self._read_socket, self._handle_events)
-        self.posix_to_python = new PosixToPython(self._write_socket.fileno())
+        self.bridge = Bridge.acquire(self.loop)
         self.ssl = NULL
         self.cass_cluster = NULL
         self.logger = Logger()
         self.host_listener = None
-
-    def _handle_events(self):
-        """ Function called from the Asyncio Loop because some
-        data was added into the queue, it gets from the queue
-        the data and calls the corresponding CallbackWrappers.
-        """
-        cdef bytes _ = self._read_socket.recv(1)
-        cdef void* data
-        cdef CallbackWrapper cb_wrapper
-
-        while True:
-            self.posix_to_python._queue_mutex.lock()
-            if self.posix_to_python._queue.empty():
-                self.posix_to_python._queue_mutex.unlock()
-                break
-            else:
-                data = self.posix_to_python._queue.front()
-                self.posix_to_python._queue.pop()
-                self.posix_to_python._queue_mutex.unlock()
-                cb_wrapper = <CallbackWrapper> data
-                cb_wrapper.set_result()
-                Py_DECREF(cb_wrapper)
+        self.coalesce_wakeups = True
+        self.materialize_results = False
 
     def __init__(
         self,
@@ -129,7 +104,9 @@ cdef class Cluster:
         object dse_gssapi_authenticator=None,
         object dse_gssapi_authenticator_proxy=None,
         object dse_plaintext_authenticator=None,
-        object dse_plaintext_authenticator_proxy=None):
+        object dse_plaintext_authenticator_proxy=None,
+        object coalesce_wakeups=None,
+        object materialize_results=None):
 
         self.cass_cluster = cass_cluster_new()
 
@@ -219,6 +196,8 @@ cdef class Cluster:
                 dse_plaintext_authenticator_proxy.password.encode(),
                 dse_plaintext_authenticator_proxy.authorization_id.encode()
             )
+        self.set_coalesce_wakeups(coalesce_wakeups)
+        self.set_materialize_results(materialize_results)
 
     def set_contact_points(self, contact_points):
         if contact_points is not None:
@@ -564,11 +543,19 @@ cdef class Cluster:
             )
             raise_if_error(error)
 
+    def set_coalesce_wakeups(self, enabled):
+        if enabled is not None:
+            self.coalesce_wakeups = enabled
+
+    def set_materialize_results(self, enabled):
+        if enabled is not None:
+            self.materialize_results = enabled
+
     def get_logger(self):
         return self.logger
 
-    async def create_session(self, keyspace=None):
-        session = Session(self, keyspace=keyspace)
+    async def create_session(self, keyspace=None, prepared_cache_size=None, decode_options=None):
+        session = Session(self, keyspace=keyspace, prepared_cache_size=prepared_cache_size, decode_options=decode_options)
         await session._connect()
         return session
 
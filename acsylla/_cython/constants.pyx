@@ -35,6 +35,12 @@ class HostListenerEvent:
     ADD = CASS_HOST_LISTENER_EVENT_ADD
     REMOVE = CASS_HOST_LISTENER_EVENT_REMOVE
 
+class RowFactory:
+    ROW = ROW_FACTORY_ROW
+    TUPLE = ROW_FACTORY_TUPLE
+    DICT = ROW_FACTORY_DICT
+    NAMED_TUPLE = ROW_FACTORY_NAMED_TUPLE
+
 class ValueType:
     CUSTOM = CASS_VALUE_TYPE_CUSTOM
     ASCII = CASS_VALUE_TYPE_ASCII
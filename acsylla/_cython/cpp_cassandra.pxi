@@ -508,6 +508,7 @@ cdef extern from "cassandra.h" nogil:
 
 
   void cass_future_free(CassFuture* future)
+  void cass_future_wait(CassFuture* future)
   CassError cass_future_error_code(CassFuture* future)
   CassError cass_future_set_callback(CassFuture* future, CassFutureCallback callback, void* data)
   CassErrorResult* cass_future_get_error_result(CassFuture* future)
@@ -526,6 +527,8 @@ cdef extern from "cassandra.h" nogil:
   cass_bool_t cass_result_has_more_pages(const CassResult* result)
   CassError cass_result_paging_state_token(const CassResult* result, const char** paging_state, size_t* paging_state_size)
   CassError cass_result_column_name(const CassResult* result, size_t index,  const char** name,size_t* name_length)
+  CassValueType cass_result_column_type(const CassResult* result, size_t index)
+  const CassDataType* cass_result_column_data_type(const CassResult* result, size_t index)
   void cass_result_free(CassResult* result)
 
   CassValueType cass_data_type_type(const CassDataType* data_type)
@@ -1,14 +1,20 @@
 include "cpp_cassandra.pxi"
 include "posix_to_python_thread.pxi"
+include "bridge/bridge.pxd"
 include "callback_wrapper.pxd"
 include "cluster/cluster.pxd"
 include "logger/logger.pxd"
+include "result/value.pxd"
 include "result/result.pxd"
 include "result/row.pxd"
-include "result/value.pxd"
+include "result/columns.pxd"
 include "session/metadata.pxd"
 include "session/session.pxd"
 include "statement/batch.pxd"
 include "statement/statement.pxd"
 include "statement/prepared.pxd"
+include "statement/pages.pxd"
+include "session/concurrent.pxd"
+include "session/tracker.pxd"
+include "session/scan.pxd"
 include "host_listener/host_listener.pxd"
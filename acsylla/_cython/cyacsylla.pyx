@@ -1,3 +1,4 @@
+include "bridge/bridge.pyx"
 include "callback_wrapper.pyx"
 include "cass_errors.pyx"
 include "cluster/cluster.pyx"
@@ -7,10 +8,15 @@ include "errors.pyx"
 include "result/result.pyx"
 include "result/row.pyx"
 include "result/value.pyx"
+include "result/columns.pyx"
 include "session/metadata.pyx"
 include "session/session.pyx"
+include "session/concurrent.pyx"
+include "session/tracker.pyx"
+include "session/scan.pyx"
 include "statement/batch.pyx"
 include "statement/statement.pyx"
+include "statement/pages.pyx"
 include "statement/prepared.pyx"
 include "statement/bind.pyx"
 include "host_listener/host_listener.pyx"
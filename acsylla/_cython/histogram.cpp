@@ -0,0 +1,100 @@
+#pragma once
+
+#include <chrono>
+#include <cmath>
+#include <cstdint>
+
+// Bucket 0 counts the zeros, bucket `i` counts the values within
+// [2^(i-1), 2^i - 1].
+#define LOG2_HISTOGRAM_BUCKETS 65
+
+// Histogram with power of two buckets, cheap enough for being updated once
+// per completion. Not thread safe, it is only updated and read by the
+// thread running the event loop.
+class Log2Histogram {
+    public:
+        Log2Histogram();
+        ~Log2Histogram() = default;
+        void record(uint64_t value);
+        // Upper bound of the bucket holding the percentile, capped by the
+        // maximum recorded value.
+        uint64_t percentile(double percentile) const;
+        uint64_t count;
+        uint64_t sum;
+        uint64_t min;
+        uint64_t max;
+        uint64_t buckets[LOG2_HISTOGRAM_BUCKETS];
+};
+
+inline int log2_histogram_bucket(uint64_t value) {
+    if (value == 0) {
+        return 0;
+    }
+#if defined(__GNUC__) || defined(__clang__)
+    return 64 - __builtin_clzll(value);
+#else
+    int bucket = 0;
+    while (value) {
+        value >>= 1;
+        bucket++;
+    }
+    return bucket;
+#endif
+}
+
+inline uint64_t log2_histogram_bucket_upper_bound(int bucket) {
+    if (bucket == 0) {
+        return 0;
+    }
+    if (bucket == 64) {
+        return UINT64_MAX;
+    }
+    return (((uint64_t)1) << bucket) - 1;
+}
+
+inline uint64_t monotonic_ns() {
+    return (uint64_t)std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now().time_since_epoch()
+    ).count();
+}
+
+Log2Histogram::Log2Histogram() {
+    count = 0;
+    sum = 0;
+    min = 0;
+    max = 0;
+    for (int i = 0; i < LOG2_HISTOGRAM_BUCKETS; i++) {
+        buckets[i] = 0;
+    }
+}
+
+void Log2Histogram::record(uint64_t value) {
+    if (count == 0 || value < min) {
+        min = value;
+    }
+    if (value > max) {
+        max = value;
+    }
+    count++;
+    sum += value;
+    buckets[log2_histogram_bucket(value)]++;
+}
+
+uint64_t Log2Histogram::percentile(double percentile) const {
+    if (count == 0) {
+        return 0;
+    }
+    uint64_t rank = (uint64_t)std::ceil(percentile / 100.0 * count);
+    if (rank == 0) {
+        rank = 1;
+    }
+    uint64_t seen = 0;
+    for (int i = 0; i < LOG2_HISTOGRAM_BUCKETS; i++) {
+        seen += buckets[i];
+        if (seen >= rank) {
+            uint64_t upper_bound = log2_histogram_bucket_upper_bound(i);
+            return upper_bound < max ? upper_bound : max;
+        }
+    }
+    return max;
+}
@@ -1,8 +1,9 @@
 cdef class HostListener:
     cdef:
-        object _read_socket
-        object _write_socket
+        Bridge bridge
+        BridgeSource* bridge_source
+        uint64_t token
         object host_listener_callback
-        PosixToPythonHostListener* posix_to_python
 
-    cdef init(self, CassCluster* cass_cluster, object callback)
\ No newline at end of file
+    cdef init(self, CassCluster* cass_cluster, object callback)
+    cdef handle_message(self, HostListenerMessage* message)
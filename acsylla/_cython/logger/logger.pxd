@@ -1,8 +1,10 @@
 cdef class Logger:
     cdef:
-        object _read_socket
-        object _write_socket
-        PosixToPythonLogger* posix_to_python
+        Bridge bridge
+        BridgeSource* bridge_source
+        uint64_t token
         object logging_callback
 
+    cdef handle_message(self, CassLogMessage* message)
+
 cdef log_level_from_str(object level)
\ No newline at end of file
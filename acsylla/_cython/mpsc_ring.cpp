@@ -0,0 +1,103 @@
+#pragma once
+
+#include <atomic>
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+
+// Bounded lock-free multi-producer/single-consumer ring buffer of `T` items,
+// `T` is expected to be trivially copyable.
+//
+// Based on the bounded queue of Dmitry Vyukov, each cell carries a sequence
+// number that tells producers whether the cell is free and tells the consumer
+// whether the cell has been published. Producers only contend on the CAS over
+// the enqueue position, the consumer never takes a lock.
+//
+// `try_push` returns false when the ring is full, callers are expected to
+// fall back to a secondary (locked) container.
+template <class T>
+class MpscRing {
+    public:
+        explicit MpscRing(size_t capacity);
+        ~MpscRing() = default;
+        MpscRing(const MpscRing&) = delete;
+        MpscRing& operator=(const MpscRing&) = delete;
+
+        bool try_push(const T& data);
+        bool try_pop(T* data);
+        size_t capacity() const { return _mask + 1; }
+
+    private:
+        struct Cell {
+            std::atomic<size_t> sequence;
+            T data;
+        };
+
+        // Padding keeps the producers' and the consumer's positions in
+        // different cache lines, `alignas` is not honoured by `new` in C++14.
+        std::unique_ptr<Cell[]> _cells;
+        size_t _mask;
+        char _pad0[64];
+        std::atomic<size_t> _enqueue_pos;
+        char _pad1[64];
+        size_t _dequeue_pos;
+};
+
+inline size_t mpsc_ring_round_capacity(size_t capacity) {
+    size_t rounded = 2;
+    while (rounded < capacity) {
+        rounded <<= 1;
+    }
+    return rounded;
+}
+
+template <class T>
+MpscRing<T>::MpscRing(size_t capacity) {
+    size_t rounded = mpsc_ring_round_capacity(capacity);
+    _cells.reset(new Cell[rounded]);
+    _mask = rounded - 1;
+    for (size_t i = 0; i < rounded; i++) {
+        _cells[i].sequence.store(i, std::memory_order_relaxed);
+    }
+    _enqueue_pos.store(0, std::memory_order_relaxed);
+    _dequeue_pos = 0;
+}
+
+template <class T>
+bool MpscRing<T>::try_push(const T& data) {
+    Cell* cell;
+    size_t pos = _enqueue_pos.load(std::memory_order_relaxed);
+    for (;;) {
+        cell = &_cells[pos & _mask];
+        size_t sequence = cell->sequence.load(std::memory_order_acquire);
+        intptr_t diff = (intptr_t)sequence - (intptr_t)pos;
+        if (diff == 0) {
+            if (_enqueue_pos.compare_exchange_weak(pos, pos + 1, std::memory_order_relaxed)) {
+                break;
+            }
+        } else if (diff < 0) {
+            // The consumer did not release this cell yet, ring is full.
+            return false;
+        } else {
+            pos = _enqueue_pos.load(std::memory_order_relaxed);
+        }
+    }
+    cell->data = data;
+    cell->sequence.store(pos + 1, std::memory_order_release);
+    return true;
+}
+
+template <class T>
+bool MpscRing<T>::try_pop(T* data) {
+    Cell* cell = &_cells[_dequeue_pos & _mask];
+    size_t sequence = cell->sequence.load(std::memory_order_acquire);
+    intptr_t diff = (intptr_t)sequence - (intptr_t)(_dequeue_pos + 1);
+    if (diff < 0) {
+        // Empty, or the producer that claimed this cell did not publish it yet.
+        return false;
+    }
+    *data = cell->data;
+    cell->sequence.store(_dequeue_pos + _mask + 1, std::memory_order_release);
+    _dequeue_pos++;
+    return true;
+}
@@ -1,64 +1,276 @@
+#include <atomic>
+#include <cstdlib>
 #include <cstring>
 #include <mutex>
 #include <queue>
+#include <string>
 #include <unistd.h>
 #include <iostream>
 #include <memory>
+#include <vector>
 
 #include "cassandra.h"
+#include "histogram.cpp"
+#include "mpsc_ring.cpp"
 
+// Entries that fit in the ring never take a lock, the rest overflow into
+// the mutex protected queue.
+#define COMPLETION_RING_CAPACITY 8192
+
+// Kind of the entries handed over to the event loop through the bridge.
+enum BridgeEntryTag {
+    BRIDGE_COMPLETION = 0,
+    BRIDGE_LOG_MESSAGE = 1,
+    BRIDGE_HOST_EVENT = 2,
+    BRIDGE_SUBMIT_COMPLETION = 3,
+};
+
+// A completion carries the `CallbackWrapper` in `data` and the time it was
+// published at, log messages and host events carry a heap copy of the
+// message in `data` and the token which identifies the Python object that
+// has to handle them. Completions of submitted requests carry the token
+// of their tracker, and a `SubmitError` in `data` only when they failed.
+typedef struct BridgeEntry_ {
+    BridgeEntryTag tag;
+    uint64_t token;
+    void* data;
+    uint64_t enqueued_ns;
+} BridgeEntry;
+
+// Frees whatever an entry owns when it can't be handed over anymore.
+void drop_bridge_entry(const BridgeEntry& entry);
+
+// Single wakeup path shared by all of the clusters, loggers and host
+// listeners running on the same event loop.
+//
+// The instance is reference counted, the bridge owns the first reference
+// and every callback container and bridge source takes one more, so a late
+// driver callback never touches freed memory. Once closed the entries are
+// dropped and the socket is not written anymore.
 class PosixToPython {
     public:
         PosixToPython(int write_fd);
         ~PosixToPython() = default;
+        void push(const BridgeEntry& entry, bool coalesce_wakeups);
+        int64_t drain(std::vector<BridgeEntry>& batch);
+        void close();
+        void retain();
+        void release();
         int write_fd;
+        std::atomic<uint64_t> wakeups;
+        std::atomic<uint64_t> completions;
+        std::atomic<uint64_t> overflows;
+        MpscRing<BridgeEntry> _ring;
+        // Published but not yet drained entries, might go transiently
+        // negative when the reader drains an item before its producer
+        // accounted it.
+        std::atomic<int64_t> _pending;
+        std::atomic<bool> _overflowed;
         std::mutex _queue_mutex;
-        std::queue<void *> _queue;
+        std::queue<BridgeEntry> _queue;
+        std::atomic<int64_t> _refs;
+        std::atomic<bool> _closed;
+        // Serializes the socket writes with `close`, the socket can be
+        // closed by the event loop right after.
+        std::mutex _write_mutex;
 };
 
-PosixToPython::PosixToPython(int fd) {
+PosixToPython::PosixToPython(int fd) : _ring(COMPLETION_RING_CAPACITY) {
     write_fd = fd;
+    wakeups = 0;
+    completions = 0;
+    overflows = 0;
+    _pending = 0;
+    _overflowed = false;
+    _refs = 1;
+    _closed = false;
+}
+
+// Stops handing over entries, must be called before closing the socket.
+void PosixToPython::close() {
+    std::lock_guard<std::mutex> lock(_write_mutex);
+    _closed.store(true, std::memory_order_release);
+    write_fd = -1;
+}
+
+void PosixToPython::retain() {
+    _refs.fetch_add(1, std::memory_order_relaxed);
+}
+
+void PosixToPython::release() {
+    if (_refs.fetch_sub(1, std::memory_order_acq_rel) == 1) {
+        delete this;
+    }
+}
+
+// When `coalesce_wakeups` is enabled the socket is only written when the
+// queue goes from empty to non empty, the reader drains the whole queue per
+// wakeup.
+void PosixToPython::push(const BridgeEntry& entry, bool coalesce_wakeups) {
+    if (_closed.load(std::memory_order_acquire)) {
+        drop_bridge_entry(entry);
+        return;
+    }
+    if (!_ring.try_push(entry)) {
+        std::lock_guard<std::mutex> lock(_queue_mutex);
+        _queue.push(entry);
+        _overflowed.store(true, std::memory_order_release);
+        overflows.fetch_add(1, std::memory_order_relaxed);
+    }
+    if (entry.tag == BRIDGE_COMPLETION) {
+        completions.fetch_add(1, std::memory_order_relaxed);
+    }
+    int64_t pending = _pending.fetch_add(1, std::memory_order_acq_rel);
+    if (pending == 0 || !coalesce_wakeups) {
+        std::lock_guard<std::mutex> lock(_write_mutex);
+        if (write_fd >= 0) {
+            wakeups.fetch_add(1, std::memory_order_relaxed);
+            write(write_fd, "1", 1);
+        }
+    }
+}
+
+// Moves all of the published entries into `batch`, must be called only from
+// the event loop thread. Returns how many entries are still pending, when
+// positive the caller must drain again since no new wakeup is granted.
+int64_t PosixToPython::drain(std::vector<BridgeEntry>& batch) {
+    BridgeEntry entry;
+    size_t start = batch.size();
+    while (_ring.try_pop(&entry)) {
+        batch.push_back(entry);
+    }
+    if (_overflowed.load(std::memory_order_acquire)) {
+        // Swap the overflow queue out under a single lock acquisition and
+        // copy it into the batch once the lock has been released.
+        std::queue<BridgeEntry> overflow;
+        {
+            std::lock_guard<std::mutex> lock(_queue_mutex);
+            _overflowed.store(false, std::memory_order_relaxed);
+            overflow.swap(_queue);
+        }
+        while (!overflow.empty()) {
+            batch.push_back(overflow.front());
+            overflow.pop();
+        }
+    }
+    int64_t drained = (int64_t)(batch.size() - start);
+    return _pending.fetch_sub(drained, std::memory_order_acq_rel) - drained;
+}
+
+// Identifies the bridge and the Python object a driver callback, other than
+// the completion ones, has to hand over its messages to.
+//
+// Reference counted, its owner holds the first reference and each submitted
+// request one more until its callback returned, so the source outlives the
+// Python object when the requests in flight were abandoned.
+class BridgeSource {
+    public:
+        BridgeSource(PosixToPython* b, uint64_t t);
+        ~BridgeSource();
+        void retain();
+        void release();
+        PosixToPython* bridge;
+        uint64_t token;
+        bool coalesce_wakeups;
+        std::atomic<int64_t> _refs;
+};
+
+BridgeSource::BridgeSource(PosixToPython* b, uint64_t t) {
+    bridge = b;
+    bridge->retain();
+    token = t;
+    coalesce_wakeups = true;
+    _refs = 1;
+}
+
+BridgeSource::~BridgeSource() {
+    bridge->release();
+}
+
+void BridgeSource::retain() {
+    _refs.fetch_add(1, std::memory_order_relaxed);
+}
+
+void BridgeSource::release() {
+    if (_refs.fetch_sub(1, std::memory_order_acq_rel) == 1) {
+        delete this;
+    }
 }
 
 class CallbackContainer {
     public:
         CallbackContainer(PosixToPython* h, void* d);
-        ~CallbackContainer() = default;
+        ~CallbackContainer();
+        void materialize_future(CassFuture* cass_future);
         PosixToPython* handler;
         void* data;
+        bool coalesce_wakeups;
+        // When enabled the outcome of the future is read by the driver IO
+        // thread before waking up the event loop, the container is then
+        // owned and freed by the Python side.
+        bool materialize;
+        bool tracing_enabled;
+        CassError error_code;
+        std::string error_message;
+        const CassResult* result;
+        CassError tracing_error;
+        CassUuid tracing_id;
 };
 
 CallbackContainer::CallbackContainer(PosixToPython* h, void* d) {
     handler = h;
+    handler->retain();
     data = d;
+    coalesce_wakeups = true;
+    materialize = false;
+    tracing_enabled = false;
+    error_code = CASS_OK;
+    result = NULL;
+    tracing_error = CASS_OK;
+}
+
+CallbackContainer::~CallbackContainer() {
+    handler->release();
+}
+
+void CallbackContainer::materialize_future(CassFuture* cass_future) {
+    const char* message;
+    size_t message_length;
+    result = cass_future_get_result(cass_future);
+    if (result == NULL) {
+        error_code = cass_future_error_code(cass_future);
+        cass_future_error_message(cass_future, &message, &message_length);
+        error_message.assign(message, message_length);
+        return;
+    }
+    if (tracing_enabled) {
+        tracing_error = cass_future_tracing_id(cass_future, &tracing_id);
+    }
 }
 
 void posix_to_python_callback(CassFuture* cass_future, void* data){
     CallbackContainer* container = (CallbackContainer*)data;
-    {
-        std::lock_guard<std::mutex> lock(container->handler->_queue_mutex);
-        container->handler->_queue.push(container->data);
+    BridgeEntry entry = {BRIDGE_COMPLETION, 0, container->data, 0};
+    PosixToPython* handler = container->handler;
+    bool coalesce_wakeups = container->coalesce_wakeups;
+    // Keeps the handler alive past the container, which might be freed
+    // before the entry is pushed.
+    handler->retain();
+    if (container->materialize) {
+        // The container must not be touched once pushed, the event loop
+        // might be already freeing it.
+        container->materialize_future(cass_future);
+    } else {
+        delete container;
     }
-    write(container->handler->write_fd, "1", 1);
-    delete container;
+    entry.enqueued_ns = monotonic_ns();
+    handler->push(entry, coalesce_wakeups);
+    handler->release();
 }
 
 
-class PosixToPythonLogger {
-    public:
-        PosixToPythonLogger(int write_fd);
-        ~PosixToPythonLogger() = default;
-        int write_fd;
-        std::mutex _queue_mutex;
-        std::queue<std::shared_ptr<CassLogMessage>> _queue;
-};
-
-PosixToPythonLogger::PosixToPythonLogger(int fd) {
-    write_fd = fd;
-}
-
-std::shared_ptr<CassLogMessage> copy_log_message(const CassLogMessage* message) {
-    std::shared_ptr<CassLogMessage> message_copy = std::make_shared<CassLogMessage>();
+CassLogMessage* copy_log_message(const CassLogMessage* message) {
+    CassLogMessage* message_copy = new CassLogMessage();
     message_copy->time_ms = message->time_ms;
     message_copy->severity = message->severity;
     message_copy->line = message->line;
@@ -69,14 +281,16 @@ std::shared_ptr<CassLogMessage> copy_log_message(const CassLogMessage* message)
     return message_copy;
 }
 
+void free_log_message(CassLogMessage* message) {
+    free((void*)message->file);
+    free((void*)message->function);
+    delete message;
+}
+
 void posix_to_python_logger_callback(const CassLogMessage* message, void* data){
-    PosixToPythonLogger* handler = (PosixToPythonLogger*)data;
-    {
-        std::lock_guard<std::mutex> lock(handler->_queue_mutex);
-        std::shared_ptr<CassLogMessage> message_copy = copy_log_message(message);
-        handler->_queue.push(message_copy);
-    }
-    write(handler->write_fd, "1", 1);
+    BridgeSource* source = (BridgeSource*)data;
+    BridgeEntry entry = {BRIDGE_LOG_MESSAGE, source->token, copy_log_message(message), 0};
+    source->bridge->push(entry, true);
 }
 
 
@@ -85,28 +299,58 @@ typedef struct HostListenerMessage_ {
     char address[CASS_INET_STRING_LENGTH];
 } HostListenerMessage;
 
-class PosixToPythonHostListener {
-    public:
-        PosixToPythonHostListener(int write_fd);
-        ~PosixToPythonHostListener() = default;
-        int write_fd;
-        std::mutex _queue_mutex;
-        std::queue<std::shared_ptr<HostListenerMessage>> _queue;
-};
-
-PosixToPythonHostListener::PosixToPythonHostListener(int fd) {
-    write_fd = fd;
+void free_host_listener_message(HostListenerMessage* message) {
+    delete message;
 }
 
-
 void posix_to_python_host_listener_callback(CassHostListenerEvent event, const CassInet address, void* data){
-    PosixToPythonHostListener* handler = (PosixToPythonHostListener*)data;
-    std::shared_ptr<HostListenerMessage> message = std::make_shared<HostListenerMessage>();
+    BridgeSource* source = (BridgeSource*)data;
+    HostListenerMessage* message = new HostListenerMessage();
     message->event = event;
     cass_inet_string(address, message->address);
-    {
-        std::lock_guard<std::mutex> lock(handler->_queue_mutex);
-        handler->_queue.push(message);
+    BridgeEntry entry = {BRIDGE_HOST_EVENT, source->token, message, 0};
+    source->bridge->push(entry, true);
+}
+
+
+typedef struct SubmitError_ {
+    CassError error_code;
+    std::string error_message;
+} SubmitError;
+
+void free_submit_error(SubmitError* error) {
+    delete error;
+}
+
+// Callback of the requests whose result is discarded, only the error code is
+// read and nothing is allocated for the ones that succeeded. The future can
+// be freed by its owner right after setting the callback.
+void posix_to_python_submit_callback(CassFuture* cass_future, void* data){
+    BridgeSource* source = (BridgeSource*)data;
+    const char* message;
+    size_t message_length;
+    SubmitError* error = NULL;
+    CassError error_code = cass_future_error_code(cass_future);
+    if (error_code != CASS_OK) {
+        error = new SubmitError();
+        error->error_code = error_code;
+        cass_future_error_message(cass_future, &message, &message_length);
+        error->error_message.assign(message, message_length);
     }
-    write(handler->write_fd, "1", 1);
-}
\ No newline at end of file
+    BridgeEntry entry = {BRIDGE_SUBMIT_COMPLETION, source->token, error, monotonic_ns()};
+    source->bridge->push(entry, source->coalesce_wakeups);
+    // Reference taken when the callback was set.
+    source->release();
+}
+
+// A completion dropped here leaks its `CallbackWrapper` reference, it can't
+// be released without the GIL and its event loop is gone anyway.
+void drop_bridge_entry(const BridgeEntry& entry) {
+    if (entry.tag == BRIDGE_LOG_MESSAGE) {
+        free_log_message((CassLogMessage*)entry.data);
+    } else if (entry.tag == BRIDGE_HOST_EVENT) {
+        free_host_listener_message((HostListenerMessage*)entry.data);
+    } else if (entry.tag == BRIDGE_SUBMIT_COMPLETION && entry.data != NULL) {
+        free_submit_error((SubmitError*)entry.data);
+    }
+}
@@ -1,4 +1,5 @@
-from libcpp.memory cimport shared_ptr
+from libcpp.string cimport string
+from libcpp.vector cimport vector
 
 cdef extern from "Python.h":
     void Py_INCREF(object o)
@@ -20,34 +21,84 @@ cdef extern from "<mutex>" namespace "std" nogil:
         void lock()
         void unlock()
 
+cdef extern from "<atomic>" namespace "std" nogil:
+    cdef cppclass atomic[T]:
+        atomic()
+        T load()
+
+cdef extern from "histogram.cpp" nogil:
+    cdef cppclass Log2Histogram:
+        Log2Histogram()
+        void record(uint64_t value)
+        uint64_t percentile(double percentile)
+        uint64_t count
+        uint64_t sum
+        uint64_t min
+        uint64_t max
+        uint64_t* buckets
+
+    cdef int LOG2_HISTOGRAM_BUCKETS
+    uint64_t log2_histogram_bucket_upper_bound(int bucket)
+    uint64_t monotonic_ns()
+
 cdef extern from "posix_to_python_thread.cpp" nogil:
+    cdef enum BridgeEntryTag:
+        BRIDGE_COMPLETION
+        BRIDGE_LOG_MESSAGE
+        BRIDGE_HOST_EVENT
+        BRIDGE_SUBMIT_COMPLETION
+
+    ctypedef struct BridgeEntry:
+        BridgeEntryTag tag
+        uint64_t token
+        void* data
+        uint64_t enqueued_ns
+
     cdef cppclass PosixToPython:
         PosixToPython(int write_fd)
+        int64_t drain(vector[BridgeEntry]& batch)
+        void close()
+        void release()
         int write_fd
-        mutex _queue_mutex
-        queue[void *] _queue
+        atomic[uint64_t] wakeups
+        atomic[uint64_t] completions
+        atomic[uint64_t] overflows
+
+    cdef cppclass BridgeSource:
+        BridgeSource(PosixToPython* bridge, uint64_t token)
+        void retain()
+        void release()
+        uint64_t token
+        bint coalesce_wakeups
 
     cdef cppclass CallbackContainer:
         CallbackContainer(PosixToPython* handler, void* data)
+        bint coalesce_wakeups
+        bint materialize
+        bint tracing_enabled
+        CassError error_code
+        string error_message
+        const CassResult* result
+        CassError tracing_error
+        CassUuid tracing_id
 
     void posix_to_python_callback(CassFuture* cass_future, void* data)
 
-    cdef cppclass PosixToPythonLogger:
-        PosixToPythonLogger(int write_fd)
-        int write_fd
-        mutex _queue_mutex
-        queue[shared_ptr[CassLogMessage]] _queue
-
+    void free_log_message(CassLogMessage* message)
     void posix_to_python_logger_callback(const CassLogMessage* message, void* data)
 
     ctypedef struct HostListenerMessage:
         CassHostListenerEvent event
         char address[CASS_INET_STRING_LENGTH]
 
-    cdef cppclass PosixToPythonHostListener:
-        PosixToPythonHostListener(int write_fd)
-        int write_fd
-        mutex _queue_mutex
-        queue[shared_ptr[HostListenerMessage]] _queue
+    void free_host_listener_message(HostListenerMessage* message)
 
     void posix_to_python_host_listener_callback(CassHostListenerEvent event, const CassInet address, void* data)
+
+    ctypedef struct SubmitError:
+        CassError error_code
+        string error_message
+
+    void free_submit_error(SubmitError* error)
+
+    void posix_to_python_submit_callback(CassFuture* cass_future, void* data)
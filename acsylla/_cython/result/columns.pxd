@@ -0,0 +1,21 @@
+# Kinds of the columns that are stored into fixed width buffers, the rest
+# of them are stored as Python objects.
+cdef enum ColumnKind:
+    COLUMN_OBJECT = 0
+    COLUMN_INT8 = 1
+    COLUMN_INT16 = 2
+    COLUMN_INT32 = 3
+    COLUMN_INT64 = 4
+    COLUMN_FLOAT = 5
+    COLUMN_DOUBLE = 6
+    COLUMN_BOOL = 7
+    COLUMN_TIMESTAMP = 8
+    # 16 bytes in network order, only used by the NumPy and Arrow exports.
+    COLUMN_UUID = 9
+
+cdef ColumnKind column_kind(CassValueType cass_type)
+cdef int fill_columns(Result result, vector[int]& kinds, vector[char*]& buffers, vector[Py_ssize_t]& strides, vector[uint8_t*]& masks, list objects, bint arrow_values=*) except -1
+cdef object result_to_columns(Result result, bint null_masks)
+cdef object result_to_numpy(Result result)
+cdef object result_to_numpy_structured(Result result)
+cdef object result_to_arrow(Result result)
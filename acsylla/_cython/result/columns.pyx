@@ -0,0 +1,508 @@
+from cpython cimport array
+from libc.stdint cimport uintptr_t
+
+import array
+
+
+# Typecodes of the `array.array` used per fixed width column kind.
+cdef dict COLUMN_TYPECODES = {
+    COLUMN_INT8: 'b',
+    COLUMN_INT16: 'h',
+    COLUMN_INT32: 'i',
+    COLUMN_INT64: 'q',
+    COLUMN_FLOAT: 'f',
+    COLUMN_DOUBLE: 'd',
+    COLUMN_BOOL: 'B',
+    COLUMN_TIMESTAMP: 'q',
+}
+
+
+cdef ColumnKind column_kind(CassValueType cass_type):
+    if cass_type == CASS_VALUE_TYPE_TINY_INT:
+        return COLUMN_INT8
+    elif cass_type == CASS_VALUE_TYPE_SMALL_INT:
+        return COLUMN_INT16
+    elif cass_type == CASS_VALUE_TYPE_INT:
+        return COLUMN_INT32
+    elif cass_type in (CASS_VALUE_TYPE_BIGINT, CASS_VALUE_TYPE_COUNTER):
+        return COLUMN_INT64
+    elif cass_type == CASS_VALUE_TYPE_FLOAT:
+        return COLUMN_FLOAT
+    elif cass_type == CASS_VALUE_TYPE_DOUBLE:
+        return COLUMN_DOUBLE
+    elif cass_type == CASS_VALUE_TYPE_BOOLEAN:
+        return COLUMN_BOOL
+    elif cass_type == CASS_VALUE_TYPE_TIMESTAMP:
+        return COLUMN_TIMESTAMP
+    return COLUMN_OBJECT
+
+
+cdef inline CassError _store_fixed(const CassValue* cass_value, int kind, char* target) noexcept:
+    """ Writes the value of a fixed width column at `target`, timestamps
+    are kept as milliseconds since the epoch.
+    """
+    cdef cass_bool_t boolean
+    cdef CassUuid uuid
+    cdef CassError error
+
+    if kind == COLUMN_INT8:
+        return cass_value_get_int8(cass_value, <cass_int8_t*> target)
+    elif kind == COLUMN_INT16:
+        return cass_value_get_int16(cass_value, <cass_int16_t*> target)
+    elif kind == COLUMN_INT32:
+        return cass_value_get_int32(cass_value, <cass_int32_t*> target)
+    elif kind == COLUMN_INT64 or kind == COLUMN_TIMESTAMP:
+        return cass_value_get_int64(cass_value, <cass_int64_t*> target)
+    elif kind == COLUMN_FLOAT:
+        return cass_value_get_float(cass_value, <cass_float_t*> target)
+    elif kind == COLUMN_DOUBLE:
+        return cass_value_get_double(cass_value, <cass_double_t*> target)
+    elif kind == COLUMN_BOOL:
+        error = cass_value_get_bool(cass_value, &boolean)
+        (<uint8_t*> target)[0] = boolean == cass_true
+        return error
+    elif kind == COLUMN_UUID:
+        error = cass_value_get_uuid(cass_value, &uuid)
+        uuid_to_bytes(uuid, target)
+        return error
+    return CASS_ERROR_LIB_INVALID_VALUE_TYPE
+
+
+cdef int fill_columns(Result result, vector[int]& kinds, vector[char*]& buffers, vector[Py_ssize_t]& strides, vector[uint8_t*]& masks, list objects, bint arrow_values=False) except -1:
+    """ Walks the rows of the result once storing the values column by
+    column.
+
+    Columns with a fixed width kind are written into their buffer, moving
+    `strides` bytes per row, zero is left for the null values. Columns of
+    `COLUMN_OBJECT` kind are set into their sequence of `objects`, as
+    returned by `_arrow_value` when `arrow_values` is enabled. Masks, when
+    not NULL, get a 1 for the null values.
+    """
+    cdef CassIterator* cass_iterator
+    cdef const CassRow* cass_row
+    cdef const CassValue* cass_value
+    cdef CassError error
+    cdef size_t column_count = kinds.size()
+    cdef size_t row = 0
+    cdef size_t column
+
+    result.describe()
+    cass_iterator = cass_iterator_from_result(result.cass_result)
+    try:
+        while cass_iterator_next(cass_iterator) == cass_true:
+            cass_row = cass_iterator_get_row(cass_iterator)
+            for column in range(column_count):
+                cass_value = cass_row_get_column(cass_row, column)
+                if cass_value == NULL:
+                    raise ColumnNotFound(f'ColumnNotFound with index {column}')
+                if cass_value_is_null(cass_value):
+                    if masks[column] != NULL:
+                        masks[column][row] = 1
+                    continue
+                if kinds[column] == COLUMN_OBJECT:
+                    if arrow_values:
+                        objects[column][row] = _arrow_value(<ValueDecoder>result.column_plans[column], cass_value)
+                    else:
+                        objects[column][row] = (<ValueDecoder>result.column_plans[column]).decode(cass_value, result.native_types)
+                    continue
+                error = _store_fixed(cass_value, kinds[column], buffers[column] + row * strides[column])
+                if error != CASS_OK:
+                    raise_if_error(error)
+            row += 1
+    finally:
+        cass_iterator_free(cass_iterator)
+    return 0
+
+
+cdef object result_to_columns(Result result, bint null_masks):
+    cdef size_t row_count = cass_result_row_count(result.cass_result)
+    cdef size_t column_count = cass_result_column_count(result.cass_result)
+    cdef vector[int] kinds
+    cdef vector[char*] buffers
+    cdef vector[Py_ssize_t] strides
+    cdef vector[uint8_t*] masks
+    cdef array.array values
+    cdef array.array mask
+    cdef list objects = []
+    cdef dict columns = {}
+    cdef dict columns_masks = {}
+    cdef size_t column
+
+    names = result.columns_names()
+    for column in range(column_count):
+        kind = column_kind(cass_result_column_type(result.cass_result, column))
+        kinds.push_back(kind)
+        if kind == COLUMN_OBJECT:
+            objects.append([None] * row_count)
+            columns[names[column]] = objects[column]
+            buffers.push_back(NULL)
+            strides.push_back(0)
+        else:
+            objects.append(None)
+            values = array.clone(array.array(COLUMN_TYPECODES[kind]), row_count, zero=True)
+            columns[names[column]] = values
+            buffers.push_back(values.data.as_chars)
+            strides.push_back(values.itemsize)
+        if null_masks:
+            mask = array.clone(array.array('B'), row_count, zero=True)
+            columns_masks[names[column]] = mask
+            masks.push_back(<uint8_t*> mask.data.as_uchars)
+        else:
+            masks.push_back(NULL)
+
+    fill_columns(result, kinds, buffers, strides, masks, objects)
+
+    if null_masks:
+        return columns, columns_masks
+    return columns
+
+
+# NumPy dtypes used per column kind, the rest of the columns are stored
+# into object arrays.
+cdef dict NUMPY_DTYPES = {
+    COLUMN_INT8: 'int8',
+    COLUMN_INT16: 'int16',
+    COLUMN_INT32: 'int32',
+    COLUMN_INT64: 'int64',
+    COLUMN_FLOAT: 'float32',
+    COLUMN_DOUBLE: 'float64',
+    COLUMN_BOOL: 'bool',
+    COLUMN_TIMESTAMP: 'datetime64[ms]',
+    COLUMN_UUID: 'V16',
+}
+
+
+cdef object _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy is required for exporting results to NumPy, install it with `pip install acsylla[numpy]`")
+    return numpy
+
+
+cdef inline char* _numpy_data(object ndarray):
+    return <char*> <uintptr_t> ndarray.__array_interface__['data'][0]
+
+
+cdef list _export_kinds(Result result):
+    cdef CassValueType cass_type
+    cdef list kinds = []
+
+    for column in range(cass_result_column_count(result.cass_result)):
+        cass_type = cass_result_column_type(result.cass_result, column)
+        if cass_type in (CASS_VALUE_TYPE_UUID, CASS_VALUE_TYPE_TIMEUUID):
+            kinds.append(COLUMN_UUID)
+        else:
+            kinds.append(column_kind(cass_type))
+    return kinds
+
+
+cdef object result_to_numpy(Result result):
+    cdef size_t row_count = cass_result_row_count(result.cass_result)
+    cdef vector[int] kinds
+    cdef vector[char*] buffers
+    cdef vector[Py_ssize_t] strides
+    cdef vector[uint8_t*] masks
+    cdef list objects = []
+    cdef dict columns = {}
+    cdef dict columns_masks = {}
+
+    numpy = _import_numpy()
+    names = result.columns_names()
+    for column, kind in enumerate(_export_kinds(result)):
+        kinds.push_back(kind)
+        if kind == COLUMN_OBJECT:
+            values = numpy.empty(row_count, dtype=object)
+            objects.append(values)
+            buffers.push_back(NULL)
+            strides.push_back(0)
+        else:
+            values = numpy.zeros(row_count, dtype=NUMPY_DTYPES[kind])
+            objects.append(None)
+            buffers.push_back(_numpy_data(values))
+            strides.push_back(values.itemsize)
+        columns[names[column]] = values
+        mask = numpy.zeros(row_count, dtype='bool')
+        columns_masks[names[column]] = mask
+        masks.push_back(<uint8_t*> _numpy_data(mask))
+
+    fill_columns(result, kinds, buffers, strides, masks, objects)
+    return columns, columns_masks
+
+
+cdef object result_to_numpy_structured(Result result):
+    cdef size_t row_count = cass_result_row_count(result.cass_result)
+    cdef vector[int] kinds
+    cdef vector[char*] buffers
+    cdef vector[Py_ssize_t] strides
+    cdef vector[uint8_t*] masks
+    cdef list objects = []
+    cdef list columns_masks = []
+    cdef char* data
+
+    numpy = _import_numpy()
+    names = result.columns_names()
+    numpy_kinds = _export_kinds(result)
+    values = numpy.zeros(
+        row_count,
+        dtype=[(name, NUMPY_DTYPES.get(kind, object)) for name, kind in zip(names, numpy_kinds)]
+    )
+    data = _numpy_data(values)
+
+    for column, kind in enumerate(numpy_kinds):
+        kinds.push_back(kind)
+        if kind == COLUMN_OBJECT:
+            # Fields of object type are written through the field view,
+            # null values are left as None rather than the zero filling.
+            values[names[column]] = None
+            objects.append(values[names[column]])
+            buffers.push_back(NULL)
+        else:
+            objects.append(None)
+            buffers.push_back(data + <Py_ssize_t> values.dtype.fields[names[column]][1])
+        strides.push_back(values.itemsize)
+        # Masks are filled contiguous and copied into their field later.
+        column_mask = numpy.zeros(row_count, dtype='bool')
+        columns_masks.append(column_mask)
+        masks.push_back(<uint8_t*> _numpy_data(column_mask))
+
+    fill_columns(result, kinds, buffers, strides, masks, objects)
+
+    mask = numpy.zeros(row_count, dtype=[(name, 'bool') for name in names])
+    for name, column_mask in zip(names, columns_masks):
+        mask[name] = column_mask
+    return values, mask
+
+
+cdef object _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("PyArrow is required for exporting results to Arrow, install it with `pip install acsylla[arrow]`")
+    return pyarrow
+
+
+cdef object _arrow_type(object pyarrow, ValueDecoder plan):
+    """ Returns the Arrow type of the values of a plan, it only depends on
+    the CQL type so the batches of all of the pages share their schema.
+
+    Decimals and varints are kept exact as strings, the elements of tuples
+    are named `f0`, `f1`... Collections whose element types are unknown
+    are typed as null.
+    """
+    cdef CassValueType cass_type = plan.cass_type
+
+    if cass_type == CASS_VALUE_TYPE_TINY_INT:
+        return pyarrow.int8()
+    elif cass_type == CASS_VALUE_TYPE_SMALL_INT:
+        return pyarrow.int16()
+    elif cass_type == CASS_VALUE_TYPE_INT:
+        return pyarrow.int32()
+    elif cass_type in (CASS_VALUE_TYPE_BIGINT, CASS_VALUE_TYPE_COUNTER):
+        return pyarrow.int64()
+    elif cass_type == CASS_VALUE_TYPE_FLOAT:
+        return pyarrow.float32()
+    elif cass_type == CASS_VALUE_TYPE_DOUBLE:
+        return pyarrow.float64()
+    elif cass_type == CASS_VALUE_TYPE_BOOLEAN:
+        return pyarrow.bool_()
+    elif cass_type == CASS_VALUE_TYPE_TIMESTAMP:
+        return pyarrow.timestamp('ms')
+    elif cass_type == CASS_VALUE_TYPE_DATE:
+        return pyarrow.date32()
+    elif cass_type == CASS_VALUE_TYPE_TIME:
+        return pyarrow.time64('ns')
+    elif cass_type == CASS_VALUE_TYPE_DURATION:
+        return pyarrow.month_day_nano_interval()
+    elif cass_type in (CASS_VALUE_TYPE_UUID, CASS_VALUE_TYPE_TIMEUUID):
+        return pyarrow.binary(16)
+    elif cass_type in (CASS_VALUE_TYPE_ASCII,
+                       CASS_VALUE_TYPE_TEXT,
+                       CASS_VALUE_TYPE_VARCHAR,
+                       CASS_VALUE_TYPE_INET,
+                       CASS_VALUE_TYPE_DECIMAL,
+                       CASS_VALUE_TYPE_VARINT):
+        return pyarrow.string()
+    elif cass_type in (CASS_VALUE_TYPE_LIST,
+                       CASS_VALUE_TYPE_SET,
+                       CASS_VALUE_TYPE_MAP,
+                       CASS_VALUE_TYPE_TUPLE,
+                       CASS_VALUE_TYPE_UDT):
+        if plan.children is None:
+            return pyarrow.null()
+        children = [_arrow_type(pyarrow, child) for child in plan.children]
+        if cass_type == CASS_VALUE_TYPE_MAP:
+            return pyarrow.map_(children[0], children[1])
+        elif cass_type == CASS_VALUE_TYPE_TUPLE:
+            return pyarrow.struct([(f'f{index}', child) for index, child in enumerate(children)])
+        elif cass_type == CASS_VALUE_TYPE_UDT:
+            return pyarrow.struct(list(zip(plan.field_names, children)))
+        return pyarrow.list_(children[0])
+    elif cass_type == CASS_VALUE_TYPE_UNKNOWN:
+        return pyarrow.null()
+    return pyarrow.binary()
+
+
+cdef object _arrow_value(ValueDecoder plan, const CassValue* cass_value):
+    """ Returns a value as expected by its `_arrow_type`, regardless of the
+    native types and decode options of the result.
+    """
+    cdef CassValueType cass_type = plan.cass_type
+    cdef CassIterator* iterator
+    cdef cass_uint32_t days
+    cdef cass_int64_t nanos
+    cdef size_t index = 0
+    cdef size_t count
+
+    if cass_value_is_null(cass_value):
+        return None
+
+    if cass_type in (CASS_VALUE_TYPE_UUID, CASS_VALUE_TYPE_TIMEUUID):
+        return _uuid_bytes(cass_value, 0)
+    elif cass_type == CASS_VALUE_TYPE_TIMESTAMP:
+        return _timestamp_epoch_ms(cass_value, 0)
+    elif cass_type == CASS_VALUE_TYPE_DATE:
+        raise_if_error(cass_value_get_uint32(cass_value, &days))
+        # Days since the epoch are stored centered at 2^31.
+        return <int64_t> days - 2147483648
+    elif cass_type == CASS_VALUE_TYPE_TIME:
+        raise_if_error(cass_value_get_int64(cass_value, &nanos))
+        return nanos
+    elif cass_type == CASS_VALUE_TYPE_DURATION:
+        return _duration(cass_value, 1)
+    elif cass_type == CASS_VALUE_TYPE_DECIMAL:
+        return _decimal(cass_value, 1)
+    elif cass_type == CASS_VALUE_TYPE_VARINT:
+        return str(_varint(cass_value, 0))
+    elif cass_type not in (CASS_VALUE_TYPE_LIST,
+                           CASS_VALUE_TYPE_SET,
+                           CASS_VALUE_TYPE_MAP,
+                           CASS_VALUE_TYPE_TUPLE,
+                           CASS_VALUE_TYPE_UDT):
+        return plan.decode(cass_value, 0)
+
+    if plan.children is None:
+        return None
+    count = len(plan.children)
+
+    if cass_type == CASS_VALUE_TYPE_MAP:
+        iterator = cass_iterator_from_map(cass_value)
+    elif cass_type == CASS_VALUE_TYPE_TUPLE:
+        iterator = cass_iterator_from_tuple(cass_value)
+    elif cass_type == CASS_VALUE_TYPE_UDT:
+        iterator = cass_iterator_fields_from_user_type(cass_value)
+    else:
+        iterator = cass_iterator_from_collection(cass_value)
+    if iterator == NULL:
+        return None
+
+    try:
+        if cass_type == CASS_VALUE_TYPE_MAP:
+            data = []
+            while cass_iterator_next(iterator) == cass_true:
+                data.append((
+                    _arrow_value(<ValueDecoder>plan.children[0], cass_iterator_get_map_key(iterator)),
+                    _arrow_value(<ValueDecoder>plan.children[1], cass_iterator_get_map_value(iterator)),
+                ))
+        elif cass_type == CASS_VALUE_TYPE_TUPLE:
+            data = {}
+            while cass_iterator_next(iterator) == cass_true and index < count:
+                data[f'f{index}'] = _arrow_value(<ValueDecoder>plan.children[index], cass_iterator_get_value(iterator))
+                index += 1
+        elif cass_type == CASS_VALUE_TYPE_UDT:
+            data = {}
+            while cass_iterator_next(iterator) == cass_true and index < count:
+                data[plan.field_names[index]] = _arrow_value(
+                    <ValueDecoder>plan.children[index], cass_iterator_get_user_type_field_value(iterator)
+                )
+                index += 1
+        else:
+            data = []
+            while cass_iterator_next(iterator) == cass_true:
+                data.append(_arrow_value(<ValueDecoder>plan.children[0], cass_iterator_get_value(iterator)))
+    finally:
+        cass_iterator_free(iterator)
+    return data
+
+
+cdef bytearray _pack_bits(const uint8_t* flags, size_t row_count, bint invert):
+    """ Packs one byte per row flags into an Arrow bitmap, least
+    significant bit first.
+    """
+    cdef bytearray bitmap = bytearray((row_count + 7) // 8)
+    cdef unsigned char* bits = bitmap
+    cdef size_t row
+
+    for row in range(row_count):
+        if (flags[row] != 0) != invert:
+            bits[row >> 3] |= 1 << (row & 7)
+    return bitmap
+
+
+cdef object _arrow_array(object pyarrow, object arrow_type, ColumnKind kind, object values, array.array mask, size_t row_count):
+    cdef const uint8_t* null_flags = <const uint8_t*> mask.data.as_uchars
+    cdef size_t null_count = 0
+    cdef size_t row
+
+    if kind == COLUMN_OBJECT:
+        return pyarrow.array(values, type=arrow_type)
+
+    for row in range(row_count):
+        null_count += null_flags[row]
+
+    validity = None
+    if null_count > 0:
+        validity = pyarrow.py_buffer(_pack_bits(null_flags, row_count, True))
+
+    if kind == COLUMN_BOOL:
+        data = pyarrow.py_buffer(_pack_bits(<const uint8_t*> (<array.array> values).data.as_uchars, row_count, False))
+    else:
+        # The array keeps the `array.array` alive, values are not copied.
+        data = pyarrow.py_buffer(values)
+
+    return pyarrow.Array.from_buffers(arrow_type, row_count, [validity, data], null_count=null_count)
+
+
+cdef object result_to_arrow(Result result):
+    cdef size_t row_count = cass_result_row_count(result.cass_result)
+    cdef vector[int] kinds
+    cdef vector[char*] buffers
+    cdef vector[Py_ssize_t] strides
+    cdef vector[uint8_t*] masks
+    cdef array.array values
+    cdef array.array mask
+    cdef list objects = []
+    cdef list columns = []
+    cdef list columns_masks = []
+    cdef list arrays = []
+
+    pyarrow = _import_pyarrow()
+    names = result.columns_names()
+    arrow_kinds = _export_kinds(result)
+    for column, kind in enumerate(arrow_kinds):
+        kinds.push_back(kind)
+        if kind == COLUMN_OBJECT:
+            objects.append([None] * row_count)
+            columns.append(objects[column])
+            buffers.push_back(NULL)
+            strides.push_back(0)
+        else:
+            objects.append(None)
+            if kind == COLUMN_UUID:
+                values = array.clone(array.array('B'), row_count * 16, zero=True)
+                strides.push_back(16)
+            else:
+                values = array.clone(array.array(COLUMN_TYPECODES[kind]), row_count, zero=True)
+                strides.push_back(values.itemsize)
+            columns.append(values)
+            buffers.push_back(values.data.as_chars)
+        mask = array.clone(array.array('B'), row_count, zero=True)
+        columns_masks.append(mask)
+        masks.push_back(<uint8_t*> mask.data.as_uchars)
+
+    fill_columns(result, kinds, buffers, strides, masks, objects, True)
+
+    for column, kind in enumerate(arrow_kinds):
+        arrow_type = _arrow_type(pyarrow, <ValueDecoder>result.column_plans[column])
+        arrays.append(_arrow_array(pyarrow, arrow_type, kind, columns[column], columns_masks[column], row_count))
+    return pyarrow.RecordBatch.from_arrays(arrays, names=names)
@@ -1,14 +1,55 @@
 from libcpp.vector cimport vector
 
 
+# Kinds of objects built per row when iterating a result.
+cdef enum RowFactoryKind:
+    ROW_FACTORY_ROW = 0
+    ROW_FACTORY_TUPLE = 1
+    ROW_FACTORY_DICT = 2
+    ROW_FACTORY_NAMED_TUPLE = 3
+    ROW_FACTORY_CALLABLE = 4
+
+
+cdef int row_factory_kind(object row_factory) except -1
+
+
 cdef class Result:
     cdef:
         const CassResult* cass_result
         public object tracing_id
         public int8_t native_types
         vector[CassIterator*] iterator_refs
+        # Column descriptor, built once per result on first use.
+        tuple column_names
+        dict column_indexes
+        vector[CassValueType] column_types
+        list column_plans
+        object row_factory
+        int row_factory_kind
+        object row_class
+        object decode_options
+        # Cursor shared by `fetchmany` and `fetchall`.
+        CassIterator* fetch_iterator
+        size_t fetch_position
 
     @staticmethod
     cdef Result new_(const CassResult* cass_result, int8_t native_types)
 
+    cdef int describe(self) except -1
+    cdef int set_row_factory(self, object row_factory) except -1
+    cdef object decode_column(self, size_t index, const CassValue* cass_value)
+    cdef object value_view(self, const CassValue* cass_value)
+    cdef tuple row_values(self, const CassRow* cass_row)
+    cdef object make_row(self, const CassRow* cass_row)
+    cdef object build_row(self, int kind, object row_factory, const CassRow* cass_row)
+    cdef list fetch(self, size_t size, object row_factory)
+    cpdef size_t payload_size(self)
+
     
+
+
+cdef class ResultBuffer:
+    cdef:
+        Result result
+        const cass_byte_t* data
+        Py_ssize_t length
@@ -1,9 +1,47 @@
+from cpython.buffer cimport PyBuffer_FillInfo
+from cpython.list cimport PyList_New
+from cpython.list cimport PyList_SET_ITEM
+from cpython.memoryview cimport PyMemoryView_FromObject
+from cpython.ref cimport Py_INCREF
+from cpython.tuple cimport PyTuple_New
+from cpython.tuple cimport PyTuple_SET_ITEM
+
+from collections import namedtuple
+from enum import Enum
+from sys import intern
+
+# Named tuple classes built for the `NAMED_TUPLE` row factory, by columns
+# names, shared by all of the results selecting the same columns.
+_row_classes = {}
+
+
+cdef int row_factory_kind(object row_factory) except -1:
+    """ Returns the kind of the `row_factory`, raises a `TypeError` when it
+    is not supported."""
+    if row_factory is None:
+        return ROW_FACTORY_ROW
+    if row_factory is tuple:
+        return ROW_FACTORY_TUPLE
+    if row_factory is dict:
+        return ROW_FACTORY_DICT
+    if isinstance(row_factory, Enum):
+        row_factory = row_factory.value
+        if row_factory in (ROW_FACTORY_ROW, ROW_FACTORY_TUPLE, ROW_FACTORY_DICT, ROW_FACTORY_NAMED_TUPLE):
+            return row_factory
+    elif callable(row_factory):
+        return ROW_FACTORY_CALLABLE
+    raise TypeError(f"Row factory not supported {row_factory!r}")
+
+
 cdef class Result:
 
     def __cinit__(self):
         self.cass_result = NULL
+        self.fetch_iterator = NULL
 
     def __dealloc__(self):
+        if self.fetch_iterator != NULL:
+            cass_iterator_free(self.fetch_iterator)
         cass_result_free(self.cass_result)
         for i in range(self.iterator_refs.size()):
             cass_iterator = self.iterator_refs[i]
@@ -20,6 +58,183 @@ cdef class Result:
         result.native_types = native_types
         return result
 
+    cdef int describe(self) except -1:
+        """ Builds the column descriptor of the result, the interned column
+        names, the index of each name and the type and the decoding plan of
+        each column. Does nothing once built."""
+        cdef size_t count
+        cdef size_t index
+        cdef size_t length = 0
+        cdef char* name = NULL
+        cdef CassError error
+        cdef CassValueType cass_type
+        cdef ValueDecoder plan
+        cdef DecodeFlags flags
+        cdef bint zero_copy
+        cdef size_t cache_size = 0
+
+        if self.column_names is not None:
+            return 0
+
+        decode_flags(self.decode_options, &flags)
+        zero_copy = self.decode_options is not None and self.decode_options.zero_copy
+        intern_columns = ()
+        if self.decode_options is not None and self.decode_options.intern_columns:
+            intern_columns = frozenset(self.decode_options.intern_columns)
+            cache_size = self.decode_options.intern_cache_size
+
+        count = cass_result_column_count(self.cass_result)
+        names = []
+        indexes = {}
+        plans = []
+        self.column_types.clear()
+        for index in range(count):
+            error = cass_result_column_name(self.cass_result, index, <const char**> &name, <size_t*> &length)
+            raise_if_error(error)
+            column_name = intern(name[:length].decode())
+            names.append(column_name)
+            # Same than the lookups by name of the driver, the first column
+            # wins when a name is selected more than once.
+            indexes.setdefault(column_name, index)
+            cass_type = cass_result_column_type(self.cass_result, index)
+            self.column_types.push_back(cass_type)
+            plan = ValueDecoder.from_data_type(cass_result_column_data_type(self.cass_result, index), &flags)
+            if column_name in intern_columns and cass_type in (CASS_VALUE_TYPE_ASCII,
+                                                               CASS_VALUE_TYPE_TEXT,
+                                                               CASS_VALUE_TYPE_VARCHAR):
+                plan.text_cache = TextCache.new_(cache_size)
+            else:
+                plan.zero_copy = zero_copy and cass_type in (CASS_VALUE_TYPE_BLOB,
+                                                             CASS_VALUE_TYPE_ASCII,
+                                                             CASS_VALUE_TYPE_TEXT,
+                                                             CASS_VALUE_TYPE_VARCHAR)
+            plans.append(plan)
+        self.column_plans = plans
+        self.column_indexes = indexes
+        self.column_names = tuple(names)
+        return 0
+
+    cdef int set_row_factory(self, object row_factory) except -1:
+        self.row_factory_kind = row_factory_kind(row_factory)
+        self.row_factory = row_factory
+        return 0
+
+    cdef object decode_column(self, size_t index, const CassValue* cass_value):
+        """ Returns the value of the column `index` of a row."""
+        cdef ValueDecoder plan = <ValueDecoder>self.column_plans[index]
+
+        if plan.zero_copy:
+            return self.value_view(cass_value)
+        return plan.decode(cass_value, self.native_types)
+
+    cdef object value_view(self, const CassValue* cass_value):
+        """ Returns a read only `memoryview` of the bytes of the value,
+        backed by the buffer of the result."""
+        cdef const cass_byte_t* output = NULL
+        cdef size_t length = 0
+        cdef CassError error
+        cdef ResultBuffer buffer
+
+        error = cass_value_get_bytes(cass_value, &output, &length)
+        if error == CASS_ERROR_LIB_NULL_VALUE:
+            return None
+        raise_if_error(error)
+
+        buffer = ResultBuffer.__new__(ResultBuffer)
+        buffer.result = self
+        buffer.data = output
+        buffer.length = length
+        return PyMemoryView_FromObject(buffer)
+
+    cdef tuple row_values(self, const CassRow* cass_row):
+        """ Returns the values of the row, decoded with the plans of the
+        columns."""
+        cdef size_t index
+        cdef size_t count
+        cdef const CassValue* cass_value
+        cdef tuple values
+
+        self.describe()
+        count = len(self.column_plans)
+        values = PyTuple_New(count)
+        for index in range(count):
+            cass_value = cass_row_get_column(cass_row, index)
+            if cass_value == NULL:
+                raise ColumnNotFound(f'ColumnNotFound with index {index}')
+            value = self.decode_column(index, cass_value)
+            Py_INCREF(value)
+            PyTuple_SET_ITEM(values, index, value)
+        return values
+
+    cdef object make_row(self, const CassRow* cass_row):
+        """ Returns the object built by the row factory for the row."""
+        return self.build_row(self.row_factory_kind, self.row_factory, cass_row)
+
+    cdef object build_row(self, int kind, object row_factory, const CassRow* cass_row):
+        """ Returns the object built by a row factory of the `kind` for the
+        row."""
+        cdef size_t index
+        cdef tuple values
+        cdef dict data
+
+        if kind == ROW_FACTORY_ROW:
+            return Row.new_(cass_row, self)
+
+        values = self.row_values(cass_row)
+        if kind == ROW_FACTORY_TUPLE:
+            return values
+        if kind == ROW_FACTORY_NAMED_TUPLE:
+            if self.row_class is None:
+                self.row_class = _row_classes.get(self.column_names)
+                if self.row_class is None:
+                    self.row_class = namedtuple("Row", self.column_names, rename=True)
+                    _row_classes[self.column_names] = self.row_class
+            return tuple.__new__(self.row_class, values)
+
+        data = {}
+        for index in range(len(values)):
+            data[self.column_names[index]] = values[index]
+        if kind == ROW_FACTORY_DICT:
+            return data
+        return row_factory(**data)
+
+    cdef list fetch(self, size_t size, object row_factory):
+        """ Returns a list with up to `size` of the rows not fetched yet,
+        built in a single loop."""
+        cdef int kind
+        cdef size_t index
+        cdef size_t remaining
+        cdef list rows
+
+        if row_factory is None:
+            # `Row` objects are views of the row being iterated, they can
+            # not outlive the next step.
+            kind = self.row_factory_kind
+            row_factory = self.row_factory
+            if kind == ROW_FACTORY_ROW:
+                kind = ROW_FACTORY_TUPLE
+        else:
+            kind = row_factory_kind(row_factory)
+            if kind == ROW_FACTORY_ROW:
+                raise ValueError("Rows can not be fetched as Row objects, use another row factory")
+
+        if self.fetch_iterator == NULL:
+            self.fetch_iterator = cass_iterator_from_result(self.cass_result)
+        remaining = cass_result_row_count(self.cass_result) - self.fetch_position
+        if size > remaining:
+            size = remaining
+
+        rows = PyList_New(size)
+        for index in range(size):
+            if cass_iterator_next(self.fetch_iterator) != cass_true:
+                del rows[index:]
+                break
+            self.fetch_position += 1
+            row = self.build_row(kind, row_factory, cass_iterator_get_row(self.fetch_iterator))
+            Py_INCREF(row)
+            PyList_SET_ITEM(rows, index, row)
+        return rows
+
     def has_more_pages(self):
         """ Returns true if there is still pages to be fetched"""
         cdef cass_bool_t more_pages
@@ -69,17 +284,12 @@ cdef class Result:
 
     def columns(self):
         """ Returns the columns names"""
-        cdef size_t length = 0
-        cdef char* name = NULL
-        cdef CassError error
-        columns = []
-        for i in range(self.column_count()):
-            error = cass_result_column_name(self.cass_result, i, <const char**> &name, <size_t*> &length)
-            raise_if_error(error)
-            yield name[:length].decode()
+        self.describe()
+        return iter(self.column_names)
 
     def columns_names(self):
-        return list(self.columns())
+        self.describe()
+        return list(self.column_names)
 
     def first(self):
         """ Return the first result, if there is no row
@@ -91,7 +301,7 @@ cdef class Result:
         if cass_row == NULL:
             return None
 
-        return Row.new_(cass_row, self)
+        return self.make_row(cass_row)
 
     def all(self):
         """ Return the all rows using of a result, using an 
@@ -103,12 +313,106 @@ cdef class Result:
         try:
             cass_iterator = cass_iterator_from_result(self.cass_result)
             while cass_iterator_next(cass_iterator) == cass_true:
-                yield Row.new_(cass_iterator_get_row(cass_iterator), self)
+                yield self.make_row(cass_iterator_get_row(cass_iterator))
         finally:
             self.iterator_refs.push_back(cass_iterator)
 
+    cpdef size_t payload_size(self):
+        """ Returns the bytes of the values of the rows, about what the
+        result holds in memory."""
+        cdef CassIterator* cass_iterator
+        cdef const CassRow* cass_row
+        cdef const cass_byte_t* output
+        cdef size_t length
+        cdef size_t size = 0
+        cdef size_t count
+        cdef size_t index
+
+        count = cass_result_column_count(self.cass_result)
+        cass_iterator = cass_iterator_from_result(self.cass_result)
+        while cass_iterator_next(cass_iterator) == cass_true:
+            cass_row = cass_iterator_get_row(cass_iterator)
+            for index in range(count):
+                if cass_value_get_bytes(cass_row_get_column(cass_row, index), &output, &length) == CASS_OK:
+                    size += length
+        cass_iterator_free(cass_iterator)
+        return size
+
+    def fetchall(self, row_factory=None):
+        """ Returns a list with the rows not fetched yet by `fetchmany` or
+        `fetchall`, built in a single loop without a generator.
+
+        By default the rows are built by the row factory of the result, or
+        as tuples when it yields `Row` objects. `row_factory` takes the
+        same values but `RowFactory.ROW`.
+        """
+        return self.fetch(cass_result_row_count(self.cass_result), row_factory)
+
+    def fetchmany(self, size_t n, row_factory=None):
+        """ Returns a list with the next `n` rows not fetched yet, fewer
+        when there are not as many and an empty one once all of them were
+        fetched. Rows are built like `fetchall` does.
+        """
+        return self.fetch(n, row_factory)
+
+    def to_columns(self, bint null_masks=False):
+        """ Returns the values of the result by column, as a dictionary
+        of column names, walking the rows once.
+
+        Columns of tinyint, smallint, int, bigint, counter, float, double,
+        boolean and timestamp types are returned as `array.array`, with
+        the timestamps as milliseconds since the epoch and zero for the
+        null values. The rest of the columns are returned as lists.
+
+        When `null_masks` is enabled returns a tuple with the columns and
+        a dictionary with an `array.array` per column where the null
+        values are flagged with a 1.
+        """
+        return result_to_columns(self, null_masks)
+
+    def to_numpy(self):
+        """ Returns a tuple with a dictionary of NumPy arrays per column
+        name, and a dictionary of boolean arrays flagging the null values
+        per column name. Requires NumPy.
+
+        Values are written straight into the preallocated arrays, tinyint,
+        smallint, int, bigint and counter columns are mapped to int8,
+        int16, int32 and int64, float and double to float32 and float64,
+        boolean to bool, timestamp to datetime64[ms] and uuid and timeuuid
+        to 16 bytes void. The rest of the columns are object arrays.
+        """
+        return result_to_numpy(self)
+
+    def to_numpy_structured(self):
+        """ Returns a tuple with a NumPy structured array with a field per
+        column, and a structured boolean array flagging the null values.
+        Uses the same types than `to_numpy`. Requires NumPy.
+        """
+        return result_to_numpy_structured(self)
+
+    def to_arrow(self):
+        """ Returns the result as an Arrow `RecordBatch`. Requires PyArrow.
+
+        Fixed width columns are handed over to Arrow without copying the
+        values, timestamps are mapped to `timestamp[ms]`. The type of each
+        column only depends on its CQL type, so the batches of all of the
+        pages of a statement share their schema.
+        """
+        return result_to_arrow(self)
+
     def __iter__(self):
         return self.all()
 
     def __len__(self):
         return self.count()
+
+
+cdef class ResultBuffer:
+    """ Exports a value of the buffer of a result as a read only buffer,
+    the result is kept alive while the buffer is referenced."""
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        PyBuffer_FillInfo(buffer, self, <void*>self.data, self.length, 1, flags)
+
+    def __releasebuffer__(self, Py_buffer* buffer):
+        pass
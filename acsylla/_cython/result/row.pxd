@@ -5,3 +5,6 @@ cdef class Row:
 
     @staticmethod
     cdef Row new_(const CassRow* cass_row, Result result)
+
+    cdef object decode_column(self, size_t index)
+    cdef list decode_values(self)
@@ -17,8 +17,23 @@ cdef class Row:
 
         return row
 
+    cdef object decode_column(self, size_t index):
+        cdef const CassValue* cass_value
+
+        cass_value = cass_row_get_column(self.cass_row, index)
+        if cass_value == NULL:
+            raise ColumnNotFound(f'ColumnNotFound with index {index}')
+        if index >= <size_t>len(self.result.column_plans):
+            return get_cass_value(cass_value, self.result.native_types)
+        return self.result.decode_column(index, cass_value)
+
+    cdef list decode_values(self):
+        """ Returns the values of all of the columns, using the decoding
+        plans of the column descriptor of the result."""
+        return list(self.result.row_values(self.cass_row))
+
     def __iter__(self):
-        return zip(self.keys(), self.values())
+        return zip(self.keys(), self.decode_values())
 
     def __len__(self):
         return self.result.column_count()
@@ -30,39 +45,27 @@ cdef class Row:
         return self.result.columns_names()
 
     def values(self):
-        cdef size_t count
-        cdef const CassValue* cass_value
-
-        count = cass_result_column_count(self.result.cass_result)
-        result = []
-        for index in range(count):
-            cass_value = cass_row_get_column(self.cass_row, index)
-            if cass_value == NULL:
-                raise ColumnNotFound(f'ColumnNotFound with index {index}')
-            yield get_cass_value(cass_value, self.result.native_types)
+        return iter(self.decode_values())
 
     def as_dict(self):
-        return dict(self)
+        self.result.describe()
+        return dict(zip(self.result.column_names, self.decode_values()))
 
     def as_list(self):
-        return list(self.values())
+        return self.decode_values()
 
     def as_tuple(self):
-        return tuple(self.values())
+        return self.result.row_values(self.cass_row)
 
     def as_named_tuple(self):
-        return tuple(zip(self.keys(), self.values()))
+        self.result.describe()
+        return tuple(zip(self.result.column_names, self.decode_values()))
 
     def column_value_by_index(self, size_t index):
         """ Returns the column value by `column index`.
         Raises an exception if the column can not be found"""
-        cdef const CassValue* cass_value
-
-        cass_value = cass_row_get_column(self.cass_row, index)
-        if cass_value == NULL:
-            raise ColumnNotFound(f'ColumnNotFound with index {index}')
-
-        return get_cass_value(cass_value, self.result.native_types)
+        self.result.describe()
+        return self.decode_column(index)
 
     def column_value(self, str column_name):
         """ Returns the column value called `column_name`.
@@ -71,6 +74,13 @@ cdef class Row:
 
         cdef const CassValue* cass_value
 
+        self.result.describe()
+        index = self.result.column_indexes.get(column_name)
+        if index is not None:
+            return self.decode_column(index)
+
+        # Falls back to the driver for the names that need a case
+        # insensitive or a quoted lookup.
         cass_value = cass_row_get_column_by_name(self.cass_row, column_name.encode())
         if cass_value == NULL:
             raise ColumnNotFound(column_name)
@@ -86,5 +96,6 @@ cdef class Row:
             return self.column_value(name)
 
     def __getattr__(self, name):
-        if name in self.result.columns():
+        self.result.describe()
+        if name in self.result.column_indexes:
             return self.column_value(name)
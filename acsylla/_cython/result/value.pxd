@@ -1,22 +1,98 @@
-cdef object _int8(const CassValue * cass_value)
-cdef object _int16(const CassValue * cass_value)
-cdef object _int32(const CassValue * cass_value)
-cdef object _int64(const CassValue * cass_value)
-cdef object _uuid(const CassValue * cass_value)
-cdef object _float(const CassValue * cass_value)
-cdef object _double(const CassValue * cass_value)
+ctypedef object (*cass_value_decoder)(const CassValue *, int8_t)
+
+# Covers all of the value types but `CASS_VALUE_TYPE_UNKNOWN`.
+cdef enum:
+    VALUE_DECODERS_SIZE = 0x32
+
+# Longer text values are not cached by the `TextCache`.
+cdef enum:
+    TEXT_CACHE_MAX_LENGTH = 256
+
+
+cdef enum UuidFormat:
+    UUID_FORMAT_STR = 0
+    UUID_FORMAT_UUID = 1
+    UUID_FORMAT_BYTES = 2
+
+cdef enum TimestampFormat:
+    TIMESTAMP_FORMAT_DATETIME = 0
+    TIMESTAMP_FORMAT_EPOCH_MS = 1
+
+# C counterpart of the `DecodeOptions` that change the decoders picked
+# by the plans.
+cdef struct DecodeFlags:
+    int uuid_format
+    int timestamp_format
+
+
+cdef int decode_flags(object decode_options, DecodeFlags* flags) except -1
+cdef void uuid_to_bytes(CassUuid uuid, char* target) noexcept
+
+
+cdef class TextCache:
+    cdef:
+        # Slots of the cached `str`, a power of two of them.
+        list slots
+        size_t mask
+
+    @staticmethod
+    cdef TextCache new_(size_t size)
+
+    cdef object decode(self, const CassValue* cass_value)
+
+
+cdef class ValueDecoder:
+    cdef:
+        CassValueType cass_type
+        cass_value_decoder decoder
+        # Plans of the elements of collections, tuples and UDTs, None for
+        # the rest of the types.
+        tuple children
+        tuple field_names
+        # Top level blob and text values are returned as views of the
+        # result buffer, handled by the result itself.
+        bint zero_copy
+        # Decodes the text values of the columns selected by the
+        # `intern_columns` decode option, None for the rest.
+        TextCache text_cache
+
+    @staticmethod
+    cdef ValueDecoder from_data_type(const CassDataType* data_type, const DecodeFlags* flags)
+
+    cdef object decode(self, const CassValue* cass_value, int8_t native_types)
+    cdef object _map(self, const CassValue* cass_value, int8_t native_types)
+    cdef object _collection(self, const CassValue* cass_value, int8_t native_types)
+    cdef object _tuple(self, const CassValue* cass_value, int8_t native_types)
+    cdef object _udt(self, const CassValue* cass_value, int8_t native_types)
+
+
+cdef object _int8(const CassValue * cass_value, int8_t native_types)
+cdef object _int16(const CassValue * cass_value, int8_t native_types)
+cdef object _int32(const CassValue * cass_value, int8_t native_types)
+cdef object _int64(const CassValue * cass_value, int8_t native_types)
+cdef object _uuid(const CassValue * cass_value, int8_t native_types)
+cdef object _uuid_object(const CassValue * cass_value, int8_t native_types)
+cdef object _uuid_bytes(const CassValue * cass_value, int8_t native_types)
+cdef object _float(const CassValue * cass_value, int8_t native_types)
+cdef object _double(const CassValue * cass_value, int8_t native_types)
+cdef object varint_to_int(const cass_byte_t* varint, size_t size)
 cdef object _decimal(const CassValue * cass_value, int8_t native_types)
-cdef object _bool(const CassValue * cass_value)
-cdef object _string(const CassValue * cass_value)
-cdef object _bytes(const CassValue * cass_value)
-cdef object _inet(const CassValue * cass_value)
+cdef object _varint(const CassValue * cass_value, int8_t native_types)
+cdef object _bool(const CassValue * cass_value, int8_t native_types)
+cdef object _string(const CassValue * cass_value, int8_t native_types)
+cdef object _bytes(const CassValue * cass_value, int8_t native_types)
+cdef object _inet(const CassValue * cass_value, int8_t native_types)
 cdef object _date(const CassValue * cass_value, int8_t native_types)
 cdef object _time(const CassValue * cass_value, int8_t native_types)
 cdef object _timestamp(const CassValue * cass_value, int8_t native_types)
+cdef object _timestamp_epoch_ms(const CassValue * cass_value, int8_t native_types)
 cdef object _duration(const CassValue * cass_value, int8_t native_types)
 cdef object _map(const CassValue * cass_value, int8_t native_types)
 cdef object _set(const CassValue * cass_value, int8_t native_types)
 cdef object _list(const CassValue * cass_value, int8_t native_types)
 cdef object _tuple(const CassValue * cass_value, int8_t native_types)
 cdef object _udt(const CassValue * cass_value, int8_t native_types)
+cdef object _unknown(const CassValue * cass_value, int8_t native_types)
+cdef cass_value_decoder value_decoder(CassValueType cass_type)
 cdef object get_cass_value(const CassValue * cass_value, int8_t native_types)
+cdef void init_value_decoders()
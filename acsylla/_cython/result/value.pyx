@@ -1,78 +1,347 @@
 cdef extern from "utils.cpp":
     void civil_from_days(int z, int* year, unsigned* month, unsigned* day) nogil
 
+from cpython.bytes cimport PyBytes_FromStringAndSize
 from cpython.datetime cimport date_new
 from cpython.datetime cimport datetime_new
 from cpython.datetime cimport get_utc
 from cpython.datetime cimport import_datetime
 from cpython.datetime cimport time_new
-
+from cpython.object cimport PyObject_GenericSetAttr
+from cpython.unicode cimport PyUnicode_AsUTF8AndSize
+from cpython.unicode cimport PyUnicode_DecodeASCII
+from cpython.unicode cimport PyUnicode_DecodeUTF8
+from libc.stdio cimport snprintf
+from libc.string cimport memcmp
+
+from decimal import Context
 from decimal import Decimal
+from decimal import MAX_EMAX
+from decimal import MAX_PREC
+from decimal import MIN_EMIN
+from sys import intern
+from uuid import SafeUUID
+from uuid import UUID
 
 import_datetime()
 
+# Context large enough for never rounding when the exponent of a decimal is
+# adjusted by its scale.
+_DECIMAL_CONTEXT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+cdef enum:
+    MILLISECONDS_PER_DAY = 86_400_000
+    # Days since the epoch of the first and the last days supported by
+    # `datetime`.
+    MIN_EPOCH_DAYS = -719_162
+    MAX_EPOCH_DAYS = 2_932_896
+
+
+# Decoder of each value type, indexed by the type.
+cdef cass_value_decoder value_decoders[VALUE_DECODERS_SIZE]
+
+
+cdef void init_value_decoders():
+    cdef int index
+
+    for index in range(VALUE_DECODERS_SIZE):
+        value_decoders[index] = NULL
+    value_decoders[<int>CASS_VALUE_TYPE_CUSTOM] = _bytes
+    value_decoders[<int>CASS_VALUE_TYPE_ASCII] = _string
+    value_decoders[<int>CASS_VALUE_TYPE_BIGINT] = _int64
+    value_decoders[<int>CASS_VALUE_TYPE_BLOB] = _bytes
+    value_decoders[<int>CASS_VALUE_TYPE_BOOLEAN] = _bool
+    value_decoders[<int>CASS_VALUE_TYPE_COUNTER] = _int64
+    value_decoders[<int>CASS_VALUE_TYPE_DECIMAL] = _decimal
+    value_decoders[<int>CASS_VALUE_TYPE_DOUBLE] = _double
+    value_decoders[<int>CASS_VALUE_TYPE_FLOAT] = _float
+    value_decoders[<int>CASS_VALUE_TYPE_INT] = _int32
+    value_decoders[<int>CASS_VALUE_TYPE_TEXT] = _string
+    value_decoders[<int>CASS_VALUE_TYPE_TIMESTAMP] = _timestamp
+    value_decoders[<int>CASS_VALUE_TYPE_UUID] = _uuid
+    value_decoders[<int>CASS_VALUE_TYPE_VARCHAR] = _string
+    value_decoders[<int>CASS_VALUE_TYPE_VARINT] = _varint
+    value_decoders[<int>CASS_VALUE_TYPE_TIMEUUID] = _uuid
+    value_decoders[<int>CASS_VALUE_TYPE_INET] = _inet
+    value_decoders[<int>CASS_VALUE_TYPE_DATE] = _date
+    value_decoders[<int>CASS_VALUE_TYPE_TIME] = _time
+    value_decoders[<int>CASS_VALUE_TYPE_SMALL_INT] = _int16
+    value_decoders[<int>CASS_VALUE_TYPE_TINY_INT] = _int8
+    value_decoders[<int>CASS_VALUE_TYPE_DURATION] = _duration
+    value_decoders[<int>CASS_VALUE_TYPE_LIST] = _list
+    value_decoders[<int>CASS_VALUE_TYPE_MAP] = _map
+    value_decoders[<int>CASS_VALUE_TYPE_SET] = _set
+    value_decoders[<int>CASS_VALUE_TYPE_UDT] = _udt
+    value_decoders[<int>CASS_VALUE_TYPE_TUPLE] = _tuple
+
+
+init_value_decoders()
+
+
+cdef inline cass_value_decoder value_decoder(CassValueType cass_type):
+    """ Returns the function decoding the values of `cass_type`, or NULL
+    when the type is not supported."""
+    if cass_type == CASS_VALUE_TYPE_UNKNOWN:
+        return _unknown
+    if <int>cass_type < 0 or <int>cass_type >= VALUE_DECODERS_SIZE:
+        return NULL
+    return value_decoders[<int>cass_type]
+
+
+cdef int decode_flags(object decode_options, DecodeFlags* flags) except -1:
+    """ Fills the `flags` from the `decode_options`, the defaults when
+    None."""
+    flags.uuid_format = UUID_FORMAT_STR
+    flags.timestamp_format = TIMESTAMP_FORMAT_DATETIME
+    if decode_options is None:
+        return 0
+
+    if decode_options.uuid == "uuid":
+        flags.uuid_format = UUID_FORMAT_UUID
+    elif decode_options.uuid == "bytes":
+        flags.uuid_format = UUID_FORMAT_BYTES
+    elif decode_options.uuid != "str":
+        raise ValueError(f"UUID format not supported {decode_options.uuid!r}")
+
+    if decode_options.timestamp == "epoch_ms":
+        flags.timestamp_format = TIMESTAMP_FORMAT_EPOCH_MS
+    elif decode_options.timestamp != "datetime":
+        raise ValueError(f"Timestamp format not supported {decode_options.timestamp!r}")
+    return 0
+
 
 cdef inline object get_cass_value(const CassValue* cass_value, int8_t native_types):
     cdef CassValueType cass_type
+    cdef cass_value_decoder decoder
 
     cdef cass_bool_t value_is_null = cass_value_is_null(cass_value)
     if value_is_null:
         return None
 
     cass_type = cass_value_type(cass_value)
-
-    if cass_type == CASS_VALUE_TYPE_UNKNOWN:
-        return None
-    elif cass_type == CASS_VALUE_TYPE_TINY_INT:
-        return _int8(cass_value)
-    elif cass_type == CASS_VALUE_TYPE_SMALL_INT:
-        return _int16(cass_value)
-    elif cass_type == CASS_VALUE_TYPE_INT:
-        return _int32(cass_value)
-    elif cass_type in (CASS_VALUE_TYPE_BIGINT, CASS_VALUE_TYPE_COUNTER):
-        return _int64(cass_value)
-    elif cass_type in (CASS_VALUE_TYPE_UUID, CASS_VALUE_TYPE_TIMEUUID):
-        return _uuid(cass_value)
-    elif cass_type == CASS_VALUE_TYPE_FLOAT:
-        return _float(cass_value)
-    elif cass_type == CASS_VALUE_TYPE_DOUBLE:
-        return _double(cass_value)
-    elif cass_type == CASS_VALUE_TYPE_DECIMAL:
-        return _decimal(cass_value, native_types)
-    elif cass_type == CASS_VALUE_TYPE_BOOLEAN:
-        return _bool(cass_value)
-    elif cass_type in (CASS_VALUE_TYPE_ASCII,
-                       CASS_VALUE_TYPE_TEXT,
-                       CASS_VALUE_TYPE_VARCHAR):
-        return _string(cass_value)
-    elif cass_type in (CASS_VALUE_TYPE_BLOB,
-                       CASS_VALUE_TYPE_VARINT,
-                       CASS_VALUE_TYPE_CUSTOM):
-        return _bytes(cass_value)
-    elif cass_type == CASS_VALUE_TYPE_INET:
-        return _inet(cass_value)
-    elif cass_type == CASS_VALUE_TYPE_DATE:
-        return _date(cass_value, native_types)
-    elif cass_type == CASS_VALUE_TYPE_TIME:
-        return _time(cass_value, native_types)
-    elif cass_type == CASS_VALUE_TYPE_TIMESTAMP:
-        return _timestamp(cass_value, native_types)
-    elif cass_type == CASS_VALUE_TYPE_DURATION:
-        return _duration(cass_value, native_types)
-    elif cass_type == CASS_VALUE_TYPE_MAP:
-        return _map(cass_value, native_types)
-    elif cass_type == CASS_VALUE_TYPE_SET:
-        return _set(cass_value, native_types)
-    elif cass_type == CASS_VALUE_TYPE_LIST:
-        return _list(cass_value, native_types)
-    elif cass_type == CASS_VALUE_TYPE_TUPLE:
-        return _tuple(cass_value, native_types)
-    elif cass_type == CASS_VALUE_TYPE_UDT:
-        return _udt(cass_value, native_types)
-    else:
+    decoder = value_decoder(cass_type)
+    if decoder == NULL:
         raise ValueError(f"Type not supported {cass_type}")
-
-cdef inline object _int8(const CassValue* cass_value):
+    return decoder(cass_value, native_types)
+
+
+cdef inline uint64_t fnv1a(const char* data, size_t length) noexcept:
+    cdef uint64_t hash_ = 0xcbf29ce484222325ULL
+    cdef size_t i
+
+    for i in range(length):
+        hash_ = (hash_ ^ <unsigned char>data[i]) * 0x100000001b3ULL
+    return hash_
+
+
+cdef class TextCache:
+    """ Bounded cache of the `str` decoded from the text values of a column,
+    keyed by their raw bytes. Repeated values return the same `str` object.
+
+    Each value has a single slot, picked by the hash of its bytes, and
+    replaces the one that was stored there. Hits do not allocate anything.
+    """
+
+    @staticmethod
+    cdef TextCache new_(size_t size):
+        cdef TextCache cache
+        cdef size_t slots = 1
+
+        while slots < size:
+            slots <<= 1
+        cache = TextCache.__new__(TextCache)
+        cache.slots = [None] * slots
+        cache.mask = slots - 1
+        return cache
+
+    cdef object decode(self, const CassValue* cass_value):
+        cdef const char* output = NULL
+        cdef size_t length = 0
+        cdef const char* cached_output
+        cdef Py_ssize_t cached_length
+        cdef size_t slot
+        cdef CassError error
+
+        error = cass_value_get_string(cass_value, &output, &length)
+        if error == CASS_ERROR_LIB_NULL_VALUE:
+            return None
+        else:
+            raise_if_error(error)
+
+        if length > TEXT_CACHE_MAX_LENGTH:
+            return PyUnicode_DecodeUTF8(output, length, NULL)
+
+        slot = fnv1a(output, length) & self.mask
+        cached = self.slots[slot]
+        if cached is not None:
+            # Does not allocate for ASCII strings, the rest keep their
+            # UTF-8 form once asked for.
+            cached_output = PyUnicode_AsUTF8AndSize(cached, &cached_length)
+            if <size_t>cached_length == length and memcmp(cached_output, output, length) == 0:
+                return cached
+
+        value = PyUnicode_DecodeUTF8(output, length, NULL)
+        self.slots[slot] = value
+        return value
+
+
+cdef class ValueDecoder:
+    """ Decoding plan of the values of a data type.
+
+    Scalar values are decoded by calling their decoder straight away,
+    collections, tuples and UDTs walk their elements using the plans built
+    for their sub types instead of resolving the type of each element.
+    """
+
+    @staticmethod
+    cdef ValueDecoder from_data_type(const CassDataType* data_type, const DecodeFlags* flags):
+        cdef ValueDecoder plan = ValueDecoder()
+        cdef size_t count
+        cdef size_t index
+        cdef size_t length = 0
+        cdef const char* name = NULL
+        cdef const CassDataType* sub_data_type
+
+        if data_type == NULL:
+            plan.cass_type = CASS_VALUE_TYPE_UNKNOWN
+            return plan
+
+        plan.cass_type = cass_data_type_type(data_type)
+        plan.decoder = value_decoder(plan.cass_type)
+        if plan.cass_type in (CASS_VALUE_TYPE_UUID, CASS_VALUE_TYPE_TIMEUUID) and flags != NULL:
+            if flags.uuid_format == UUID_FORMAT_UUID:
+                plan.decoder = _uuid_object
+            elif flags.uuid_format == UUID_FORMAT_BYTES:
+                plan.decoder = _uuid_bytes
+        if plan.cass_type == CASS_VALUE_TYPE_TIMESTAMP and flags != NULL:
+            if flags.timestamp_format == TIMESTAMP_FORMAT_EPOCH_MS:
+                plan.decoder = _timestamp_epoch_ms
+        if plan.cass_type not in (CASS_VALUE_TYPE_LIST,
+                                  CASS_VALUE_TYPE_SET,
+                                  CASS_VALUE_TYPE_MAP,
+                                  CASS_VALUE_TYPE_TUPLE,
+                                  CASS_VALUE_TYPE_UDT):
+            return plan
+
+        count = cass_data_type_sub_type_count(data_type)
+        if plan.cass_type == CASS_VALUE_TYPE_MAP and count != 2:
+            return plan
+        if plan.cass_type in (CASS_VALUE_TYPE_LIST, CASS_VALUE_TYPE_SET) and count != 1:
+            return plan
+
+        children = []
+        field_names = []
+        for index in range(count):
+            sub_data_type = cass_data_type_sub_data_type(data_type, index)
+            if sub_data_type == NULL:
+                return plan
+            children.append(ValueDecoder.from_data_type(sub_data_type, flags))
+            if plan.cass_type == CASS_VALUE_TYPE_UDT:
+                if cass_data_type_sub_type_name(data_type, index, &name, &length) != CASS_OK:
+                    return plan
+                field_names.append(intern(name[:length].decode()))
+        plan.children = tuple(children)
+        plan.field_names = tuple(field_names)
+        return plan
+
+    cdef object decode(self, const CassValue* cass_value, int8_t native_types):
+        if cass_value_is_null(cass_value):
+            return None
+        if self.children is not None:
+            if self.cass_type == CASS_VALUE_TYPE_MAP:
+                return self._map(cass_value, native_types)
+            elif self.cass_type == CASS_VALUE_TYPE_TUPLE:
+                return self._tuple(cass_value, native_types)
+            elif self.cass_type == CASS_VALUE_TYPE_UDT:
+                return self._udt(cass_value, native_types)
+            return self._collection(cass_value, native_types)
+        if self.text_cache is not None:
+            return self.text_cache.decode(cass_value)
+        if self.decoder == NULL:
+            return get_cass_value(cass_value, native_types)
+        return self.decoder(cass_value, native_types)
+
+    cdef object _map(self, const CassValue* cass_value, int8_t native_types):
+        cdef ValueDecoder key_plan = <ValueDecoder>self.children[0]
+        cdef ValueDecoder value_plan = <ValueDecoder>self.children[1]
+        cdef CassIterator* iterator = cass_iterator_from_map(cass_value)
+        if iterator == NULL:
+            return None
+        data = {}
+        try:
+            while cass_iterator_next(iterator) == cass_true:
+                key = key_plan.decode(cass_iterator_get_map_key(iterator), native_types)
+                data[key] = value_plan.decode(cass_iterator_get_map_value(iterator), native_types)
+        finally:
+            cass_iterator_free(iterator)
+        return data
+
+    cdef object _collection(self, const CassValue* cass_value, int8_t native_types):
+        cdef ValueDecoder plan = <ValueDecoder>self.children[0]
+        cdef CassIterator* iterator = cass_iterator_from_collection(cass_value)
+        if iterator == NULL:
+            return None
+        data = []
+        try:
+            while cass_iterator_next(iterator) == cass_true:
+                data.append(plan.decode(cass_iterator_get_value(iterator), native_types))
+        finally:
+            cass_iterator_free(iterator)
+        if self.cass_type == CASS_VALUE_TYPE_SET:
+            return set(data)
+        return data
+
+    cdef object _tuple(self, const CassValue* cass_value, int8_t native_types):
+        cdef size_t index = 0
+        cdef size_t count = len(self.children)
+        cdef const CassValue* value
+        cdef CassIterator* iterator = cass_iterator_from_tuple(cass_value)
+        if iterator == NULL:
+            return None
+        data = []
+        try:
+            while cass_iterator_next(iterator) == cass_true:
+                value = cass_iterator_get_value(iterator)
+                if index < count:
+                    data.append((<ValueDecoder>self.children[index]).decode(value, native_types))
+                else:
+                    data.append(get_cass_value(value, native_types))
+                index += 1
+        finally:
+            cass_iterator_free(iterator)
+        return tuple(data)
+
+    cdef object _udt(self, const CassValue* cass_value, int8_t native_types):
+        cdef size_t index = 0
+        cdef size_t count = len(self.children)
+        cdef const char* field_name
+        cdef size_t field_name_length
+        cdef const CassValue* field_value
+        cdef CassIterator* iterator = cass_iterator_fields_from_user_type(cass_value)
+        if iterator == NULL:
+            return None
+        data = {}
+        try:
+            while cass_iterator_next(iterator) == cass_true:
+                field_value = cass_iterator_get_user_type_field_value(iterator)
+                if index < count:
+                    data[self.field_names[index]] = (<ValueDecoder>self.children[index]).decode(
+                        field_value, native_types
+                    )
+                else:
+                    cass_iterator_get_user_type_field_name(iterator, &field_name, &field_name_length)
+                    data[field_name[:field_name_length].decode()] = get_cass_value(field_value, native_types)
+                index += 1
+        finally:
+            cass_iterator_free(iterator)
+        return data
+
+
+cdef inline object _unknown(const CassValue* cass_value, int8_t native_types):
+    return None
+
+
+cdef inline object _int8(const CassValue* cass_value, int8_t native_types):
     """ Returns the int value of a column.
 
     Raises a derived `CassException` if the value can not be retrieved"""
@@ -86,7 +355,7 @@ cdef inline object _int8(const CassValue* cass_value):
     return output
 
 
-cdef inline object _int16(const CassValue* cass_value):
+cdef inline object _int16(const CassValue* cass_value, int8_t native_types):
     """ Returns the int value of a column.
 
     Raises a derived `CassException` if the value can not be retrieved"""
@@ -100,7 +369,7 @@ cdef inline object _int16(const CassValue* cass_value):
     return output
 
 
-cdef inline object _int32(const CassValue* cass_value):
+cdef inline object _int32(const CassValue* cass_value, int8_t native_types):
     """ Returns the int value of a column.
 
     Raises a derived `CassException` if the value can not be retrieved"""
@@ -114,7 +383,7 @@ cdef inline object _int32(const CassValue* cass_value):
     return output
 
 
-cdef inline object _int64(const CassValue* cass_value):
+cdef inline object _int64(const CassValue* cass_value, int8_t native_types):
     """ Returns the int value of a column.
 
     Raises a derived `CassException` if the value can not be retrieved"""
@@ -128,7 +397,7 @@ cdef inline object _int64(const CassValue* cass_value):
     return output
 
 
-cdef inline object _uuid(const CassValue* cass_value):
+cdef inline object _uuid(const CassValue* cass_value, int8_t native_types):
     cdef char output[CASS_UUID_STRING_LENGTH]
     cdef CassError error
     cdef CassUuid uuid
@@ -143,7 +412,66 @@ cdef inline object _uuid(const CassValue* cass_value):
     return output.decode()
 
 
-cdef inline object _float(const CassValue* cass_value):
+cdef inline void uuid_to_bytes(CassUuid uuid, char* target) noexcept:
+    """ Writes the 16 bytes of the `uuid`, same layout than `uuid.UUID.bytes`."""
+    cdef int i
+
+    for i in range(4):
+        target[i] = <char> (uuid.time_and_version >> (24 - 8 * i))
+    target[4] = <char> (uuid.time_and_version >> 40)
+    target[5] = <char> (uuid.time_and_version >> 32)
+    target[6] = <char> (uuid.time_and_version >> 56)
+    target[7] = <char> (uuid.time_and_version >> 48)
+    for i in range(8):
+        target[8 + i] = <char> (uuid.clock_seq_and_node >> (56 - 8 * i))
+
+
+cdef inline object _uuid_object(const CassValue* cass_value, int8_t native_types):
+    """ Returns the `uuid.UUID` of a column, built from its 128 bits value
+    without parsing any string.
+
+    Raises a derived `CassException` if the value can not be retrieved"""
+    cdef CassError error
+    cdef CassUuid uuid
+    cdef uint64_t high
+
+    error = cass_value_get_uuid(cass_value, &uuid)
+    if error == CASS_ERROR_LIB_NULL_VALUE:
+        return None
+    else:
+        raise_if_error(error)
+
+    # time_low, time_mid and time_hi_and_version, in this order.
+    high = ((uuid.time_and_version & 0xFFFFFFFF) << 32
+            | ((uuid.time_and_version >> 32) & 0xFFFF) << 16
+            | uuid.time_and_version >> 48)
+    value = UUID.__new__(UUID)
+    # Same than `uuid.UUID(int=...)` without the range checks, the
+    # attributes are set skipping the `__setattr__` that forbids it.
+    PyObject_GenericSetAttr(value, "int", (<object>high) << 64 | <object>uuid.clock_seq_and_node)
+    PyObject_GenericSetAttr(value, "is_safe", SafeUUID.unknown)
+    return value
+
+
+cdef inline object _uuid_bytes(const CassValue* cass_value, int8_t native_types):
+    """ Returns the 16 bytes of the uuid of a column.
+
+    Raises a derived `CassException` if the value can not be retrieved"""
+    cdef CassError error
+    cdef CassUuid uuid
+    cdef char output[16]
+
+    error = cass_value_get_uuid(cass_value, &uuid)
+    if error == CASS_ERROR_LIB_NULL_VALUE:
+        return None
+    else:
+        raise_if_error(error)
+
+    uuid_to_bytes(uuid, output)
+    return PyBytes_FromStringAndSize(output, 16)
+
+
+cdef inline object _float(const CassValue* cass_value, int8_t native_types):
     """ Returns the float value of a column.
 
     Raises a derived `CassException` if the value can not be retrieved"""
@@ -159,7 +487,7 @@ cdef inline object _float(const CassValue* cass_value):
     return output
 
 
-cdef inline object _double(const CassValue* cass_value):
+cdef inline object _double(const CassValue* cass_value, int8_t native_types):
     """ Returns the double value of a column.
 
     Raises a derived `CassException` if the value can not be retrieved"""
@@ -175,17 +503,51 @@ cdef inline object _double(const CassValue* cass_value):
     return output
 
 
+cdef inline object varint_to_int(const cass_byte_t* varint, size_t size):
+    """ Returns the int of a big endian two's complement varint, the ones
+    fitting in 64 bits are converted without any Python call."""
+    cdef uint64_t value = 0
+    cdef size_t i
+
+    if size > 8:
+        return int.from_bytes(varint[:size], "big", signed=True)
+
+    for i in range(size):
+        value = (value << 8) | varint[i]
+    if 0 < size < 8 and varint[0] & 0x80:
+        # sign extension of the negative ones
+        value |= (~(<uint64_t>0)) << (8 * size)
+    return <int64_t>value
+
+
+cdef inline object _varint(const CassValue* cass_value, int8_t native_types):
+    """ Returns the int value of a varint column.
+
+    Raises a derived `CassException` if the value can not be retrieved"""
+    cdef size_t size = 0
+    cdef const cass_byte_t* varint = NULL
+    cdef CassError error
+
+    error = cass_value_get_bytes(cass_value, &varint, &size)
+    if error == CASS_ERROR_LIB_NULL_VALUE:
+        return None
+    else:
+        raise_if_error(error)
+
+    return varint_to_int(varint, size)
+
+
 cdef inline object _decimal(const CassValue* cass_value, int8_t native_types):
-    """ Returns the decimal value of a column.
+    """ Returns the decimal value of a column, built from its unscaled
+    varint and its scale.
 
     Raises a derived `CassException` if the value can not be retrieved"""
-    cdef Py_ssize_t varint_size = 0
-    cdef cass_byte_t* varint = NULL
+    cdef size_t varint_size = 0
+    cdef const cass_byte_t* varint = NULL
     cdef cass_int32_t scale
     cdef CassError error
-    cdef bytes decimal_
 
-    error = cass_value_get_decimal(cass_value, <const cass_byte_t**> &varint, <size_t*> &varint_size, &scale)
+    error = cass_value_get_decimal(cass_value, &varint, &varint_size, &scale)
     if error == CASS_ERROR_LIB_NULL_VALUE:
         return None
     else:
@@ -194,13 +556,15 @@ cdef inline object _decimal(const CassValue* cass_value, int8_t native_types):
     # This pointer does not need to be free up since its an
     # slice of the buffer kept by the Cassandra driver and related to
     # the result. When the result is free up all the space will be free up.
-    decimal_ = varint[:varint_size]
+    value = Decimal(varint_to_int(varint, varint_size))
+    if scale != 0:
+        value = value.scaleb(-scale, _DECIMAL_CONTEXT)
     if native_types:
-        return decimal_.decode()
-    return Decimal(decimal_.decode())
+        return str(value)
+    return value
 
 
-cdef inline object _bool(const CassValue* cass_value):
+cdef inline object _bool(const CassValue* cass_value, int8_t native_types):
     """ Returns the bool value of a column.
 
     Raises a derived `CassException` if the value can not be retrieved"""
@@ -219,7 +583,7 @@ cdef inline object _bool(const CassValue* cass_value):
         return False
 
 
-cdef inline object _string(const CassValue* cass_value):
+cdef inline object _string(const CassValue* cass_value, int8_t native_types):
     """ Returns the string value of a column.
 
     Raises a derived `CassException` if the value can not be retrieved"""
@@ -241,7 +605,7 @@ cdef inline object _string(const CassValue* cass_value):
     return string.decode()
 
 
-cdef inline object _bytes(const CassValue* cass_value):
+cdef inline object _bytes(const CassValue* cass_value, int8_t native_types):
     """ Returns the bytes value of a column.
 
     Raises a derived `CassException` if the value can not be retrieved"""
@@ -263,7 +627,7 @@ cdef inline object _bytes(const CassValue* cass_value):
     return bytes_
 
 
-cdef inline object _inet(const CassValue* cass_value):
+cdef inline object _inet(const CassValue* cass_value, int8_t native_types):
     """ Returns the inet value of a column.
 
     Raises a derived `CassException` if the value can not be retrieved"""
@@ -285,6 +649,8 @@ cdef inline object _date(const CassValue* cass_value, int8_t native_types):
     cdef int y
     cdef unsigned int m
     cdef unsigned int d
+    cdef char buffer[32]
+    cdef int length
 
     error = cass_value_get_uint32(cass_value, <cass_uint32_t *> &output)
     if error == CASS_ERROR_LIB_NULL_VALUE:
@@ -293,36 +659,48 @@ cdef inline object _date(const CassValue* cass_value, int8_t native_types):
         raise_if_error(error)
     civil_from_days(output-2147483648U, <int*>&y, <unsigned*>&m, <unsigned*>&d)
     if native_types:
-        return f'{y:04d}-{m:02d}-{d:02d}'
+        length = snprintf(buffer, sizeof(buffer), "%04d-%02u-%02u", y, m, d)
+        return PyUnicode_DecodeASCII(buffer, length, NULL)
     return date_new(y, m, d)
 
 
 cdef inline object _time(const CassValue* cass_value, int8_t native_types):
     cdef cass_int64_t nanos
     cdef CassError error
+    cdef int hour
+    cdef int minute
+    cdef int second
+    cdef int nanosecond
+    cdef char buffer[32]
+    cdef int length
 
     error = cass_value_get_int64(cass_value, <cass_int64_t *> &nanos)
     if error == CASS_ERROR_LIB_NULL_VALUE:
         return None
     else:
         raise_if_error(error)
-    second, nanosecond = divmod(nanos, 1_000_000_000)
-    minute, second = divmod(second, 60)
-    hour = int(minute/60)
-    minute = minute-hour*60
-    microsecond = int(nanosecond/1_000)
+    # nanoseconds since midnight, never negative
+    nanosecond = nanos % 1_000_000_000
+    nanos = nanos // 1_000_000_000
+    second = nanos % 60
+    minute = (nanos // 60) % 60
+    hour = nanos // 3600
     if native_types:
-        return f'{hour:02d}:{minute:02d}:{second:02d}.{nanosecond:09d}'
-    return time_new(hour, minute, second, microsecond, None)
+        length = snprintf(buffer, sizeof(buffer), "%02d:%02d:%02d.%09d", hour, minute, second, nanosecond)
+        return PyUnicode_DecodeASCII(buffer, length, NULL)
+    return time_new(hour, minute, second, nanosecond // 1_000, None)
 
 
 cdef inline object _timestamp(const CassValue* cass_value, int8_t native_types):
     cdef cass_int64_t milliseconds_since_epoch
-    cdef double seconds_since_epoch
+    cdef cass_int64_t days
+    cdef int milliseconds
     cdef CassError error
     cdef int y
     cdef unsigned int m
     cdef unsigned int d
+    cdef char buffer[32]
+    cdef int length
 
     error = cass_value_get_int64(cass_value, <cass_int64_t *> &milliseconds_since_epoch)
     if error == CASS_ERROR_LIB_NULL_VALUE:
@@ -330,23 +708,42 @@ cdef inline object _timestamp(const CassValue* cass_value, int8_t native_types):
     else:
         raise_if_error(error)
 
-    seconds_since_epoch = <double>(milliseconds_since_epoch) / 1000.0
-    utc_datetime = datetime.fromtimestamp(seconds_since_epoch, get_utc())
-    # there might be some rounding imprecision
-    utc_datetime = utc_datetime.replace(microsecond=utc_datetime.microsecond // 1_000 * 1_000)
-
-    y = utc_datetime.year
-    m = utc_datetime.month
-    d = utc_datetime.day
-    hour = utc_datetime.hour
-    minute = utc_datetime.minute
-    second = utc_datetime.second
-    millisecond = utc_datetime.microsecond // 1_000
+    # floor division, timestamps before the epoch are negative
+    days = milliseconds_since_epoch // MILLISECONDS_PER_DAY
+    if days < MIN_EPOCH_DAYS or days > MAX_EPOCH_DAYS:
+        raise ValueError(f"Timestamp out of range {milliseconds_since_epoch}")
+    milliseconds = milliseconds_since_epoch - days * MILLISECONDS_PER_DAY
+    civil_from_days(<int>days, <int*>&y, <unsigned*>&m, <unsigned*>&d)
 
     if native_types:
-        return f'{y:04d}-{m:02d}-{d:02d} {hour:02d}:{minute:02d}:{second:02d}.{millisecond:03d}Z'
+        length = snprintf(
+            buffer, sizeof(buffer), "%04d-%02u-%02u %02d:%02d:%02d.%03dZ",
+            y, m, d,
+            milliseconds // 3_600_000, milliseconds // 60_000 % 60, milliseconds // 1_000 % 60, milliseconds % 1_000
+        )
+        return PyUnicode_DecodeASCII(buffer, length, NULL)
+
+    return datetime_new(
+        y, m, d,
+        milliseconds // 3_600_000, milliseconds // 60_000 % 60, milliseconds // 1_000 % 60, milliseconds % 1_000 * 1_000,
+        get_utc()
+    )
+
+
+cdef inline object _timestamp_epoch_ms(const CassValue* cass_value, int8_t native_types):
+    """ Returns the milliseconds since the epoch of a timestamp column, as
+    stored.
+
+    Raises a derived `CassException` if the value can not be retrieved"""
+    cdef cass_int64_t milliseconds_since_epoch
+    cdef CassError error
 
-    return utc_datetime
+    error = cass_value_get_int64(cass_value, <cass_int64_t *> &milliseconds_since_epoch)
+    if error == CASS_ERROR_LIB_NULL_VALUE:
+        return None
+    else:
+        raise_if_error(error)
+    return milliseconds_since_epoch
 
 
 cdef inline object _duration(const CassValue* cass_value, int8_t native_types):
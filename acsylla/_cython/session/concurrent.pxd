@@ -0,0 +1,32 @@
+cdef class ConcurrentExecution:
+    cdef:
+        Session session
+        PreparedStatement prepared
+        object parameters
+        object native_types
+        object loop
+        int concurrency
+        Py_ssize_t submitted
+        Py_ssize_t in_flight
+        bint started
+        bint exhausted
+        bint streaming
+        list results
+        object ready
+        object waiter
+        object error
+
+    cdef void _start(self)
+    cdef void _submit(self)
+    cdef void _complete(self, ConcurrentRequest request)
+    cdef void _store(self, Py_ssize_t index, object outcome)
+    cdef void _wake(self)
+    cdef bint _finished(self)
+
+
+cdef class ConcurrentRequest(CallbackWrapper):
+    cdef:
+        ConcurrentExecution execution
+        CassFuture* cass_future
+        Py_ssize_t index
+        bint tracing_enabled
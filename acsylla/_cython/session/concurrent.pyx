@@ -0,0 +1,195 @@
+from collections import deque
+
+
+cdef class ConcurrentExecution:
+    """ Executes a prepared statement once per set of parameters keeping at
+    most `concurrency` requests in flight.
+
+    The next request is submitted by the completion path of the previous
+    one, without creating a task per request. Awaiting it returns the
+    outcomes in the order of the parameters, iterating it asynchronously
+    yields `(index, outcome)` tuples as requests complete. The outcome is
+    the `Result` or the exception raised by the request.
+    """
+
+    def __init__(self, Session session, PreparedStatement prepared, object parameters, int concurrency=100, object native_types=None):
+        if concurrency < 1:
+            raise ValueError("`concurrency` must be greater than 0")
+        self.session = session
+        self.prepared = prepared
+        self.parameters = iter(parameters)
+        self.native_types = native_types if native_types is not None else (prepared.native_types or False)
+        self.loop = session.cluster.loop
+        self.concurrency = concurrency
+        self.submitted = 0
+        self.in_flight = 0
+        self.started = 0
+        self.exhausted = 0
+        self.streaming = 0
+        self.results = []
+        self.ready = deque()
+        self.waiter = None
+        self.error = None
+
+    def __await__(self):
+        return self._wait_all().__await__()
+
+    async def _wait_all(self):
+        if self.streaming:
+            raise RuntimeError("ConcurrentExecution is already being iterated")
+        self._start()
+        try:
+            while not self._finished():
+                self.waiter = self.loop.create_future()
+                await self.waiter
+        except asyncio.CancelledError:
+            self.cancel()
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.results
+
+    def __aiter__(self):
+        if self.started and not self.streaming:
+            raise RuntimeError("ConcurrentExecution is already being awaited")
+        self.streaming = 1
+        self._start()
+        return self
+
+    async def __anext__(self):
+        try:
+            while not self.ready:
+                if self.error is not None:
+                    raise self.error
+                if self._finished():
+                    raise StopAsyncIteration
+                self.waiter = self.loop.create_future()
+                await self.waiter
+        except asyncio.CancelledError:
+            self.cancel()
+            raise
+        outcome = self.ready.popleft()
+        # Room for one more request now that an outcome was consumed.
+        self._submit()
+        return outcome
+
+    def cancel(self):
+        """ Stops submitting new requests, the ones in flight are left to
+        complete.
+        """
+        self.exhausted = 1
+        self._wake()
+
+    def in_flight_requests(self):
+        return self.in_flight
+
+    cdef void _start(self):
+        if self.started:
+            return
+        self.started = 1
+        self._submit()
+
+    cdef void _submit(self):
+        cdef Statement statement
+        cdef CassFuture* cass_future
+        cdef ConcurrentRequest request
+        cdef Py_ssize_t index
+
+        # When streaming the outcomes not consumed yet count against the
+        # concurrency, so a slow consumer slows down the submission.
+        while not self.exhausted and self.in_flight + len(self.ready) < self.concurrency:
+            try:
+                parameters = next(self.parameters)
+            except StopIteration:
+                self.exhausted = 1
+                break
+            except Exception as exc:
+                self.error = exc
+                self.exhausted = 1
+                break
+
+            index = self.submitted
+            self.submitted += 1
+            if not self.streaming:
+                self.results.append(None)
+
+            if self.session.closed == 1:
+                self._store(index, RuntimeError("Session closed"))
+                continue
+
+            try:
+                statement = self.prepared.bind(parameters)
+                cass_future = cass_session_execute(self.session.cass_session, statement.cass_statement)
+                request = ConcurrentRequest.__new__(ConcurrentRequest)
+                request.execution = self
+                request.cass_future = cass_future
+                request.index = index
+                request.tracing_enabled = statement.tracing_enabled is True
+                try:
+                    request._attach(
+                        cass_future,
+                        self.session.cluster,
+                        self.session.cluster.materialize_results,
+                        request.tracing_enabled
+                    )
+                except BaseException:
+                    request.cass_future = NULL
+                    cass_future_free(cass_future)
+                    raise
+            except Exception as exc:
+                self._store(index, exc)
+                continue
+
+            self.in_flight += 1
+
+    cdef void _complete(self, ConcurrentRequest request):
+        try:
+            outcome = self.session._get_result(
+                request.cass_future,
+                request,
+                self.native_types,
+                request.tracing_enabled
+            )
+            outcome.set_row_factory(self.prepared.row_factory)
+            outcome.decode_options = self.prepared.decode_options or self.session.decode_options
+        except Exception as exc:
+            outcome = exc
+        finally:
+            cass_future_free(request.cass_future)
+            request.cass_future = NULL
+
+        self.in_flight -= 1
+        self._store(request.index, outcome)
+        self._submit()
+        self._wake()
+
+    cdef void _store(self, Py_ssize_t index, object outcome):
+        if self.streaming:
+            self.ready.append((index, outcome))
+        else:
+            self.results[index] = outcome
+
+    cdef void _wake(self):
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    cdef bint _finished(self):
+        return self.exhausted and self.in_flight == 0
+
+
+cdef class ConcurrentRequest(CallbackWrapper):
+    """ Request of a `ConcurrentExecution`, completed by the bridge which
+    hands the outcome over to the execution without scheduling callbacks.
+    """
+
+    def __cinit__(self):
+        self.cass_future = NULL
+
+    cdef void set_result(self):
+        if self.state != CALLBACK_WRAPPER_PENDING:
+            return
+
+        self.state = CALLBACK_WRAPPER_FINISHED
+        self.execution._complete(self)
+        # Breaks the reference cycle with the execution.
+        self.execution = None
@@ -0,0 +1,19 @@
+cdef class TableScan:
+    cdef:
+        Session session
+        str keyspace
+        str table
+        object columns
+        int concurrency
+        object page_size
+        bint ordered
+        bint pages
+        object timeout
+        object consistency
+        object execution_profile
+        object native_types
+        list ranges
+        bint started
+
+    cdef str _query(self)
+    cdef void _advance(self, Py_ssize_t index, object page_state)
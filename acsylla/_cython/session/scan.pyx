@@ -0,0 +1,183 @@
+from dataclasses import replace
+
+# Murmur3 tokens bounds, the minimum token is never owned by a partition.
+MURMUR3_MIN_TOKEN = -2**63
+MURMUR3_MAX_TOKEN = 2**63 - 1
+
+
+def split_token_ring(int splits):
+    """ Splits the Murmur3 token ring into `splits` contiguous ranges of
+    about the same size, as a list of `acsylla.TokenRange`.
+    """
+    from acsylla import TokenRange
+
+    if splits < 1:
+        raise ValueError("`splits` must be greater than 0")
+
+    span = MURMUR3_MAX_TOKEN - MURMUR3_MIN_TOKEN
+    bounds = [MURMUR3_MIN_TOKEN + span * i // splits for i in range(splits)]
+    bounds.append(MURMUR3_MAX_TOKEN)
+    return [TokenRange(start=bounds[i], end=bounds[i + 1]) for i in range(splits)]
+
+
+cdef str quote_identifier(str name):
+    """ Returns the name as a quoted CQL identifier, taken as it is, the
+    same way the table metadata is looked up.
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+cdef class TableScan:
+    """ Reads a whole table splitting the token ring into ranges that are
+    paged concurrently, at most `concurrency` ranges at once.
+
+    Iterating it asynchronously yields the rows, or the `Result` of each
+    page when `pages` is enabled. Rows of different ranges are interleaved
+    unless `ordered` is enabled, then the ranges are yielded one after the
+    other following the ring.
+
+    The progress of each range only moves forward once its page has been
+    consumed, `checkpoint` returns it for resuming an interrupted scan.
+    """
+
+    def __init__(
+        self,
+        Session session,
+        str keyspace,
+        str table,
+        object columns=None,
+        object splits=None,
+        int concurrency=4,
+        object page_size=None,
+        bint ordered=False,
+        bint pages=False,
+        object checkpoint=None,
+        object timeout=None,
+        object consistency=None,
+        object execution_profile=None,
+        object native_types=None,
+    ):
+        if concurrency < 1:
+            raise ValueError("`concurrency` must be greater than 0")
+        self.session = session
+        self.keyspace = keyspace
+        self.table = table
+        self.columns = columns
+        self.concurrency = concurrency
+        self.page_size = page_size
+        self.ordered = ordered
+        self.pages = pages
+        self.timeout = timeout
+        self.consistency = consistency
+        self.execution_profile = execution_profile
+        self.native_types = native_types
+        self.started = 0
+        if checkpoint is not None:
+            self.ranges = [replace(token_range) for token_range in checkpoint]
+        else:
+            self.ranges = split_token_ring(splits if splits is not None else concurrency * 4)
+
+    def checkpoint(self):
+        """ Returns a copy of the progress of each range, can be given to
+        `Session.scan` for resuming the scan. Pages not consumed yet are
+        fetched again once resumed.
+        """
+        return [replace(token_range) for token_range in self.ranges]
+
+    def __aiter__(self):
+        if self.started:
+            raise RuntimeError("TableScan can only be iterated once")
+        self.started = 1
+        return self._iterate()
+
+    async def _iterate(self):
+        prepared = await self.session.create_prepared(
+            self._query(),
+            self.timeout,
+            self.consistency,
+            None,
+            self.execution_profile,
+            self.native_types,
+        )
+        pending = iter([index for index, token_range in enumerate(self.ranges) if not token_range.finished])
+        if self.ordered:
+            # One bounded queue per range, the ones ahead of the range being
+            # consumed stop fetching once their queue is full.
+            queues = {index: asyncio.Queue(maxsize=2) for index, token_range in enumerate(self.ranges)}
+        else:
+            queues = asyncio.Queue(maxsize=self.concurrency)
+        workers = [
+            asyncio.create_task(self._worker(prepared, pending, queues))
+            for _ in range(self.concurrency)
+        ]
+
+        try:
+            if self.ordered:
+                for index, token_range in enumerate(self.ranges):
+                    while not token_range.finished:
+                        item = await queues[index].get()
+                        async for outcome in self._consume(item):
+                            yield outcome
+            else:
+                finished_workers = 0
+                while finished_workers < self.concurrency:
+                    item = await queues.get()
+                    if item is None:
+                        finished_workers += 1
+                        continue
+                    async for outcome in self._consume(item):
+                        yield outcome
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    async def _consume(self, tuple item):
+        index, result, page_state = item
+        if isinstance(result, BaseException):
+            raise result
+        if self.pages:
+            yield result
+        else:
+            for row in result:
+                yield row
+        self._advance(index, page_state)
+
+    async def _worker(self, PreparedStatement prepared, object pending, object queues):
+        cdef Statement statement
+
+        for index in pending:
+            queue = queues[index] if self.ordered else queues
+            token_range = self.ranges[index]
+            page_state = token_range.page_state
+            while True:
+                statement = prepared.bind([token_range.start, token_range.end], self.page_size, page_state)
+                try:
+                    result = await self.session.execute(statement, self.native_types)
+                except Exception as exc:
+                    await queue.put((index, exc, None))
+                    return
+                page_state = result.page_state() if result.has_more_pages() else None
+                await queue.put((index, result, page_state))
+                if page_state is None:
+                    break
+
+        if not self.ordered:
+            await queues.put(None)
+
+    cdef str _query(self):
+        metadata = self.session.get_metadata().get_table_meta(self.keyspace, self.table)
+        partition_keys = sorted(
+            [column for column in metadata.columns if column.kind == "partition_key"],
+            key=lambda column: column.position
+        )
+        token = ", ".join([quote_identifier(column.name) for column in partition_keys])
+        columns = ", ".join([quote_identifier(column) for column in self.columns]) if self.columns else "*"
+        return (
+            f"SELECT {columns} FROM {quote_identifier(self.keyspace)}.{quote_identifier(self.table)} "
+            f"WHERE token({token}) > ? AND token({token}) <= ?"
+        )
+
+    cdef void _advance(self, Py_ssize_t index, object page_state):
+        token_range = self.ranges[index]
+        token_range.page_state = page_state
+        token_range.finished = page_state is None
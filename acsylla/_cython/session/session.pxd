@@ -7,3 +7,15 @@ cdef class Session:
         bint closed
         bint connected
         public object keyspace
+        object prepared_cache
+        size_t prepared_cache_size
+        set prepared_cache_pending
+        set prepared_cache_tasks
+        size_t prepared_cache_hits
+        size_t prepared_cache_misses
+        size_t prepared_cache_evictions
+        object tracker
+        object decode_options
+
+    cdef void _prepare_cached_background(self, tuple cache_key)
+    cdef Result _get_result(self, CassFuture* cass_future, CallbackWrapper cb_wrapper, object native_types, bint tracing_enabled)
@@ -1,19 +1,35 @@
+from collections import OrderedDict
+
 import asyncio
 
 
 cdef class Session:
-    def __cinit__(self, Cluster cluster, object keyspace):
+    def __cinit__(self, Cluster cluster, object keyspace, object prepared_cache_size=None, object decode_options=None):
         self.cluster = cluster
         self.cass_cluster = cluster.cass_cluster
         self.cass_session = cass_session_new()
+        self.prepared_cache = None
+        self.prepared_cache_size = 0
+        self.prepared_cache_hits = 0
+        self.prepared_cache_misses = 0
+        self.prepared_cache_evictions = 0
+        self.tracker = None
 
     def __dealloc__(self):
         cass_session_free(self.cass_session)
 
-    def __init__(self, cass_cluster, keyspace=None):
+    def __init__(self, cass_cluster, keyspace=None, prepared_cache_size=None, decode_options=None):
         self.keyspace = keyspace
+        self.decode_options = decode_options
         self.closed = 0
         self.connected = 0
+        if prepared_cache_size is not None:
+            if prepared_cache_size <= 0:
+                raise ValueError("`prepared_cache_size` must be greater than 0")
+            self.prepared_cache = OrderedDict()
+            self.prepared_cache_size = prepared_cache_size
+            self.prepared_cache_pending = set()
+            self.prepared_cache_tasks = set()
 
     async def _connect(self):
         cdef CassFuture* cass_future
@@ -38,7 +54,7 @@ cdef class Session:
         cb_wrapper = CallbackWrapper.new_(cass_future, self.cluster)
 
         try:
-            await cb_wrapper.__await__()
+            await cb_wrapper
             cass_error = cass_future_error_code(cass_future)
             cass_future_error_message(cass_future, <const char**> &error_message, <size_t *> &length)
             raise_if_error(cass_error, error_message)
@@ -76,9 +92,33 @@ cdef class Session:
         object consistency=None,
         object serial_consistency=None,
         str execution_profile=None,
-        object native_types=False
+        object native_types=False,
+        object row_factory=None,
+        object decode_options=None,
+        int prefetch=1,
+        object max_buffered_bytes=None,
     ):
         cdef Statement statement
+        cdef PreparedStatement prepared
+        cdef tuple cache_key = None
+
+        if self.prepared_cache is not None and value_types is None and not isinstance(parameters, int):
+            # Unqualified tables are resolved against the keyspace the
+            # statement was prepared in.
+            cache_key = (self.keyspace, statement_str, timeout, consistency, serial_consistency, execution_profile, native_types)
+            prepared = self.prepared_cache.get(cache_key)
+            if prepared is not None:
+                self.prepared_cache.move_to_end(cache_key)
+                self.prepared_cache_hits += 1
+                statement = prepared.bind(parameters, page_size, page_state, row_factory=row_factory, decode_options=decode_options)
+                statement.cache_key = cache_key
+                statement.prefetch = prefetch
+                statement.max_buffered_bytes = max_buffered_bytes
+                if page_state is None:
+                    statement.cache_args = (parameters, page_size)
+                return statement
+            self.prepared_cache_misses += 1
+
         statement = Statement.new_from_string(
             statement_str,
             parameters,
@@ -92,8 +132,84 @@ cdef class Session:
             native_types,
         )
         statement.session = self
+        statement.cache_key = cache_key
+        statement.row_factory = row_factory
+        statement.decode_options = decode_options
+        statement.prefetch = prefetch
+        statement.max_buffered_bytes = max_buffered_bytes
         return statement
 
+    async def _prepare_cached(self, tuple cache_key):
+        """ Prepares the statement of the cache key and adds it to the
+        prepared statements cache, evicting the least recently used one
+        when the cache is full.
+        """
+        cdef PreparedStatement prepared
+
+        if cache_key in self.prepared_cache or cache_key in self.prepared_cache_pending:
+            return
+
+        if self.closed == 1:
+            return
+
+        self.prepared_cache_pending.add(cache_key)
+        try:
+            prepared = await self.create_prepared(*cache_key[1:])
+        except CassException:
+            # Statements that can not be prepared keep being executed
+            # as they are, the error if any is raised by the execution.
+            return
+        finally:
+            self.prepared_cache_pending.discard(cache_key)
+
+        if self.closed == 1:
+            return
+
+        self.prepared_cache[cache_key] = prepared
+        if len(self.prepared_cache) > self.prepared_cache_size:
+            self.prepared_cache.popitem(last=False)
+            self.prepared_cache_evictions += 1
+
+    cdef void _prepare_cached_background(self, tuple cache_key):
+        """ Schedules the preparation of the statement of the cache key
+        without waiting for it.
+        """
+        if cache_key in self.prepared_cache or cache_key in self.prepared_cache_pending:
+            return
+
+        task = asyncio.ensure_future(self._prepare_cached(cache_key))
+        # Keeps a reference to the task until it is done.
+        self.prepared_cache_tasks.add(task)
+        task.add_done_callback(self.prepared_cache_tasks.discard)
+
+    async def _reprepare_cached(self, Statement statement):
+        """ Prepares again the statement of a cache key that is no longer
+        known by the server, returns the statement bound again against it
+        or None if it can not be retried.
+        """
+        cdef PreparedStatement prepared
+        cdef Statement retry
+
+        self.prepared_cache.pop(statement.cache_key, None)
+        await self._prepare_cached(statement.cache_key)
+        prepared = self.prepared_cache.get(statement.cache_key)
+        if prepared is None or statement.cache_args is None:
+            return None
+
+        parameters, page_size = statement.cache_args
+        retry = prepared.bind(
+            parameters,
+            page_size,
+            row_factory=statement.row_factory,
+            decode_options=statement.decode_options
+        )
+        retry.tracing_enabled = statement.tracing_enabled
+        retry.prefetch = statement.prefetch
+        retry.max_buffered_bytes = statement.max_buffered_bytes
+        # Without `cache_args` the retry is not retried again.
+        retry.cache_key = statement.cache_key
+        return retry
+
     async def close(self):
         cdef CassFuture* cass_future
         cdef CassError cass_error
@@ -109,65 +225,246 @@ cdef class Session:
         # of closing it.
         self.closed = 1
 
+        if self.prepared_cache is not None:
+            self.prepared_cache.clear()
+
         cass_future = cass_session_close(self.cass_session)
         cb_wrapper = CallbackWrapper.new_(cass_future, self.cluster)
 
         try:
-            await cb_wrapper.__await__()
+            await cb_wrapper
             cass_error = cass_future_error_code(cass_future)
             cass_future_error_message(cass_future, <const char**> &error_message, <size_t *> &length)
             raise_if_error(cass_error, error_message)
         finally:
             cass_future_free(cass_future)
 
-    async def execute(self, Statement statement, native_types=None):
+    async def execute(self, Statement statement, native_types=None, row_factory=None):
         """ Execute an statement and returns the result.
 
         Is responsability of the caller to know what to do with
         the results object.
+
+        Iterating the result yields the objects built by `row_factory`,
+        by default the one of the statement, or `Row` instances when none.
         """
         cdef CassFuture* cass_future
-        cdef CassError cass_error
-        cdef size_t length = 0
-        cdef char* error_message = NULL
-        cdef const CassResult* cass_result = NULL
 
         cdef Result result
         cdef CallbackWrapper cb_wrapper
-        cdef CassUuid tracing_id
-        cdef char tracing_id_str[CASS_UUID_STRING_LENGTH]
+        cdef Statement retry = None
 
         if self.closed == 1:
             raise RuntimeError("Session closed")
 
         if native_types is None:
             native_types = statement.native_types or False
+        if row_factory is None:
+            row_factory = statement.row_factory
+        row_factory_kind(row_factory)
+
+        if statement.cache_key is not None and statement.prepared == 0:
+            # First use of a statement created by `query`, it is executed
+            # unprepared while being prepared, the next ones are bound to it.
+            self._prepare_cached_background(statement.cache_key)
 
         cass_future = cass_session_execute(self.cass_session, statement.cass_statement)
-        cb_wrapper = CallbackWrapper.new_(cass_future, self.cluster)
+        cb_wrapper = CallbackWrapper.new_(
+            cass_future,
+            self.cluster,
+            self.cluster.materialize_results,
+            statement.tracing_enabled is True
+        )
+
+        try:
+            await cb_wrapper
+            result = self._get_result(cass_future, cb_wrapper, native_types, statement.tracing_enabled is True)
+            result.set_row_factory(row_factory)
+            result.decode_options = statement.decode_options or self.decode_options
+        except CassErrorServerUnprepared:
+            if statement.cache_key is None or statement.prepared == 0 or statement.cache_args is None:
+                raise
+            retry = await self._reprepare_cached(statement)
+            if retry is None:
+                raise
+        finally:
+            cass_future_free(cass_future)
+
+        if retry is not None:
+            return await self.execute(retry, native_types, row_factory)
+        return result
+
+    def execute_sync(self, Statement statement, native_types=None, row_factory=None):
+        """ Execute an statement blocking the calling thread until the
+        result is available, and returns the result.
+
+        The GIL is released while waiting, so many threads can share the
+        session. The event loop is not involved, can be called from
+        threads that do not run one.
+        """
+        cdef CassFuture* cass_future
+        cdef CassSession* cass_session = self.cass_session
+        cdef CassStatement* cass_statement = statement.cass_statement
+
+        cdef Result result
+
+        if self.closed == 1:
+            raise RuntimeError("Session closed")
+
+        if native_types is None:
+            native_types = statement.native_types or False
+        if row_factory is None:
+            row_factory = statement.row_factory
+        row_factory_kind(row_factory)
+
+        with nogil:
+            cass_future = cass_session_execute(cass_session, cass_statement)
+            cass_future_wait(cass_future)
 
         try:
-            await cb_wrapper.__await__()
+            result = self._get_result(cass_future, None, native_types, statement.tracing_enabled is True)
+            result.set_row_factory(row_factory)
+            result.decode_options = statement.decode_options or self.decode_options
+        finally:
+            cass_future_free(cass_future)
+
+        return result
+
+    def submit(self, Statement statement, CompletionTracker tracker=None):
+        """ Executes an statement discarding its result, only the outcome
+        is accounted by the `tracker`, the one of the session by default.
+
+        Returns immediately, use `CompletionTracker.drain` for waiting
+        the requests in flight.
+        """
+        cdef CassFuture* cass_future
+
+        if self.closed == 1:
+            raise RuntimeError("Session closed")
+
+        if tracker is None:
+            tracker = self.completion_tracker()
+
+        cass_future = cass_session_execute(self.cass_session, statement.cass_statement)
+        try:
+            tracker._track(cass_future)
+        finally:
+            # The callback is still called once the future is freed.
+            cass_future_free(cass_future)
+
+    def completion_tracker(self):
+        """ Returns the `CompletionTracker` used by `submit` when no
+        tracker is given.
+        """
+        if self.tracker is None:
+            self.tracker = CompletionTracker(self)
+        return self.tracker
+
+    def create_completion_tracker(self):
+        """ Returns a new `CompletionTracker` for accounting apart a
+        group of submitted requests.
+        """
+        return CompletionTracker(self)
+
+    def execute_concurrent(self, PreparedStatement prepared, object parameters, int concurrency=100, native_types=None):
+        """ Executes the prepared statement once per item of `parameters`
+        keeping at most `concurrency` requests in flight.
+
+        Returns a `ConcurrentExecution` that can be awaited for getting the
+        outcomes in order, or iterated asynchronously for getting them as
+        they complete.
+        """
+        return ConcurrentExecution(self, prepared, parameters, concurrency, native_types)
+
+    def scan(
+        self,
+        str keyspace,
+        str table,
+        object columns=None,
+        object splits=None,
+        int concurrency=4,
+        object page_size=None,
+        bint ordered=False,
+        bint pages=False,
+        object checkpoint=None,
+        object timeout=None,
+        object consistency=None,
+        str execution_profile=None,
+        object native_types=None,
+    ):
+        """ Reads the whole table splitting the Murmur3 token ring into
+        `splits` ranges, paging up to `concurrency` of them at once.
+
+        Returns a `TableScan` to be iterated asynchronously.
+        """
+        return TableScan(
+            self,
+            keyspace,
+            table,
+            columns,
+            splits,
+            concurrency,
+            page_size,
+            ordered,
+            pages,
+            checkpoint,
+            timeout,
+            consistency,
+            execution_profile,
+            native_types,
+        )
+
+    cdef Result _get_result(self, CassFuture* cass_future, CallbackWrapper cb_wrapper, object native_types, bint tracing_enabled):
+        """ Wraps the result of a finished request, raising the error of the
+        request if any. `cb_wrapper` is None for the synchronous requests.
+
+        When the result was materialized by the driver IO thread the
+        outcome is taken from the container, otherwise it is read from
+        the future.
+        """
+        cdef CassError cass_error
+        cdef size_t length = 0
+        cdef char* error_message = NULL
+        cdef const CassResult* cass_result = NULL
+        cdef CallbackContainer* container = NULL
+
+        cdef Result result
+        cdef CassUuid tracing_id
+        cdef char tracing_id_str[CASS_UUID_STRING_LENGTH]
+
+        if cb_wrapper is not None:
+            container = cb_wrapper.container
+
+        if container != NULL:
+            if container.result == NULL:
+                raise_if_error(container.error_code, container.error_message)
+            # The result is owned by the `Result` from now on.
+            cass_result = container.result
+            container.result = NULL
+            result = Result.new_(cass_result, native_types)
+            if tracing_enabled:
+                raise_if_error(container.tracing_error)
+                tracing_id = container.tracing_id
+        else:
             cass_result = cass_future_get_result(cass_future)
             if cass_result == NULL:
                 cass_error = cass_future_error_code(cass_future)
                 cass_future_error_message(cass_future, <const char**> &error_message, <size_t*> &length)
                 raise_if_error(cass_error, error_message)
             result = Result.new_(cass_result, native_types)
-            if statement.tracing_enabled is True:
+            if tracing_enabled:
                 error = cass_future_tracing_id(cass_future, &tracing_id)
                 raise_if_error(error)
-                cass_uuid_string(tracing_id, tracing_id_str)
-                result.tracing_id = tracing_id_str.decode()
-        finally:
-            cass_future_free(cass_future)
 
+        if tracing_enabled:
+            cass_uuid_string(tracing_id, tracing_id_str)
+            result.tracing_id = tracing_id_str.decode()
         return result
 
-    def prepared_query(self, str statement, object timeout=None, object consistency=None, object serial_consistency=None, execution_profile=None, native_types=None):
-        return self.create_prepared(statement, timeout, consistency, serial_consistency, execution_profile, native_types)
+    def prepared_query(self, str statement, object timeout=None, object consistency=None, object serial_consistency=None, execution_profile=None, native_types=None, row_factory=None, decode_options=None):
+        return self.create_prepared(statement, timeout, consistency, serial_consistency, execution_profile, native_types, row_factory, decode_options)
 
-    async def create_prepared(self, str statement, object timeout=None, object consistency=None, object serial_consistency=None, execution_profile=None, native_types=None):
+    async def create_prepared(self, str statement, object timeout=None, object consistency=None, object serial_consistency=None, execution_profile=None, native_types=None, row_factory=None, decode_options=None):
         """ Prepares an statement."""
         cdef CassFuture* cass_future
         cdef CassError cass_error
@@ -182,19 +479,21 @@ cdef class Session:
         if self.closed == 1:
             raise RuntimeError("Session closed")
 
+        row_factory_kind(row_factory)
         encoded_statement = statement.encode()
 
         cass_future = cass_session_prepare_n(self.cass_session, encoded_statement, len(encoded_statement))
         cb_wrapper = CallbackWrapper.new_(cass_future, self.cluster)
 
         try:
-            await cb_wrapper.__await__()
+            await cb_wrapper
             cass_prepared = cass_future_get_prepared(cass_future)
             if cass_prepared == NULL:
                 cass_error = cass_future_error_code(cass_future)
                 cass_future_error_message(cass_future, <const char**> &error_message, <size_t *> &length)
                 raise_if_error(cass_error, error_message)
-            prepared = PreparedStatement.new_(self, cass_prepared, timeout, consistency, serial_consistency, execution_profile, native_types)
+            prepared = PreparedStatement.new_(self, cass_prepared, timeout, consistency, serial_consistency, execution_profile, native_types, row_factory)
+            prepared.decode_options = decode_options
         finally:
             cass_future_free(cass_future)
 
@@ -207,35 +506,25 @@ cdef class Session:
         the results object.
         """
         cdef CassFuture* cass_future
-        cdef CassError cass_error
-        cdef size_t length = 0
-        cdef char* error_message = NULL
-        cdef const CassResult* cass_result = NULL
 
         cdef Result result
         cdef CallbackWrapper cb_wrapper
-        cdef CassUuid tracing_id
-        cdef char tracing_id_str[CASS_UUID_STRING_LENGTH]
 
         if self.closed == 1:
             raise RuntimeError("Session closed")
 
         cass_future = cass_session_execute_batch(self.cass_session, batch.cass_batch)
-        cb_wrapper = CallbackWrapper.new_(cass_future, self.cluster)
+        cb_wrapper = CallbackWrapper.new_(
+            cass_future,
+            self.cluster,
+            self.cluster.materialize_results,
+            batch.tracing_enabled is True
+        )
 
         try:
-            await cb_wrapper.__await__()
-            cass_result = cass_future_get_result(cass_future)
-            if cass_result == NULL:
-                cass_error = cass_future_error_code(cass_future)
-                cass_future_error_message(cass_future, <const char**> &error_message, <size_t*> &length)
-                raise_if_error(cass_error, error_message)
-            result = Result.new_(cass_result, native_types)
-            if batch.tracing_enabled is True:
-                error = cass_future_tracing_id(cass_future, &tracing_id)
-                raise_if_error(error)
-                cass_uuid_string(tracing_id, tracing_id_str)
-                result.tracing_id = tracing_id_str.decode()
+            await cb_wrapper
+            result = self._get_result(cass_future, cb_wrapper, native_types, batch.tracing_enabled is True)
+            result.decode_options = self.decode_options
         finally:
             cass_future_free(cass_future)
 
@@ -278,6 +567,47 @@ cdef class Session:
             errors_request_timeouts=int(cass_metrics.errors.request_timeouts)
         )
 
+    def bridge_metrics(self):
+        """ Returns the counters of the bridge used for handing over the
+        driver completions to the event loop.
+
+        Returns a `acsylla.BridgeMetrics` object.
+        """
+        from acsylla import BridgeMetrics
+        return BridgeMetrics(
+            completions=self.cluster.bridge.posix_to_python.completions.load(),
+            wakeups=self.cluster.bridge.posix_to_python.wakeups.load(),
+            overflows=self.cluster.bridge.posix_to_python.overflows.load()
+        )
+
+    def bridge_latency_metrics(self):
+        """ Returns the histograms of the hand over of the driver completions
+        to the event loop.
+
+        Returns a `acsylla.BridgeLatencyMetrics` object.
+        """
+        from acsylla import BridgeLatencyMetrics
+        return BridgeLatencyMetrics(
+            queue_delay=histogram_metrics(&self.cluster.queue_delay),
+            drain_batch_size=histogram_metrics(&self.cluster.bridge.drain_batch_size),
+            drain_duration=histogram_metrics(&self.cluster.bridge.drain_duration)
+        )
+
+    def prepared_cache_metrics(self):
+        """ Returns the counters of the prepared statements cache used by
+        `query`.
+
+        Returns a `acsylla.PreparedCacheMetrics` object.
+        """
+        from acsylla import PreparedCacheMetrics
+        return PreparedCacheMetrics(
+            size=len(self.prepared_cache) if self.prepared_cache is not None else 0,
+            max_size=self.prepared_cache_size,
+            hits=self.prepared_cache_hits,
+            misses=self.prepared_cache_misses,
+            evictions=self.prepared_cache_evictions,
+        )
+
     def speculative_execution_metrics(self):
         cdef CassSpeculativeExecutionMetrics cass_metrics
         cass_session_get_speculative_execution_metrics(self.cass_session, &cass_metrics)
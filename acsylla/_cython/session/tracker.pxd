@@ -0,0 +1,15 @@
+cdef class CompletionTracker:
+    cdef:
+        Cluster cluster
+        Bridge bridge
+        BridgeSource* bridge_source
+        uint64_t token
+        Py_ssize_t in_flight
+        Py_ssize_t succeeded
+        Py_ssize_t failed
+        object error
+        list waiters
+
+    cdef _track(self, CassFuture* cass_future)
+    cdef void _complete(self, SubmitError* error)
+    cdef void _abandon(self)
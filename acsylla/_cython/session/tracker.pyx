@@ -0,0 +1,112 @@
+cdef class CompletionTracker:
+    """ Accounts for the completion of the requests submitted with
+    `Session.submit`, whose results are discarded.
+
+    No Python object is created per request, the driver threads only
+    hand over the failed ones along with their error. The tracker is
+    registered in the bridge only while it has requests in flight.
+    """
+
+    def __cinit__(self):
+        self.bridge_source = NULL
+
+    def __init__(self, Session session):
+        self.cluster = session.cluster
+        self.bridge = session.cluster.bridge
+        self.bridge_source = new BridgeSource(self.bridge.posix_to_python, 0)
+        self.bridge_source.coalesce_wakeups = self.cluster.coalesce_wakeups
+        self.token = 0
+        self.in_flight = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.error = None
+        self.waiters = []
+
+    def __dealloc__(self):
+        # The callbacks of the requests still in flight, if any, hold their
+        # own reference to the source.
+        if self.bridge_source != NULL:
+            self.bridge_source.release()
+
+    def in_flight_requests(self):
+        return self.in_flight
+
+    def succeeded_requests(self):
+        return self.succeeded
+
+    def failed_requests(self):
+        return self.failed
+
+    def last_error(self):
+        """ Returns the exception of the last failed request, None if
+        none failed.
+        """
+        return self.error
+
+    async def drain(self):
+        """ Waits until all of the requests in flight complete.
+
+        Raises `RuntimeError` when the cluster is destroyed before, the
+        requests in flight are then accounted as failed.
+        """
+        if self.in_flight == 0:
+            return
+
+        waiter = self.bridge.loop.create_future()
+        self.waiters.append(waiter)
+        await waiter
+
+    cdef _track(self, CassFuture* cass_future):
+        if self.bridge.closed():
+            raise RuntimeError("Cluster destroyed")
+        if self.in_flight == 0:
+            self.token = self.bridge.register(self)
+            self.bridge_source.token = self.token
+        self.bridge_source.retain()
+        error = cass_future_set_callback(
+            cass_future,
+            <CassFutureCallback>posix_to_python_submit_callback,
+            <void*>self.bridge_source
+        )
+        if error != CASS_OK:
+            self.bridge_source.release()
+            if self.in_flight == 0:
+                self.bridge.unregister(self.token)
+            raise_if_error(error)
+        self.in_flight += 1
+
+    cdef void _complete(self, SubmitError* error):
+        self.in_flight -= 1
+        if error == NULL:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+            try:
+                raise_if_error(error.error_code, error.error_message)
+            except Exception as exc:
+                self.error = exc
+
+        if self.in_flight > 0:
+            return
+
+        self.bridge.unregister(self.token)
+        waiters, self.waiters = self.waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    cdef void _abandon(self):
+        """ Accounts the requests in flight as failed, called when the bridge
+        is released since their completions can not be handed over anymore.
+        """
+        if self.in_flight == 0:
+            return
+
+        self.failed += self.in_flight
+        self.in_flight = 0
+        self.error = RuntimeError("Cluster destroyed with submitted requests in flight")
+        self.bridge.unregister(self.token)
+        waiters, self.waiters = self.waiters, []
+        for waiter in waiters:
+            if not waiter.done() and not waiter.get_loop().is_closed():
+                waiter.set_exception(self.error)
@@ -12,6 +12,9 @@ from libc.time cimport time_t
 import_datetime()
 
 
+from decimal import Decimal
+from decimal import InvalidOperation
+
 import re
 
 _duration_re = re.compile(r"(\d+)(y|Y|mo|MO|mO|Mo|w|W|d|D|h|H|s|S|ms|MS|mS|Ms|us|US|uS|Us|µs|µS|ns|NS|nS|Ns|m|M)")
@@ -69,19 +72,32 @@ cdef inline cass_bool_t as_bool(object value) except *:
     raise ValueError(f'Value "{value}" is not boolean.')
 
 
-cdef inline (cass_byte_t*, cass_int32_t) as_cass_decimal(object value) except *:
-    value = str(value) if not isinstance(value, str) else value
-    scale = value.split('.')
-    if not scale[0].isdigit():
-        raise ValueError(f'Bad value for decimal type: "{value}"')
-    if len(scale) == 2:
-        if not scale[1].isdigit():
-            raise ValueError(f'Bad value for decimal type: "{value}"')
-        scale = len(scale[1])
-    else:
-        scale = 0
+cdef inline bytes int_to_varint(object value):
+    """ Returns the big endian two's complement bytes of an int, the fewest
+    that hold it."""
+    return value.to_bytes((~value if value < 0 else value).bit_length() // 8 + 1, "big", signed=True)
+
 
-    return value.encode(), scale
+cdef inline bytes as_cass_varint(object value):
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, int) and not isinstance(value, bool):
+        return int_to_varint(value)
+    raise ValueError(f'Value "{value}" is not int or bytes.')
+
+
+cdef inline tuple as_cass_decimal(object value):
+    """ Returns the unscaled varint and the scale of a decimal."""
+    if not isinstance(value, Decimal):
+        try:
+            value = Decimal(str(value))
+        except InvalidOperation:
+            raise ValueError(f'Bad value for decimal type: "{value}"')
+    sign, digits, exponent = value.as_tuple()
+    if not isinstance(exponent, int):
+        raise ValueError(f'Bad value for decimal type: "{value}"')
+    unscaled = int("".join(map(str, digits)))
+    return int_to_varint(-unscaled if sign else unscaled), -exponent
 
 
 cdef inline CassUuid as_cass_uuid(object value) except *:
@@ -203,9 +219,11 @@ cdef inline void bind_collection_by_value_type(CassCollection* collection, objec
                              CASS_VALUE_TYPE_VARCHAR):
         error = cass_collection_append_string(collection, as_bytes(value))
     elif cass_value_type in (CASS_VALUE_TYPE_BLOB,
-                             CASS_VALUE_TYPE_VARINT,
                              CASS_VALUE_TYPE_CUSTOM):
         error = cass_collection_append_bytes(collection, as_blob(value), len(value))
+    elif cass_value_type == CASS_VALUE_TYPE_VARINT:
+        value = as_cass_varint(value)
+        error = cass_collection_append_bytes(collection, value, len(value))
     elif cass_value_type == CASS_VALUE_TYPE_DECIMAL:
         value, scale = as_cass_decimal(value)
         error = cass_collection_append_decimal(collection, value, len(value), scale)
@@ -319,9 +337,11 @@ cdef inline void bind_tuple_by_value_type(CassTuple* cass_tuple, size_t index, o
                              CASS_VALUE_TYPE_VARCHAR):
         error = cass_tuple_set_string(cass_tuple, index, as_bytes(value))
     elif cass_value_type in (CASS_VALUE_TYPE_BLOB,
-                             CASS_VALUE_TYPE_VARINT,
                              CASS_VALUE_TYPE_CUSTOM):
         error = cass_tuple_set_bytes(cass_tuple, index, as_blob(value), len(value))
+    elif cass_value_type == CASS_VALUE_TYPE_VARINT:
+        value = as_cass_varint(value)
+        error = cass_tuple_set_bytes(cass_tuple, index, value, len(value))
     elif cass_value_type == CASS_VALUE_TYPE_DECIMAL:
         value, scale = as_cass_decimal(value)
         error = cass_tuple_set_decimal(cass_tuple, index, value, len(value), scale)
@@ -424,9 +444,11 @@ cdef inline bind_udt_value_by_name(CassUserType* user_type, bytes name, object v
                              CASS_VALUE_TYPE_VARCHAR):
         error = cass_user_type_set_string_by_name(user_type, name, as_bytes(value))
     elif cass_value_type in (CASS_VALUE_TYPE_BLOB,
-                             CASS_VALUE_TYPE_VARINT,
                              CASS_VALUE_TYPE_CUSTOM):
         error = cass_user_type_set_bytes_by_name(user_type, name, as_blob(value), len(value))
+    elif cass_value_type == CASS_VALUE_TYPE_VARINT:
+        value = as_cass_varint(value)
+        error = cass_user_type_set_bytes_by_name(user_type, name, value, len(value))
     elif cass_value_type in (CASS_VALUE_TYPE_UUID,
                              CASS_VALUE_TYPE_TIMEUUID):
         error = cass_user_type_set_uuid_by_name(user_type, name, as_cass_uuid(value))
@@ -492,9 +514,11 @@ cdef inline bind_udt_value_by_index(CassUserType* user_type, size_t index, objec
                              CASS_VALUE_TYPE_VARCHAR):
         error = cass_user_type_set_string(user_type, index, as_bytes(value))
     elif cass_value_type in (CASS_VALUE_TYPE_BLOB,
-                             CASS_VALUE_TYPE_VARINT,
                              CASS_VALUE_TYPE_CUSTOM):
         error = cass_user_type_set_bytes(user_type, index, as_blob(value), len(value))
+    elif cass_value_type == CASS_VALUE_TYPE_VARINT:
+        value = as_cass_varint(value)
+        error = cass_user_type_set_bytes(user_type, index, value, len(value))
     elif cass_value_type in (CASS_VALUE_TYPE_UUID,
                              CASS_VALUE_TYPE_TIMEUUID):
         error = cass_user_type_set_uuid(user_type, index, as_cass_uuid(value))
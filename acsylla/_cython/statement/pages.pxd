@@ -0,0 +1,10 @@
+cdef class PageQueue:
+    cdef:
+        Statement statement
+        int prefetch
+        object max_buffered_bytes
+        # Bytes of the pages fetched and not consumed yet.
+        size_t buffered_bytes
+        object queue
+        object slots
+        object drained
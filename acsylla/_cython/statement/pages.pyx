@@ -0,0 +1,72 @@
+cdef class PageQueue:
+    """ Fetches the pages of a statement one after the other from a task,
+    up to `prefetch` pages ahead of the one being consumed, and hands them
+    over through a bounded queue.
+
+    When `max_buffered_bytes` is set no new page is fetched while the pages
+    not consumed yet hold at least that many bytes of values, one page is
+    always fetched ahead whatever its size.
+
+    Iterating it asynchronously yields the `Result` of each page. The queue
+    drops a page once it is consumed, its `CassResult` is freed as soon as
+    the caller drops it too.
+    """
+
+    def __init__(self, Statement statement, int prefetch=1, object max_buffered_bytes=None):
+        if prefetch < 1:
+            raise ValueError("`prefetch` must be greater than 0")
+        if max_buffered_bytes is not None and max_buffered_bytes < 1:
+            raise ValueError("`max_buffered_bytes` must be greater than 0")
+        self.statement = statement
+        self.prefetch = prefetch
+        self.max_buffered_bytes = max_buffered_bytes
+        self.buffered_bytes = 0
+        self.queue = asyncio.Queue(maxsize=prefetch)
+        # A slot is taken per page fetched ahead and given back once the
+        # page is consumed.
+        self.slots = asyncio.Semaphore(prefetch)
+        self.drained = asyncio.Event()
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        fetcher = asyncio.create_task(self._fetch())
+        try:
+            while True:
+                result, size = await self.queue.get()
+                if result is None:
+                    break
+                if isinstance(result, BaseException):
+                    raise result
+                self.slots.release()
+                self.buffered_bytes -= size
+                self.drained.set()
+                yield result
+                result = None
+        finally:
+            fetcher.cancel()
+
+    async def _fetch(self):
+        cdef Statement statement = self.statement
+        cdef Result result
+        cdef size_t size
+
+        try:
+            while True:
+                await self.slots.acquire()
+                while self.max_buffered_bytes is not None and self.buffered_bytes >= self.max_buffered_bytes:
+                    self.drained.clear()
+                    await self.drained.wait()
+                result = await statement.session.execute(statement, native_types=statement.native_types)
+                size = result.payload_size() if self.max_buffered_bytes is not None else 0
+                self.buffered_bytes += size
+                await self.queue.put((result, size))
+                if not result.has_more_pages():
+                    break
+                statement.set_page_state(result.page_state())
+                result = None
+        except Exception as exc:
+            await self.queue.put((exc, 0))
+            return
+        await self.queue.put((None, 0))
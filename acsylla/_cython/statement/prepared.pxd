@@ -7,6 +7,8 @@ cdef class PreparedStatement:
         object serial_consistency
         object execution_profile
         object native_types
+        object row_factory
+        object decode_options
 
     @staticmethod
     cdef PreparedStatement new_(Session session,
@@ -15,4 +17,5 @@ cdef class PreparedStatement:
                                 object consistency,
                                 object serial_consistency,
                                 object execution_profile,
-                                object native_types)
+                                object native_types,
+                                object row_factory)
@@ -7,7 +7,7 @@ cdef class PreparedStatement:
         cass_prepared_free(self.cass_prepared)
 
     @staticmethod
-    cdef PreparedStatement new_(Session session, const CassPrepared* cass_prepared, object timeout, object consistency, object serial_consistency, object execution_profile, object native_types):
+    cdef PreparedStatement new_(Session session, const CassPrepared* cass_prepared, object timeout, object consistency, object serial_consistency, object execution_profile, object native_types, object row_factory):
         cdef PreparedStatement prepared
 
         prepared = PreparedStatement()
@@ -18,9 +18,10 @@ cdef class PreparedStatement:
         prepared.serial_consistency = serial_consistency
         prepared.execution_profile = execution_profile
         prepared.native_types = native_types
+        prepared.row_factory = row_factory
         return prepared
 
-    def bind(self, object parameters=None, object page_size=None, object page_state=None, timeout=None, consistency=None, serial_consistency=None, execution_profile=None, native_types=None):
+    def bind(self, object parameters=None, object page_size=None, object page_state=None, timeout=None, consistency=None, serial_consistency=None, execution_profile=None, native_types=None, row_factory=None, decode_options=None):
         cdef CassStatement* cass_statement
         cdef Statement statement
         execution_profile = execution_profile or self.execution_profile
@@ -37,6 +38,12 @@ cdef class PreparedStatement:
             execution_profile,
             native_types or self.native_types,
         )
+        if row_factory is not None:
+            row_factory_kind(row_factory)
+            statement.row_factory = row_factory
+        else:
+            statement.row_factory = self.row_factory
+        statement.decode_options = decode_options or self.decode_options
         if parameters is not None:
             if isinstance(parameters, list):
                 statement.bind_list(parameters, None)
@@ -48,8 +55,11 @@ cdef class PreparedStatement:
                 raise ValueError(f'`parameters` must be `list`, `tuple` or `dict` but not {type(parameters)}')
         return statement
 
+    def execute_sync(self, object parameters=None, native_types=None, row_factory=None):
+        return self.session.execute_sync(self.bind(parameters), native_types=native_types, row_factory=row_factory)
+
     def set_execution_profile(self, name):
         self.execution_profile = name
 
-    def __call__(self, object parameters=None, object page_size=None, object page_state=None, timeout=None, consistency=None, serial_consistency=None, execution_profile=None, native_types=None):
-        return self.bind(parameters, page_size, page_state, timeout, consistency, serial_consistency, execution_profile, native_types)
+    def __call__(self, object parameters=None, object page_size=None, object page_state=None, timeout=None, consistency=None, serial_consistency=None, execution_profile=None, native_types=None, row_factory=None, decode_options=None):
+        return self.bind(parameters, page_size, page_state, timeout, consistency, serial_consistency, execution_profile, native_types, row_factory, decode_options)
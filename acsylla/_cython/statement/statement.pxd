@@ -6,6 +6,16 @@ cdef class Statement:
         const CassPrepared* cass_prepared
         public object tracing_enabled
         public object native_types
+        public object row_factory
+        public object decode_options
+        # Pages fetched ahead and bytes they can hold when iterating the
+        # statement asynchronously.
+        public int prefetch
+        public object max_buffered_bytes
+        # Key of the prepared statements cache of the session and the
+        # arguments for binding it again, set by `Session.query`.
+        object cache_key
+        object cache_args
 
     @staticmethod
     cdef Statement new_from_string(str statement_str,
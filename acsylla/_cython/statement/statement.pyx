@@ -14,26 +14,32 @@ cdef class Statement:
 
     def __cinit__(self):
         self.cass_statement = NULL
+        self.prefetch = 1
 
     def __dealloc__(self):
         cass_statement_free(self.cass_statement)
 
     async def __aiter__(self):
-        result = await self.session.execute(self, native_types=self.native_types)
-        while True:
-            if result.has_more_pages():
-                self.set_page_state(result.page_state())
-                future_result = asyncio.create_task(
-                    self.session.execute(self, native_types=self.native_types))
-                await asyncio.sleep(0)
-            else:
-                future_result = None
+        async for result in PageQueue(self, self.prefetch, self.max_buffered_bytes):
             for row in result:
                 yield row
-            if future_result is not None:
-                result = await future_result
-            else:
-                break
+            # Frees the page before waiting for the next one.
+            row = result = None
+
+    async def arrow_batches(self, object prefetch=None, object max_buffered_bytes=None):
+        """ Yields an Arrow `RecordBatch` per page, only the page being
+        consumed and the ones fetched ahead are kept in memory, by default
+        the ones allowed by the `prefetch` and `max_buffered_bytes` of the
+        statement. Requires PyArrow.
+        """
+        if prefetch is None:
+            prefetch = self.prefetch
+        if max_buffered_bytes is None:
+            max_buffered_bytes = self.max_buffered_bytes
+        async for result in PageQueue(self, prefetch, max_buffered_bytes):
+            batch = result.to_arrow()
+            result = None
+            yield batch
 
     def __await__(self):
         return self.session.execute(self, native_types=self.native_types).__await__()
@@ -52,6 +58,8 @@ cdef class Statement:
                 self.bind_dict(parameters, value_types)
             else:
                 raise ValueError(f'`parameters` must be `list`, `tuple` or `dict` but not {type(parameters)}')
+            if self.cache_args is not None:
+                self.cache_args = (parameters, self.cache_args[1])
 
         if page_size is not None:
             self.set_page_size(page_size)
@@ -159,10 +167,15 @@ cdef class Statement:
             statement.set_execution_profile(execution_profile)
         return statement
 
-    async def execute(self, native_types=None):
+    async def execute(self, native_types=None, row_factory=None):
         if self.prepared == 0 and not self.session:
             raise RuntimeError("Method only available for statements created from session. Use session.execute(statement)")
-        return await self.session.execute(self, native_types=native_types)
+        return await self.session.execute(self, native_types=native_types, row_factory=row_factory)
+
+    def execute_sync(self, native_types=None, row_factory=None):
+        if self.prepared == 0 and not self.session:
+            raise RuntimeError("Method only available for statements created from session. Use session.execute_sync(statement)")
+        return self.session.execute_sync(self, native_types=native_types, row_factory=row_factory)
 
     def add_key_index(self, int index):
         error = cass_statement_add_key_index(self.cass_statement, index)
@@ -181,6 +194,8 @@ cdef class Statement:
         if page_state is not None:
             error = cass_statement_set_paging_state_token(self.cass_statement, page_state, len(page_state))
             raise_if_error(error)
+            # The paging state can not be carried over when binding again.
+            self.cache_args = None
 
     def set_timeout(self, object timeout):
         if timeout is not None:
@@ -334,9 +349,11 @@ cdef class Statement:
                                  CASS_VALUE_TYPE_VARCHAR):
             error = cass_statement_bind_string(self.cass_statement, idx, as_bytes(value))
         elif cass_value_type in (CASS_VALUE_TYPE_BLOB,
-                                 CASS_VALUE_TYPE_VARINT,
                                  CASS_VALUE_TYPE_CUSTOM):
             error = cass_statement_bind_bytes(self.cass_statement, idx, as_blob(value), len(value))
+        elif cass_value_type == CASS_VALUE_TYPE_VARINT:
+            value = as_cass_varint(value)
+            error = cass_statement_bind_bytes(self.cass_statement, idx, value, len(value))
         elif cass_value_type in (CASS_VALUE_TYPE_UUID,
                                  CASS_VALUE_TYPE_TIMEUUID):
             error = cass_statement_bind_uuid(self.cass_statement, idx, as_cass_uuid(value))
@@ -428,9 +445,11 @@ cdef class Statement:
                                  CASS_VALUE_TYPE_VARCHAR):
             error = cass_statement_bind_string_by_name(self.cass_statement, name.encode(), as_bytes(value))
         elif cass_value_type in (CASS_VALUE_TYPE_BLOB,
-                                 CASS_VALUE_TYPE_VARINT,
                                  CASS_VALUE_TYPE_CUSTOM):
             error = cass_statement_bind_bytes_by_name(self.cass_statement, name.encode(), as_blob(value), len(value))
+        elif cass_value_type == CASS_VALUE_TYPE_VARINT:
+            value = as_cass_varint(value)
+            error = cass_statement_bind_bytes_by_name(self.cass_statement, name.encode(), value, len(value))
         elif cass_value_type in (CASS_VALUE_TYPE_UUID,
                                  CASS_VALUE_TYPE_TIMEUUID):
             error = cass_statement_bind_uuid_by_name(self.cass_statement, name.encode(), as_cass_uuid(value))
@@ -477,8 +496,12 @@ def create_statement(
     object consistency=None,
     object serial_consistency=None,
     str execution_profile=None,
-    object native_types=False):
+    object native_types=False,
+    object row_factory=None,
+    object decode_options=None):
     cdef Statement statement
+
+    row_factory_kind(row_factory)
     statement = Statement.new_from_string(
         statement_str,
         parameters,
@@ -491,4 +514,6 @@ def create_statement(
         execution_profile,
         native_types,
     )
+    statement.row_factory = row_factory
+    statement.decode_options = decode_options
     return statement
@@ -4,6 +4,7 @@ types in your functions."""
 from abc import ABCMeta
 from abc import abstractmethod
 from acsylla._cython import cyacsylla
+from array import array
 from dataclasses import dataclass
 from datetime import date
 from datetime import datetime
@@ -13,7 +14,9 @@ from decimal import Decimal
 from enum import Enum
 from ipaddress import IPv4Address
 from ipaddress import IPv6Address
+from typing import Any
 from typing import AsyncIterable
+from typing import AsyncIterator
 from typing import Awaitable
 from typing import Callable
 from typing import Dict
@@ -679,16 +682,45 @@ class Cluster(metaclass=ABCMeta):
         clusters secured with the DseAuthenticator.
         """
 
+    @abstractmethod
+    def set_coalesce_wakeups(self, enabled: bool) -> None:
+        """Sets whether the driver threads coalesce the wakeups of the event
+        loop. When enabled the event loop is only woken up when the queue of
+        completed requests goes from empty to non empty, and all of the
+        pending completions are handled in a single pass.
+        Default: True
+        """
+
+    @abstractmethod
+    def set_materialize_results(self, enabled: bool) -> None:
+        """Sets whether the result, the error and the tracing id of the
+        executed statements and batches are read by the driver IO threads
+        before waking up the event loop, which then only wraps them.
+        Default: False
+        """
+
     def get_logger(self) -> "Logger":
         """Returns the `Logger` instance"""
 
     @abstractmethod
-    async def create_session(self, keyspace: Optional[str] = None) -> "Session":
+    async def create_session(
+        self,
+        keyspace: Optional[str] = None,
+        prepared_cache_size: Optional[int] = None,
+        decode_options: Optional["DecodeOptions"] = None,
+    ) -> "Session":
         """Returns a new session by using the Cluster configuration.
 
         If Keyspace is provided, the session will be bound to the keyspace and
         any statment, unlesss says the opposite, will be using that keyspace.
 
+        If `prepared_cache_size` is provided, the statements created with
+        `Session.query` are prepared automatically and up to that number of
+        prepared statements are kept, evicting the least recently used ones.
+
+        `decode_options` are the `DecodeOptions` used by the statements that
+        do not have their own.
+
         The coroutine will try to make a connection to the cluster hosts.
         """
 
@@ -866,6 +898,10 @@ class Session(metaclass=ABCMeta):
         serial_consistency: Optional["Consistency"] = None,
         execution_profile: Optional[str] = None,
         native_types: Optional[bool] = None,
+        row_factory: Optional[Union["RowFactory", Callable[..., Any]]] = None,
+        decode_options: Optional["DecodeOptions"] = None,
+        prefetch: int = 1,
+        max_buffered_bytes: Optional[int] = None,
     ) -> Union["Statement", AsyncIterable, Awaitable["Result"]]:
         """
         Creates a new statement.
@@ -886,18 +922,137 @@ class Session(metaclass=ABCMeta):
         `execution_profile` Assign the execution profile to the statement
 
         `native_types` Returns values as native types. Default: False
+
+        `row_factory` Builds the rows of the results, see `Session.execute`.
+
+        `decode_options` Decodes the values of the results with these `DecodeOptions`
+        instead of the ones of the session.
+
+        `prefetch` Number of pages fetched ahead of the one being consumed when the statement is
+        iterated asynchronously. Default: 1
+
+        `max_buffered_bytes` Stops fetching pages ahead while the ones not consumed yet hold at least
+        these bytes of values, one page is always fetched ahead. Default: None, no limit.
+
+        When the session was created with a `prepared_cache_size` and no `value_types` are given,
+        the first execution of the statement prepares it in the background, and the next calls
+        return a statement bound against the cached prepared statement.
+        """
+
+    @abstractmethod
+    async def execute(
+        self,
+        statement: "Statement",
+        native_types: Optional[bool] = None,
+        row_factory: Optional[Union["RowFactory", Callable[..., Any]]] = None,
+    ) -> "Result":
+        """Executes an statement and returns the result.
+
+        `row_factory` Sets what iterating the result yields, by default the
+        one of the statement. `RowFactory.TUPLE` or `tuple`, `RowFactory.DICT`
+        or `dict` and `RowFactory.NAMED_TUPLE` build the rows straight away,
+        any other callable, a dataclass for instance, is called with the
+        values of each row as keyword arguments. `Row` instances by default.
+        """
+
+    @abstractmethod
+    def execute_sync(
+        self,
+        statement: "Statement",
+        native_types: Optional[bool] = None,
+        row_factory: Optional[Union["RowFactory", Callable[..., Any]]] = None,
+    ) -> "Result":
+        """Executes an statement blocking the calling thread until the result
+        is available, and returns the result.
+
+        The GIL is released while waiting and the event loop is not involved,
+        so it can be called from threads that do not run one.
+        """
+
+    @abstractmethod
+    def submit(self, statement: "Statement", tracker: Optional["CompletionTracker"] = None) -> None:
+        """Executes an statement discarding its result, no `Result` nor any
+        other Python object is created per request.
+
+        Returns immediately, the outcome is only accounted by the `tracker`,
+        by default the one returned by `completion_tracker`.
         """
 
     @abstractmethod
-    async def execute(self, statement: "Statement") -> "Result":
-        """Executes an statement and returns the result."""
+    def completion_tracker(self) -> "CompletionTracker":
+        """Returns the `CompletionTracker` used by `submit` when no tracker
+        is given."""
+
+    @abstractmethod
+    def create_completion_tracker(self) -> "CompletionTracker":
+        """Returns a new `CompletionTracker` for accounting apart a group of
+        submitted requests."""
+
+    @abstractmethod
+    def execute_concurrent(
+        self,
+        prepared: "PreparedStatement",
+        parameters: Iterable[Union[List, Tuple, Dict]],
+        concurrency: int = 100,
+        native_types: Optional[bool] = None,
+    ) -> "ConcurrentExecution":
+        """Executes the prepared statement once per item of `parameters`
+        keeping at most `concurrency` requests in flight. The next request
+        is submitted as soon as one completes, without creating a task per
+        request.
+
+        Returns a `ConcurrentExecution` that can be awaited for getting the
+        outcomes in the order of the parameters, or iterated asynchronously
+        for getting them as they complete.
+        """
 
     @abstractmethod
-    async def create_prepared(self, statement: str, timeout: Optional[float] = None) -> "PreparedStatement":
+    def scan(
+        self,
+        keyspace: str,
+        table: str,
+        columns: Optional[List[str]] = None,
+        splits: Optional[int] = None,
+        concurrency: int = 4,
+        page_size: Optional[int] = None,
+        ordered: bool = False,
+        pages: bool = False,
+        checkpoint: Optional[List["TokenRange"]] = None,
+        timeout: Optional[float] = None,
+        consistency: Optional["Consistency"] = None,
+        execution_profile: Optional[str] = None,
+        native_types: Optional[bool] = None,
+    ) -> "TableScan":
+        """Reads the whole table splitting the Murmur3 token ring into
+        `splits` ranges, by default four per concurrent range, and paging up
+        to `concurrency` of them at once. The partition key is taken from the
+        table metadata.
+
+        `columns` Columns to read, all of them by default. The keyspace, table
+        and column names are quoted, they are matched case sensitively.
+        `ordered` Yields the ranges one after the other following the ring
+        instead of interleaving them.
+        `pages` Yields the `Result` of each page instead of the rows.
+        `checkpoint` Resumes a scan from the progress returned by
+        `TableScan.checkpoint()`.
+        """
+
+    @abstractmethod
+    async def create_prepared(
+        self,
+        statement: str,
+        timeout: Optional[float] = None,
+        row_factory: Optional[Union["RowFactory", Callable[..., Any]]] = None,
+        decode_options: Optional["DecodeOptions"] = None,
+    ) -> "PreparedStatement":
         """Prepares an statement.
 
         By providing a `timeout` all requests built by the prepared statement will use it,
         otherwise timeout provided during the Cluster instantantation will be used. Value expected is seconds.
+
+        `row_factory` Row factory of the statements bound, see `Session.execute`.
+
+        `decode_options` `DecodeOptions` of the statements bound.
         """
 
     @abstractmethod
@@ -918,6 +1073,23 @@ class Session(metaclass=ABCMeta):
     def metrics(self) -> "SessionMetrics":
         """Returns the metrics related to the session."""
 
+    @abstractmethod
+    def bridge_metrics(self) -> "BridgeMetrics":
+        """Returns the counters of the bridge that hands over the driver
+        completions to the event loop, shared by all of the clusters running
+        on the same loop."""
+
+    @abstractmethod
+    def bridge_latency_metrics(self) -> "BridgeLatencyMetrics":
+        """Returns the histograms of the queueing delay of the driver
+        completions, and of the batch size and duration of the passes that
+        hand them over to the event loop."""
+
+    @abstractmethod
+    def prepared_cache_metrics(self) -> "PreparedCacheMetrics":
+        """Returns the counters of the prepared statements cache used by
+        `query`, all of them are zero when the cache is not enabled."""
+
     @abstractmethod
     def speculative_execution_metrics(self) -> "SpeculativeExecutionMetrics":
         """Returns speculative execution performance metrics gathered by the driver."""
@@ -1190,9 +1362,97 @@ class Statement(metaclass=ABCMeta):
         """Sets the name of the user to execute the statement as."""
 
     @abstractmethod
-    async def execute(self, native_types=False) -> "Result":
+    async def execute(self, native_types=False, row_factory=None) -> "Result":
         """Execute an statement and returns the result."""
 
+    @abstractmethod
+    def execute_sync(self, native_types=None, row_factory=None) -> "Result":
+        """Execute an statement blocking the calling thread and returns the
+        result, see `Session.execute_sync`."""
+
+    @abstractmethod
+    def arrow_batches(
+        self, prefetch: Optional[int] = None, max_buffered_bytes: Optional[int] = None
+    ) -> AsyncIterator[Any]:
+        """Yields an Arrow `RecordBatch` per page, only the page being
+        consumed and the ones fetched ahead are kept in memory, by default
+        the ones allowed by the `prefetch` and `max_buffered_bytes` of the
+        statement. Requires PyArrow, installed with `pip install acsylla[arrow]`."""
+
+
+class CompletionTracker(metaclass=ABCMeta):
+    """Provides a CompletionTracker instance class. Use the
+    `session.completion_tracker()` or `session.create_completion_tracker()`
+    methods for getting an instance.
+
+    Accounts for the requests executed with `session.submit()`."""
+
+    @abstractmethod
+    def in_flight_requests(self) -> int:
+        """Returns the number of submitted requests not completed yet."""
+
+    @abstractmethod
+    def succeeded_requests(self) -> int:
+        """Returns the number of submitted requests that succeeded."""
+
+    @abstractmethod
+    def failed_requests(self) -> int:
+        """Returns the number of submitted requests that failed."""
+
+    @abstractmethod
+    def last_error(self) -> Optional[Exception]:
+        """Returns the exception of the last failed request, None if none
+        failed."""
+
+    @abstractmethod
+    async def drain(self) -> None:
+        """Waits until all of the requests in flight complete."""
+
+
+class TableScan(AsyncIterable, metaclass=ABCMeta):
+    """Provides a TableScan instance class. Use the `session.scan()`
+    method for creating a new instance.
+
+    Iterating it asynchronously yields the rows, or the `Result` of each
+    page when created with `pages` enabled. Can only be iterated once."""
+
+    @abstractmethod
+    def __aiter__(self) -> AsyncIterator[Union["Row", "Result"]]:
+        """Yields the rows or the pages of the token ranges."""
+
+    @abstractmethod
+    def checkpoint(self) -> List["TokenRange"]:
+        """Returns the progress of each token range. A range only moves
+        forward once its page has been consumed, so pages not consumed yet
+        are fetched again when resumed."""
+
+
+class ConcurrentExecution(Awaitable[List[Union["Result", Exception]]], metaclass=ABCMeta):
+    """Provides a ConcurrentExecution instance class. Use the
+    `session.execute_concurrent()` method for creating a new instance.
+
+    The outcome of each request is either its `Result` or the exception it
+    raised, errors do not stop the rest of the requests."""
+
+    @abstractmethod
+    def __await__(self):
+        """Waits for all of the requests and returns their outcomes in the
+        order of the parameters."""
+
+    @abstractmethod
+    def __aiter__(self) -> AsyncIterator[Tuple[int, Union["Result", Exception]]]:
+        """Yields `(index, outcome)` tuples as the requests complete. The
+        outcomes not consumed yet count against the concurrency."""
+
+    @abstractmethod
+    def cancel(self) -> None:
+        """Stops submitting new requests, the ones in flight are left to
+        complete."""
+
+    @abstractmethod
+    def in_flight_requests(self) -> int:
+        """Returns the number of requests in flight."""
+
 
 class PreparedStatement(metaclass=ABCMeta):
     """Provides a PreparedStatement instance class. Use the
@@ -1208,6 +1468,9 @@ class PreparedStatement(metaclass=ABCMeta):
         consistency=None,
         serial_consistency=None,
         execution_profile: Optional[str] = None,
+        native_types: Optional[bool] = None,
+        row_factory: Optional[Union["RowFactory", Callable[..., Any]]] = None,
+        decode_options: Optional["DecodeOptions"] = None,
     ) -> Union[Statement, AsyncIterable, Awaitable["Result"]]:
         """Returns a new statment using the prepared.
 
@@ -1218,6 +1481,8 @@ class PreparedStatement(metaclass=ABCMeta):
         `consistency` Set Consistency
         `serial_consistency` set Serial consistency
         `execution_profile` Set execution_profile
+        `row_factory` Set the row factory, the one of the prepared by default
+        `decode_options` Set the decode options, the ones of the prepared by default
         """
 
     @abstractmethod
@@ -1230,6 +1495,9 @@ class PreparedStatement(metaclass=ABCMeta):
         consistency=None,
         serial_consistency=None,
         execution_profile: Optional[str] = None,
+        native_types: Optional[bool] = None,
+        row_factory: Optional[Union["RowFactory", Callable[..., Any]]] = None,
+        decode_options: Optional["DecodeOptions"] = None,
     ) -> Union[Statement, AsyncIterable, Awaitable["Result"]]:
         """Returns a new statment using the prepared.
 
@@ -1240,6 +1508,19 @@ class PreparedStatement(metaclass=ABCMeta):
         `consistency` Set Consistency
         `serial_consistency` set Serial consistency
         `execution_profile` Set execution_profile
+        `row_factory` Set the row factory, the one of the prepared by default
+        `decode_options` Set the decode options, the ones of the prepared by default
+        """
+
+    @abstractmethod
+    def execute_sync(
+        self,
+        parameters: Optional[Union[List, Tuple, Dict]] = None,
+        native_types: Optional[bool] = None,
+        row_factory: Optional[Union["RowFactory", Callable[..., Any]]] = None,
+    ) -> "Result":
+        """Binds the parameters to a new statement using the prepared and
+        executes it blocking the calling thread, see `Session.execute_sync`.
         """
 
     @abstractmethod
@@ -1358,6 +1639,23 @@ class Result(Iterator[T], metaclass=ABCMeta):
         If there is no rows iterator returns no rows.
         """
 
+    @abstractmethod
+    def fetchall(self, row_factory: Optional[Union["RowFactory", Callable[..., Any]]] = None) -> List[Any]:
+        """Returns a list with the rows not fetched yet by `fetchmany` or
+        `fetchall`, built in a single loop without a generator.
+
+        By default the rows are built by the row factory of the result, or
+        as tuples when it yields `Row` objects. `row_factory` takes the same
+        values but `RowFactory.ROW`.
+        """
+
+    @abstractmethod
+    def fetchmany(self, n: int, row_factory: Optional[Union["RowFactory", Callable[..., Any]]] = None) -> List[Any]:
+        """Returns a list with the next `n` rows not fetched yet, fewer when
+        there are not as many and an empty one once all of them were fetched.
+        Rows are built like `fetchall` does.
+        """
+
     @abstractmethod
     def has_more_pages(self) -> bool:
         """Returns true if there is still pages to be fetched"""
@@ -1373,6 +1671,58 @@ class Result(Iterator[T], metaclass=ABCMeta):
         an statement for returning the next page.
         """
 
+    @abstractmethod
+    def to_columns(
+        self, null_masks: bool = False
+    ) -> Union[Dict[str, Union[array, list]], Tuple[Dict[str, Union[array, list]], Dict[str, array]]]:
+        """Returns the values of the result by column, as a dictionary of
+        column names, walking the rows once without creating a `Row` nor a
+        Python object per fixed width value.
+
+        Columns of tinyint, smallint, int, bigint, counter, float, double,
+        boolean and timestamp types are returned as `array.array`, with the
+        timestamps as milliseconds since the epoch and zero for the null
+        values. The rest of the columns are returned as lists.
+
+        When `null_masks` is enabled returns a tuple with the columns and a
+        dictionary with an `array.array` per column where the null values
+        are flagged with a 1.
+        """
+
+    @abstractmethod
+    def to_numpy(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Returns a tuple with a dictionary of NumPy arrays per column name,
+        and a dictionary of boolean arrays flagging the null values per column
+        name. Requires NumPy, installed with `pip install acsylla[numpy]`.
+
+        Values are written straight into the preallocated arrays. Tinyint,
+        smallint, int, bigint and counter columns are mapped to int8, int16,
+        int32 and int64, float and double to float32 and float64, boolean to
+        bool, timestamp to datetime64[ms] and uuid and timeuuid to 16 bytes
+        void. The rest of the columns are object arrays.
+        """
+
+    @abstractmethod
+    def to_numpy_structured(self) -> Tuple[Any, Any]:
+        """Returns a tuple with a NumPy structured array with a field per
+        column, and a structured boolean array flagging the null values.
+        Uses the same types than `to_numpy`.
+        """
+
+    @abstractmethod
+    def to_arrow(self) -> Any:
+        """Returns the result as an Arrow `RecordBatch`. Requires PyArrow,
+        installed with `pip install acsylla[arrow]`.
+
+        Fixed width columns are handed over to Arrow without copying the
+        values, timestamps are mapped to `timestamp[ms]`. The type of each
+        column only depends on its CQL type, so the batches of all of the
+        pages of a statement share their schema: uuids are `binary(16)`,
+        decimals and varints exact strings, durations
+        `month_day_nano_interval`, collections lists and maps of their
+        element types, tuples and UDTs structs.
+        """
+
 
 class Row(metaclass=ABCMeta):
     """Provides access to a row of a `Result`"""
@@ -1471,6 +1821,128 @@ class SessionMetrics:
     errors_request_timeouts: int
 
 
+@dataclass
+class BridgeMetrics:
+    """Provides the counters of the bridge that hands over the completed
+    requests, log messages and host events from the driver threads to the
+    event loop. The bridge is shared by all of the clusters of the loop."""
+
+    # total of requests completed by the driver threads
+    completions: int
+
+    # total of times the event loop was woken up
+    wakeups: int
+
+    # total of entries that did not fit in the lock-free ring
+    # and fell back to the locked queue
+    overflows: int
+
+
+@dataclass
+class HistogramMetrics:
+    """Provides a snapshot of an histogram with power of two buckets,
+    percentiles are the upper bound of the bucket that holds them."""
+
+    count: int
+    min: int
+    max: int
+    mean: int
+    percentile_50th: int
+    percentile_95th: int
+    percentile_99th: int
+    percentile_999th: int
+
+    # non empty buckets as (upper bound, count) tuples
+    buckets: List[Tuple[int, int]]
+
+
+@dataclass
+class BridgeLatencyMetrics:
+    """Provides the histograms of the hand over of the completed requests
+    from the driver threads to the event loop."""
+
+    # time in microseconds from the driver callback until the request
+    # is resolved by the event loop, per cluster
+    queue_delay: HistogramMetrics
+
+    # entries handled per drain pass, shared by all of the clusters of the loop
+    drain_batch_size: HistogramMetrics
+
+    # time in microseconds spent per drain pass, shared by all of the
+    # clusters of the loop
+    drain_duration: HistogramMetrics
+
+
+@dataclass
+class PreparedCacheMetrics:
+    """Provides the counters of the prepared statements cache of a session."""
+
+    # prepared statements currently cached
+    size: int
+
+    # maximum number of prepared statements, 0 when the cache is disabled
+    max_size: int
+
+    # statements bound against a cached prepared statement
+    hits: int
+
+    # statements executed unprepared while their preparation was requested
+    misses: int
+
+    # least recently used prepared statements evicted for making room
+    evictions: int
+
+
+@dataclass(frozen=True)
+class DecodeOptions:
+    """Provides the options for decoding the values of the results. Given to
+    `Cluster.create_session` they are the default of the session, the ones
+    given to a statement or a prepared statement take precedence."""
+
+    # blob, text, ascii and varchar columns of the rows are returned as read
+    # only `memoryview` of the buffer of the result instead of copies, the
+    # result is kept alive while any of them is
+    zero_copy: bool = False
+    # uuid and timeuuid values are returned as "str", as `uuid.UUID`
+    # instances with "uuid" or as their 16 bytes with "bytes", none of them
+    # goes through the string representation of the driver but "str"
+    uuid: str = "str"
+    # timestamp values are returned as UTC "datetime" or, with "epoch_ms",
+    # as the milliseconds since the epoch stored by the column
+    timestamp: str = "datetime"
+    # text, ascii and varchar columns whose values are decoded through a
+    # cache of `intern_cache_size` entries per column and result, repeated
+    # values return the same `str` object
+    intern_columns: Tuple[str, ...] = ()
+    intern_cache_size: int = 1024
+
+    def __post_init__(self):
+        if self.uuid not in ("str", "uuid", "bytes"):
+            raise ValueError(f"UUID format not supported {self.uuid!r}")
+        if self.timestamp not in ("datetime", "epoch_ms"):
+            raise ValueError(f"Timestamp format not supported {self.timestamp!r}")
+        if isinstance(self.intern_columns, str):
+            raise ValueError("intern_columns expects a sequence of column names")
+        if self.intern_cache_size <= 0:
+            raise ValueError("intern_cache_size must be greater than 0")
+        # frozen, the sequence is stored as a tuple for keeping the options hashable
+        object.__setattr__(self, "intern_columns", tuple(self.intern_columns))
+
+
+@dataclass
+class TokenRange:
+    """Provides a token range of a `TableScan` and its progress, covers
+    the tokens greater than `start` and lower or equal to `end`."""
+
+    start: int
+    end: int
+
+    # page state for fetching the next page, None for the first one
+    page_state: Optional[bytes] = None
+
+    finished: bool = False
+
+
 @dataclass
 class SpeculativeExecutionMetrics:
     """Provides speculative execution metrics.
@@ -1526,6 +1998,21 @@ class Consistency(Enum):
     LOCAL_ONE = cyacsylla.Consistency.LOCAL_ONE
 
 
+class RowFactory(Enum):
+    """Objects built per row when iterating a `Result`.
+
+    ROW - `Row` instances
+    TUPLE - Tuples of the values
+    DICT - Dictionaries by column name
+    NAMED_TUPLE - Named tuples, the class is built once per set of columns
+    """
+
+    ROW = cyacsylla.RowFactory.ROW
+    TUPLE = cyacsylla.RowFactory.TUPLE
+    DICT = cyacsylla.RowFactory.DICT
+    NAMED_TUPLE = cyacsylla.RowFactory.NAMED_TUPLE
+
+
 class ValueType(Enum):
     CUSTOM = cyacsylla.ValueType.CUSTOM
     ASCII = cyacsylla.ValueType.ASCII
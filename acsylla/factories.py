@@ -2,12 +2,14 @@ from . import _cython
 from .base import Batch
 from .base import Cluster
 from .base import Consistency
+from .base import DecodeOptions
 from .base import DseGssapiAuthenticator
 from .base import DseGssapiAuthenticatorProxy
 from .base import DsePlaintextAuthenticator
 from .base import DsePlaintextAuthenticatorProxy
 from .base import LatencyAwareRoutingSettings
 from .base import ProtocolVersion
+from .base import RowFactory
 from .base import SpeculativeExecutionPolicy
 from .base import SSLVerifyFlags
 from .base import Statement
@@ -96,6 +98,8 @@ def create_cluster(
     dse_gssapi_authenticator_proxy: Optional[DseGssapiAuthenticatorProxy] = None,
     dse_plaintext_authenticator: Optional[DsePlaintextAuthenticator] = None,
     dse_plaintext_authenticator_proxy: Optional[DsePlaintextAuthenticatorProxy] = None,
+    coalesce_wakeups: Optional[bool] = True,
+    materialize_results: Optional[bool] = False,
 ) -> Cluster:
     """Instanciates a new cluster.
 
@@ -494,6 +498,18 @@ def create_cluster(
         `dse_plaintext_authenticator_proxy`: Enables plaintext authentication with
             proxy authorization for DSE clusters secured with the DseAuthenticator.
             Instance of `acsylla.DsePlaintextAuthenticatorProxy`
+
+        `coalesce_wakeups`: The driver threads only wake up the event loop when
+            the queue of completed requests goes from empty to non empty, the
+            event loop handles all of the pending completions in a single pass.
+            Disable it for waking up the event loop once per completed request.
+            Default: True
+
+        `materialize_results`: The result, the error and the tracing id of the
+            executed statements and batches are read by the driver IO threads
+            before waking up the event loop, which then only wraps them into
+            a `Result`. Moves work off the thread running the event loop.
+            Default: False
     Returns:
         :class:`acsylla.Cluster` instance.
     """
@@ -609,6 +625,8 @@ def create_cluster(
         dse_gssapi_authenticator_proxy=dse_gssapi_authenticator_proxy,
         dse_plaintext_authenticator=dse_plaintext_authenticator,
         dse_plaintext_authenticator_proxy=dse_plaintext_authenticator_proxy,
+        coalesce_wakeups=coalesce_wakeups,
+        materialize_results=materialize_results,
     )
 
 
@@ -622,6 +640,8 @@ def create_statement(
     serial_consistency: Optional[Consistency] = None,
     execution_profile: Optional[str] = None,
     native_types: Optional[bool] = None,
+    row_factory: Optional[Union[RowFactory, Callable[..., Any]]] = None,
+    decode_options: Optional[DecodeOptions] = None,
 ) -> Statement:
     """
     Creates a new statement.
@@ -642,6 +662,11 @@ def create_statement(
     `execution_profile` Assign the execution profile to the statement
 
     `native_types` Returns values as native types. Default: False
+
+    `row_factory` Builds the rows of the results, see `Session.execute`.
+
+    `decode_options` Decodes the values of the results with these `DecodeOptions` instead of the ones of
+    the session.
     """
     return _cython.cyacsylla.create_statement(
         statement,
@@ -653,6 +678,8 @@ def create_statement(
         serial_consistency=serial_consistency,
         execution_profile=execution_profile,
         native_types=native_types,
+        row_factory=row_factory,
+        decode_options=decode_options,
     )
 
 
@@ -0,0 +1,87 @@
+"""Measures the per request overhead of awaiting the driver completions.
+
+Reports the time spent per request executing statements one after the
+other, and the memory blocks and bytes kept alive per in flight request
+while many requests are waiting for their completion.
+
+Run it against the tree before and after a change of the completion path
+for comparing both numbers, a node listening on 127.0.0.1 is expected.
+
+    python benchmark/awaitable_benchmark.py --requests 20000 --in-flight 1000
+"""
+
+from acsylla import create_cluster
+from acsylla import create_statement
+
+import argparse
+import asyncio
+import gc
+import sys
+import time
+import tracemalloc
+
+QUERY = "SELECT release_version FROM system.local"
+
+
+async def sequential(session, statement, requests: int) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        await session.execute(statement)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+async def in_flight(session, statement, requests: int):
+    gc.collect()
+    tracemalloc.start()
+    blocks_before = sys.getallocatedblocks()
+    size_before, _ = tracemalloc.get_traced_memory()
+
+    tasks = [asyncio.create_task(session.execute(statement)) for _ in range(requests)]
+    # Let every task reach the point where it is waiting for the driver.
+    await asyncio.sleep(0)
+
+    blocks = sys.getallocatedblocks() - blocks_before
+    size, _ = tracemalloc.get_traced_memory()
+    size -= size_before
+    tracemalloc.stop()
+
+    await asyncio.gather(*tasks)
+    return blocks / requests, size / requests
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--requests",
+        help="Number of sequential requests, by default 20000",
+        type=int,
+        default=20000,
+    )
+    parser.add_argument(
+        "--in-flight",
+        help="Number of concurrent requests used for measuring the memory, by default 1000",
+        type=int,
+        default=1000,
+    )
+    args = parser.parse_args()
+
+    cluster = create_cluster(["127.0.0.1"])
+    session = await cluster.create_session()
+    statement = create_statement(QUERY)
+
+    # Warm up the connections and the interpreter caches.
+    await sequential(session, statement, 1000)
+
+    us_per_request = await sequential(session, statement, args.requests)
+    blocks_per_request, bytes_per_request = await in_flight(session, statement, args.in_flight)
+
+    print("Tests results:")
+    print("\tus/request: {0:.2f}".format(us_per_request))
+    print("\tBlocks/in flight request: {0:.1f}".format(blocks_per_request))
+    print("\tBytes/in flight request: {0:.0f}".format(bytes_per_request))
+
+    await session.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,176 @@
+// Micro-benchmark of the queue used for handing over the completions from the
+// driver IO threads to the event loop thread.
+//
+// Compares the mutex protected `std::queue` drained one item per lock
+// acquisition with the lock-free `MpscRing` drained in batches, using 1, 4
+// and 16 producer threads and a single consumer thread.
+//
+// Producers wait while `max_in_flight` items are published but not drained
+// yet, as the driver does with the requests in flight, so with the default
+// limit the ring path is the one measured. The ratio of the items that took
+// the overflow path is reported next to the throughput.
+//
+// Build and run with:
+//
+//     make bench-completion-queue
+//
+// or
+//
+//     g++ -O2 -std=c++14 -pthread -I acsylla/_cython
+//         benchmark/completion_queue_benchmark.cpp -o completion_queue_benchmark
+//     ./completion_queue_benchmark [items_per_producer] [max_in_flight]
+
+#include <atomic>
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <mutex>
+#include <queue>
+#include <thread>
+#include <vector>
+
+#include "mpsc_ring.cpp"
+
+static const size_t RING_CAPACITY = 8192;
+// Leaves room for the pushes racing with the check of the limit.
+static const size_t DEFAULT_MAX_IN_FLIGHT = RING_CAPACITY / 2;
+
+struct MutexQueue {
+    std::mutex mutex;
+    std::queue<void*> queue;
+
+    void push(void* data) {
+        std::lock_guard<std::mutex> lock(mutex);
+        queue.push(data);
+    }
+
+    // Same pattern used by the bridge before, one lock round-trip per item.
+    size_t drain() {
+        size_t drained = 0;
+        while (true) {
+            mutex.lock();
+            if (queue.empty()) {
+                mutex.unlock();
+                break;
+            }
+            queue.pop();
+            mutex.unlock();
+            drained++;
+        }
+        return drained;
+    }
+};
+
+struct RingQueue {
+    MpscRing<void*> ring;
+    std::mutex mutex;
+    std::queue<void*> overflow;
+    std::atomic<bool> overflowed;
+    std::atomic<size_t> overflows;
+
+    RingQueue() : ring(RING_CAPACITY), overflowed(false), overflows(0) {}
+
+    void push(void* data) {
+        if (!ring.try_push(data)) {
+            std::lock_guard<std::mutex> lock(mutex);
+            overflow.push(data);
+            overflowed.store(true, std::memory_order_release);
+            overflows.fetch_add(1, std::memory_order_relaxed);
+        }
+    }
+
+    size_t drain() {
+        size_t drained = 0;
+        void* data;
+        while (ring.try_pop(&data)) {
+            drained++;
+        }
+        if (overflowed.load(std::memory_order_acquire)) {
+            std::lock_guard<std::mutex> lock(mutex);
+            overflowed.store(false, std::memory_order_relaxed);
+            while (!overflow.empty()) {
+                overflow.pop();
+                drained++;
+            }
+        }
+        return drained;
+    }
+};
+
+static size_t overflows_of(MutexQueue&) {
+    return 0;
+}
+
+static size_t overflows_of(RingQueue& queue) {
+    return queue.overflows.load();
+}
+
+template <class Queue>
+static double run(size_t producers, size_t items_per_producer, size_t max_in_flight, size_t* overflows) {
+    Queue queue;
+    std::atomic<bool> start(false);
+    std::atomic<size_t> in_flight(0);
+    std::vector<std::thread> threads;
+    size_t total = producers * items_per_producer;
+
+    for (size_t p = 0; p < producers; p++) {
+        threads.emplace_back([&queue, &start, &in_flight, items_per_producer, max_in_flight]() {
+            while (!start.load(std::memory_order_acquire)) {
+            }
+            for (size_t i = 0; i < items_per_producer; i++) {
+                while (in_flight.load(std::memory_order_acquire) >= max_in_flight) {
+                    std::this_thread::yield();
+                }
+                in_flight.fetch_add(1, std::memory_order_acq_rel);
+                queue.push((void*)(i + 1));
+            }
+        });
+    }
+
+    auto begin = std::chrono::steady_clock::now();
+    start.store(true, std::memory_order_release);
+    size_t consumed = 0;
+    while (consumed < total) {
+        size_t drained = queue.drain();
+        if (drained == 0) {
+            // Lets the producers run when there are less cores than threads.
+            std::this_thread::yield();
+            continue;
+        }
+        in_flight.fetch_sub(drained, std::memory_order_acq_rel);
+        consumed += drained;
+    }
+    auto end = std::chrono::steady_clock::now();
+
+    for (auto& thread : threads) {
+        thread.join();
+    }
+    *overflows = overflows_of(queue);
+    return std::chrono::duration<double>(end - begin).count();
+}
+
+int main(int argc, char** argv) {
+    size_t items_per_producer = argc > 1 ? strtoul(argv[1], NULL, 10) : 1000000;
+    size_t max_in_flight = argc > 2 ? strtoul(argv[2], NULL, 10) : DEFAULT_MAX_IN_FLIGHT;
+    size_t producer_counts[] = {1, 4, 16};
+
+    printf("max in flight %zu, ring capacity %zu\n", max_in_flight, RING_CAPACITY);
+    printf("%-10s %-12s %14s %14s %10s %10s\n", "producers", "queue", "total items", "Mops/sec", "overflows", "overflow%");
+    for (size_t producers : producer_counts) {
+        size_t total = producers * items_per_producer;
+        size_t overflows = 0;
+        double elapsed = run<MutexQueue>(producers, items_per_producer, max_in_flight, &overflows);
+        printf("%-10zu %-12s %14zu %14.2f %10s %10s\n", producers, "mutex", total, total / elapsed / 1e6, "-", "-");
+        elapsed = run<RingQueue>(producers, items_per_producer, max_in_flight, &overflows);
+        printf(
+            "%-10zu %-12s %14zu %14.2f %10zu %9.2f%%\n",
+            producers,
+            "mpsc_ring",
+            total,
+            total / elapsed / 1e6,
+            overflows,
+            100.0 * overflows / total
+        );
+    }
+    return 0;
+}
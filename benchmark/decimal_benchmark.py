@@ -0,0 +1,109 @@
+"""Measures the decoding throughput of a decimal column.
+
+Fills a table with one decimal column, by default 1M cells, then reads it
+page by page and reports how many cells per second are decoded into
+`Decimal` objects and, with `native_types`, into strings. Each page is
+fetched once before timing, only the decoding is measured.
+
+A node listening on 127.0.0.1 is expected.
+
+    python benchmark/decimal_benchmark.py --rows 1000000 --rounds 3
+"""
+
+from acsylla import create_cluster
+from acsylla import create_statement
+from decimal import Decimal
+
+import argparse
+import asyncio
+import time
+
+KEYSPACE = "acsylla_benchmark"
+
+
+async def setup(session, rows: int, concurrency: int):
+    await session.execute(
+        create_statement(
+            f"CREATE KEYSPACE IF NOT EXISTS {KEYSPACE} "
+            "WITH replication = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+        )
+    )
+    await session.execute(create_statement(f"DROP TABLE IF EXISTS {KEYSPACE}.decimal"))
+    await session.execute(create_statement(f"CREATE TABLE {KEYSPACE}.decimal (id int PRIMARY KEY, amount decimal)"))
+
+    prepared = await session.create_prepared(f"INSERT INTO {KEYSPACE}.decimal (id, amount) VALUES (?, ?)")
+    for start in range(0, rows, concurrency):
+        await asyncio.gather(
+            *(
+                session.execute(prepared.bind([i, Decimal(i * 7919 - rows).scaleb(-(i % 5))]))
+                for i in range(start, min(start + concurrency, rows))
+            )
+        )
+
+
+async def fetch(session, page_size: int, native_types: bool) -> list:
+    statement = create_statement(f"SELECT amount FROM {KEYSPACE}.decimal", page_size=page_size)
+    results = []
+    while True:
+        result = await session.execute(statement, native_types=native_types)
+        results.append(result)
+        if not result.has_more_pages():
+            return results
+        statement.set_page_state(result.page_state())
+
+
+def decode(results, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for result in results:
+            for row in result:
+                row.as_tuple()
+    return time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--rows",
+        help="Number of cells of the decimal column, by default 1000000",
+        type=int,
+        default=1_000_000,
+    )
+    parser.add_argument(
+        "--rounds",
+        help="Number of times the column is decoded, by default 3",
+        type=int,
+        default=3,
+    )
+    parser.add_argument(
+        "--concurrency",
+        help="Number of concurrent inserts while filling the table, by default 256",
+        type=int,
+        default=256,
+    )
+    parser.add_argument(
+        "--page-size",
+        help="Number of rows per page, by default 10000",
+        type=int,
+        default=10_000,
+    )
+    args = parser.parse_args()
+
+    cluster = create_cluster(["127.0.0.1"])
+    session = await cluster.create_session()
+    await setup(session, args.rows, args.concurrency)
+
+    print("Tests results:")
+    for name, native_types in [("Decimal", False), ("str", True)]:
+        results = await fetch(session, args.page_size, native_types)
+        # Warm up the interpreter caches.
+        decode(results[:1], 1)
+        elapsed = decode(results, args.rounds)
+        cells = sum(result.count() for result in results) * args.rounds
+        print("\t{0:<8} {1:>12.0f} cells/sec".format(name, cells / elapsed))
+
+    await session.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
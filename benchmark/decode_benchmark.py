@@ -0,0 +1,107 @@
+"""Measures the decoding throughput of the result values, per type.
+
+Fills a table with a column per type, then reads each column alone and
+reports how many cells per second are decoded into Python objects by
+`Row.as_tuple()`. The results are fetched once before timing, only the
+decoding is measured.
+
+Run it against the tree before and after a change of the decoding path
+for comparing both numbers, a node listening on 127.0.0.1 is expected.
+
+    python benchmark/decode_benchmark.py --rows 5000 --rounds 20
+"""
+
+from acsylla import create_cluster
+from acsylla import create_statement
+from datetime import date
+from datetime import datetime
+from datetime import time as time_
+from datetime import timezone
+from uuid import uuid4
+
+import argparse
+import asyncio
+import time
+
+KEYSPACE = "acsylla_benchmark"
+
+COLUMNS = {
+    "value_int": ("int", lambda i: i),
+    "value_bigint": ("bigint", lambda i: i * 1_000_000_007),
+    "value_double": ("double", lambda i: i / 3),
+    "value_bool": ("boolean", lambda i: i % 2 == 0),
+    "value_text": ("text", lambda i: f"text {i}"),
+    "value_blob": ("blob", lambda i: i.to_bytes(8, "big") * 4),
+    "value_timestamp": ("timestamp", lambda i: datetime.fromtimestamp(i, timezone.utc)),
+    "value_uuid": ("uuid", lambda i: str(uuid4())),
+    "value_date": ("date", lambda i: date.fromordinal(730000 + i % 10000)),
+    "value_time": ("time", lambda i: time_(i % 24, i % 60, i % 60)),
+    "value_list": ("list<int>", lambda i: list(range(i % 8))),
+    "value_set": ("set<text>", lambda i: {str(j) for j in range(i % 8)}),
+    "value_map": ("map<text, int>", lambda i: {str(j): j for j in range(i % 8)}),
+    "value_tuple": ("tuple<int, text>", lambda i: (i, str(i))),
+}
+
+
+async def setup(session, rows: int):
+    await session.execute(
+        create_statement(
+            f"CREATE KEYSPACE IF NOT EXISTS {KEYSPACE} "
+            "WITH replication = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+        )
+    )
+    await session.execute(create_statement(f"DROP TABLE IF EXISTS {KEYSPACE}.decode"))
+    columns = ", ".join(f"{name} {type_}" for name, (type_, _) in COLUMNS.items())
+    await session.execute(create_statement(f"CREATE TABLE {KEYSPACE}.decode (id int PRIMARY KEY, {columns})"))
+
+    names = ", ".join(COLUMNS)
+    markers = ", ".join("?" for _ in COLUMNS)
+    prepared = await session.create_prepared(f"INSERT INTO {KEYSPACE}.decode (id, {names}) VALUES (?, {markers})")
+    for i in range(rows):
+        values = [factory(i) for _, factory in COLUMNS.values()]
+        await session.execute(prepared.bind([i] + values))
+
+
+def decode(result, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for row in result:
+            row.as_tuple()
+    return time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--rows",
+        help="Number of rows of the table, by default 5000",
+        type=int,
+        default=5000,
+    )
+    parser.add_argument(
+        "--rounds",
+        help="Number of times each result is decoded, by default 20",
+        type=int,
+        default=20,
+    )
+    args = parser.parse_args()
+
+    cluster = create_cluster(["127.0.0.1"])
+    session = await cluster.create_session()
+    await setup(session, args.rows)
+
+    print("Tests results:")
+    for name, (type_, _) in COLUMNS.items():
+        statement = create_statement(f"SELECT {name} FROM {KEYSPACE}.decode", page_size=args.rows)
+        result = await session.execute(statement)
+        # Warm up the interpreter caches.
+        decode(result, 1)
+        elapsed = decode(result, args.rounds)
+        cells = result.count() * args.rounds
+        print("\t{0:<18} {1:>12.0f} cells/sec".format(type_, cells / elapsed))
+
+    await session.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
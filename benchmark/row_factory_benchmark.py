@@ -0,0 +1,107 @@
+"""Compares the row factories with building dictionaries through `Row.as_dict()`.
+
+Fills a table of 20 columns, then iterates the same result with each
+row factory and reports the rows built per second. The result is fetched
+once before timing, only the building of the rows is measured.
+
+A node listening on 127.0.0.1 is expected.
+
+    python benchmark/row_factory_benchmark.py --rows 5000 --rounds 20
+"""
+
+from acsylla import create_cluster
+from acsylla import create_statement
+from acsylla import RowFactory
+from dataclasses import make_dataclass
+
+import argparse
+import asyncio
+import time
+
+KEYSPACE = "acsylla_benchmark"
+COLUMNS = 20
+
+NAMES = [f"value_{i}" for i in range(COLUMNS)]
+
+Record = make_dataclass("Record", ["id"] + NAMES)
+
+
+async def setup(session, rows: int):
+    await session.execute(
+        create_statement(
+            f"CREATE KEYSPACE IF NOT EXISTS {KEYSPACE} "
+            "WITH replication = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+        )
+    )
+    await session.execute(create_statement(f"DROP TABLE IF EXISTS {KEYSPACE}.row_factory"))
+    columns = ", ".join(f"{name} {'int' if i % 2 else 'text'}" for i, name in enumerate(NAMES))
+    await session.execute(create_statement(f"CREATE TABLE {KEYSPACE}.row_factory (id int PRIMARY KEY, {columns})"))
+
+    markers = ", ".join("?" for _ in NAMES)
+    prepared = await session.create_prepared(
+        f"INSERT INTO {KEYSPACE}.row_factory (id, {', '.join(NAMES)}) VALUES (?, {markers})"
+    )
+    for row in range(rows):
+        values = [row * i if i % 2 else f"text {row} {i}" for i in range(COLUMNS)]
+        await session.execute(prepared.bind([row] + values))
+
+
+def iterate(result, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for row in result:
+            pass
+    return time.perf_counter() - start
+
+
+def iterate_as_dict(result, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for row in result:
+            row.as_dict()
+    return time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--rows",
+        help="Number of rows of the table, by default 5000",
+        type=int,
+        default=5000,
+    )
+    parser.add_argument(
+        "--rounds",
+        help="Number of times each result is iterated, by default 20",
+        type=int,
+        default=20,
+    )
+    args = parser.parse_args()
+
+    cluster = create_cluster(["127.0.0.1"])
+    session = await cluster.create_session()
+    await setup(session, args.rows)
+
+    statement = create_statement(f"SELECT * FROM {KEYSPACE}.row_factory", page_size=args.rows)
+    runs = [
+        ("Row.as_dict()", None, iterate_as_dict),
+        ("RowFactory.TUPLE", RowFactory.TUPLE, iterate),
+        ("RowFactory.DICT", RowFactory.DICT, iterate),
+        ("RowFactory.NAMED_TUPLE", RowFactory.NAMED_TUPLE, iterate),
+        ("dataclass", Record, iterate),
+    ]
+
+    print("Tests results:")
+    for name, row_factory, run in runs:
+        result = await session.execute(statement, row_factory=row_factory)
+        # Warm up the interpreter caches.
+        run(result, 1)
+        elapsed = run(result, args.rounds)
+        rows = result.count() * args.rounds
+        print("\t{0:<24} {1:>12.0f} rows/sec".format(name, rows / elapsed))
+
+    await session.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
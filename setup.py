@@ -82,7 +82,7 @@ setup(
     packages=["acsylla"],
     cmdclass={"build_ext": acsylla_build_ext},
     ext_modules=[extension],
-    extras_require={"dev": dev_requires},
+    extras_require={"dev": dev_requires, "numpy": ["numpy"], "arrow": ["pyarrow"]},
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Programming Language :: Python :: 3 :: Only",
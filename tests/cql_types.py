@@ -273,7 +273,19 @@ native_types = {
     },
     "varint": {
         "value_type": ValueType.VARINT,
-        "valid": [(b"9223372036854775807", b"9223372036854775807")],
+        "valid": [
+            (b"9223372036854775807", int.from_bytes(b"9223372036854775807", "big", signed=True)),
+            (9223372036854775807, 9223372036854775807),
+            (-(2**70), -(2**70)),
+            (0, 0),
+            (-1, -1),
+            (127, 127),
+            (128, 128),
+            (-128, -128),
+            (-129, -129),
+            (2**64, 2**64),
+            (2**127 - 1, 2**127 - 1),
+        ],
         "invalid": [("varint_variant", ValueError), ("1234", ValueError)],
     },
 }
@@ -1,4 +1,6 @@
 from acsylla import Consistency
+from acsylla import DecodeOptions
+from uuid import UUID
 
 import pytest
 
@@ -59,3 +61,50 @@ class TestPreparedStatement:
         async for row in prepared.bind():
             assert row[1] in values_list
             assert row["value"] in values_list
+
+    async def test_execute_sync(self, session):
+        prepared = await session.create_prepared("INSERT INTO test (id, value) values( ?, ?)")
+        prepared.execute_sync([1, 1])
+
+        prepared = await session.create_prepared("SELECT id, value FROM test WHERE id = ?")
+        result = prepared.execute_sync([1])
+        assert result.first().value == 1
+
+    async def test_execute_concurrent(self, session):
+        prepared = await session.create_prepared("INSERT INTO test (id, value) values( ?, ?)")
+        outcomes = await session.execute_concurrent(prepared, ([i, i] for i in range(1000)), concurrency=16)
+        assert len(outcomes) == 1000
+        assert not any(isinstance(outcome, Exception) for outcome in outcomes)
+
+        prepared = await session.create_prepared("SELECT id, value FROM test WHERE id = ?")
+        outcomes = await session.execute_concurrent(prepared, [[i] for i in range(100)], concurrency=8)
+        assert [outcome.first().value for outcome in outcomes] == list(range(100))
+
+    async def test_execute_concurrent_row_factory(self, session):
+        prepared = await session.create_prepared(
+            "SELECT id, value_uuid FROM test WHERE id = ?",
+            row_factory=dict,
+            decode_options=DecodeOptions(uuid="str"),
+        )
+        insert = await session.create_prepared("INSERT INTO test (id, value_uuid) values( ?, ?)")
+        await session.execute(insert.bind([1, str(UUID(int=1))]))
+        outcomes = await session.execute_concurrent(prepared, [[1], [1]], concurrency=2)
+        for outcome in outcomes:
+            assert list(outcome) == [{"id": 1, "value_uuid": str(UUID(int=1))}]
+
+    async def test_execute_concurrent_async_iterator(self, session):
+        prepared = await session.create_prepared("SELECT id, value FROM test WHERE id = ?")
+        execution = session.execute_concurrent(prepared, [[i] for i in range(100)], concurrency=8)
+        indexes = []
+        async for index, outcome in execution:
+            assert execution.in_flight_requests() <= 8
+            assert outcome.first().value == index
+            indexes.append(index)
+        assert sorted(indexes) == list(range(100))
+
+    async def test_execute_concurrent_captures_errors(self, session):
+        prepared = await session.create_prepared("INSERT INTO test (id, value) values( ?, ?)")
+        outcomes = await session.execute_concurrent(prepared, [[1, 1], ["foo", 2], [3, 3]], concurrency=2)
+        assert not isinstance(outcomes[0], Exception)
+        assert isinstance(outcomes[1], Exception)
+        assert not isinstance(outcomes[2], Exception)
@@ -1,6 +1,19 @@
 from acsylla import create_statement
+from acsylla import DecodeOptions
+from acsylla import RowFactory
 from acsylla.errors import ColumnNotFound
-
+from array import array
+from dataclasses import dataclass
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from decimal import Decimal
+from uuid import UUID
+from uuid import uuid1
+from uuid import uuid4
+
+import gc
 import pytest
 
 pytestmark = pytest.mark.asyncio(loop_scope="class")
@@ -219,6 +232,33 @@ class TestResult:
 
         assert pages_fetched == pages_fetched_expected
 
+    @pytest.mark.parametrize("prefetch,max_buffered_bytes", [(1, None), (4, None), (4, 1), (2, 1024)])
+    async def test_result_paging_prefetch(self, session, id_generation, prefetch, max_buffered_bytes):
+        ids = [next(id_generation) for i in range(20)]
+        statement = create_statement("INSERT INTO test (id, value) values(?, ?)", parameters=2)
+        for id_ in ids:
+            statement.bind_list([id_, id_ * 2])
+            await session.execute(statement)
+
+        statement = session.query(
+            f"SELECT id, value FROM test WHERE id IN ({', '.join(map(str, ids))})",
+            page_size=3,
+            prefetch=prefetch,
+            max_buffered_bytes=max_buffered_bytes,
+        )
+        rows = [row.as_tuple() async for row in statement]
+
+        assert sorted(rows) == [(id_, id_ * 2) for id_ in ids]
+
+    async def test_result_paging_prefetch_invalid(self, session):
+        statement = session.query("SELECT id, value FROM test", prefetch=0)
+        with pytest.raises(ValueError):
+            [row async for row in statement]
+
+        statement = session.query("SELECT id, value FROM test", max_buffered_bytes=0)
+        with pytest.raises(ValueError):
+            [row async for row in statement]
+
     async def test_result_row_as_types(self, session, insert_statement, select_statement, id_generation):
         id_ = next(id_generation)
         value = 100
@@ -248,3 +288,373 @@ class TestResult:
             assert row.as_dict() == row_as_dict
             assert row.as_list() == row_as_list
             assert row.as_tuple() == row_as_tuple
+
+    async def test_result_row_column_descriptor(self, session, id_generation):
+        ids = [next(id_generation) for i in range(2)]
+        for id_ in ids:
+            await session.execute(create_statement(f"INSERT INTO test (id, value) values({id_}, {id_ * 10})"))
+
+        statement = create_statement(f"SELECT id, value FROM test WHERE id IN ({ids[0]}, {ids[1]})")
+        result = await session.execute(statement)
+        rows = list(result)
+
+        assert len(rows) == 2
+        # column names are shared by all of the rows of the result
+        assert rows[0].keys()[0] is rows[1].keys()[0]
+        for row in rows:
+            assert row.id == row["id"] == row[0] == row.column_value("id")
+            assert row.value == row["value"] == row[1] == row.id * 10
+            # lookups not matching the descriptor fall back to the driver
+            assert row.column_value("ID") == row.id
+
+    @pytest.fixture(scope="class")
+    async def rows(self, session, id_generation):
+        prepared = await session.create_prepared(
+            "INSERT INTO test (id, value_bigint, value_double, value_bool, value_text, value_timestamp) "
+            "values(?, ?, ?, ?, ?, ?)"
+        )
+        rows = [
+            (next(id_generation), 1, 1.5, True, "a", datetime(2023, 1, 1, tzinfo=timezone.utc)),
+            (next(id_generation), None, 2.5, False, None, None),
+        ]
+        for row in rows:
+            await session.execute(prepared.bind(list(row)))
+        return rows
+
+    async def test_to_columns(self, session, rows):
+        ids = ", ".join(str(row[0]) for row in rows)
+        result = await session.execute(
+            create_statement(
+                "SELECT id, value_bigint, value_double, value_bool, value_text, value_timestamp "
+                f"FROM test WHERE id IN ({ids})"
+            )
+        )
+        columns = result.to_columns()
+        order = [columns["id"].index(row[0]) for row in rows]
+
+        assert isinstance(columns["value_bigint"], array)
+        assert columns["value_bigint"].typecode == "q"
+        assert [columns["value_bigint"][i] for i in order] == [1, 0]
+        assert [columns["value_double"][i] for i in order] == [1.5, 2.5]
+        assert [columns["value_bool"][i] for i in order] == [1, 0]
+        assert [columns["value_text"][i] for i in order] == ["a", None]
+        assert [columns["value_timestamp"][i] for i in order] == [1672531200000, 0]
+
+        columns, masks = result.to_columns(null_masks=True)
+        assert [masks["value_bigint"][i] for i in order] == [0, 1]
+        assert [masks["value_timestamp"][i] for i in order] == [0, 1]
+        assert [masks["value_double"][i] for i in order] == [0, 0]
+
+    async def test_to_numpy(self, session, rows):
+        numpy = pytest.importorskip("numpy")
+
+        ids = ", ".join(str(row[0]) for row in rows)
+        result = await session.execute(
+            create_statement(
+                "SELECT id, value_bigint, value_double, value_bool, value_text, value_timestamp "
+                f"FROM test WHERE id IN ({ids})"
+            )
+        )
+        columns, masks = result.to_numpy()
+        order = [list(columns["id"]).index(row[0]) for row in rows]
+
+        assert columns["id"].dtype == numpy.int32
+        assert columns["value_bigint"].dtype == numpy.int64
+        assert columns["value_double"].dtype == numpy.float64
+        assert columns["value_timestamp"].dtype == numpy.dtype("datetime64[ms]")
+        assert columns["value_text"].dtype == object
+        assert columns["value_double"][order].tolist() == [1.5, 2.5]
+        assert columns["value_bool"][order].tolist() == [True, False]
+        assert columns["value_text"][order].tolist() == ["a", None]
+        assert columns["value_timestamp"][order[0]] == numpy.datetime64("2023-01-01T00:00:00", "ms")
+        assert masks["value_bigint"][order].tolist() == [False, True]
+        assert masks["value_double"][order].tolist() == [False, False]
+
+        values, mask = result.to_numpy_structured()
+        assert values.dtype.names == tuple(result.columns_names())
+        assert values["value_bigint"][order].tolist() == [1, 0]
+        assert values["value_text"][order].tolist() == ["a", None]
+        assert mask["value_timestamp"][order].tolist() == [False, True]
+
+    async def test_to_numpy_uuid(self, session, id_generation):
+        numpy = pytest.importorskip("numpy")
+
+        id_ = next(id_generation)
+        value = uuid4()
+        prepared = await session.create_prepared("INSERT INTO test (id, value_uuid) values(?, ?)")
+        await session.execute(prepared.bind([id_, value]))
+
+        result = await session.execute(create_statement(f"SELECT value_uuid FROM test WHERE id = {id_}"))
+        columns, _ = result.to_numpy()
+
+        assert columns["value_uuid"].dtype == numpy.dtype("V16")
+        assert UUID(bytes=columns["value_uuid"][0].tobytes()) == value
+
+    async def test_to_arrow(self, session, rows):
+        pyarrow = pytest.importorskip("pyarrow")
+
+        ids = ", ".join(str(row[0]) for row in rows)
+        result = await session.execute(
+            create_statement(
+                "SELECT id, value_bigint, value_double, value_bool, value_text, value_timestamp "
+                f"FROM test WHERE id IN ({ids})"
+            )
+        )
+        batch = result.to_arrow()
+        order = [batch.column("id").to_pylist().index(row[0]) for row in rows]
+
+        assert batch.schema.names == result.columns_names()
+        assert batch.column("id").type == pyarrow.int32()
+        assert batch.column("value_timestamp").type == pyarrow.timestamp("ms")
+        assert batch.column("value_text").type == pyarrow.string()
+        assert [batch.column("value_bigint")[i].as_py() for i in order] == [1, None]
+        assert [batch.column("value_bool")[i].as_py() for i in order] == [True, False]
+        assert [batch.column("value_text")[i].as_py() for i in order] == ["a", None]
+        assert batch.column("value_timestamp")[order[0]].as_py() == datetime(2023, 1, 1)
+
+    async def test_arrow_batches(self, session, rows):
+        pytest.importorskip("pyarrow")
+
+        ids = ", ".join(str(row[0]) for row in rows)
+        statement = session.query(f"SELECT id, value_double FROM test WHERE id IN ({ids})", page_size=1)
+        batches = [batch async for batch in statement.arrow_batches()]
+
+        assert sum(batch.num_rows for batch in batches) == len(rows)
+        assert all(batch.num_rows <= 1 for batch in batches)
+
+    async def test_arrow_batches_schema(self, session, id_generation):
+        pyarrow = pytest.importorskip("pyarrow")
+
+        ids = [next(id_generation) for _ in range(2)]
+        prepared = await session.create_prepared(
+            "INSERT INTO test (id, value_uuid, value_decimal, value_varint, value_date, value_list_text, "
+            "value_map_text_bigint) values(?, ?, ?, ?, ?, ?, ?)"
+        )
+        await session.execute(
+            prepared.bind([ids[0], uuid4(), Decimal("1.25"), 2**70, date(2023, 1, 1), ["a"], {"a": 1}])
+        )
+        await session.execute(prepared.bind([ids[1], None, None, None, None, None, None]))
+
+        statement = session.query(
+            "SELECT value_uuid, value_decimal, value_varint, value_date, value_list_text, value_map_text_bigint "
+            f"FROM test WHERE id IN ({ids[0]}, {ids[1]})",
+            page_size=1,
+        )
+        batches = [batch async for batch in statement.arrow_batches()]
+
+        # pages with null values only get the same schema
+        assert sum(batch.num_rows for batch in batches) == 2
+        assert all(batch.schema == batches[0].schema for batch in batches)
+        table = pyarrow.Table.from_batches(batches)
+        assert table.schema.field("value_uuid").type == pyarrow.binary(16)
+        assert table.schema.field("value_list_text").type == pyarrow.list_(pyarrow.string())
+        assert table.schema.field("value_map_text_bigint").type == pyarrow.map_(pyarrow.string(), pyarrow.int64())
+        assert table.column("value_decimal").null_count == 1
+        assert "1.25" in table.column("value_decimal").to_pylist()
+        assert str(2**70) in table.column("value_varint").to_pylist()
+        assert date(2023, 1, 1) in table.column("value_date").to_pylist()
+
+
+@dataclass
+class ValueRow:
+    id: int
+    value: int
+
+
+class TestResultRowFactory:
+    @pytest.fixture(scope="class")
+    async def ids(self, session, id_generation):
+        ids = [next(id_generation) for i in range(3)]
+        for id_ in ids:
+            await session.execute(create_statement(f"INSERT INTO test (id, value) values({id_}, {id_ * 10})"))
+        return ids
+
+    def select(self, ids, **kwargs):
+        return create_statement(f"SELECT id, value FROM test WHERE id IN ({', '.join(map(str, ids))})", **kwargs)
+
+    @pytest.mark.parametrize("row_factory", [RowFactory.TUPLE, tuple])
+    async def test_tuple(self, session, ids, row_factory):
+        result = await session.execute(self.select(ids), row_factory=row_factory)
+
+        assert sorted(result) == [(id_, id_ * 10) for id_ in ids]
+
+    @pytest.mark.parametrize("row_factory", [RowFactory.DICT, dict])
+    async def test_dict(self, session, ids, row_factory):
+        result = await session.execute(self.select(ids, row_factory=row_factory))
+
+        assert sorted(result, key=lambda row: row["id"]) == [{"id": id_, "value": id_ * 10} for id_ in ids]
+        assert result.first() == {"id": ids[0], "value": ids[0] * 10}
+
+    async def test_named_tuple(self, session, ids):
+        result = await session.execute(self.select(ids), row_factory=RowFactory.NAMED_TUPLE)
+        rows = sorted(result)
+
+        assert [(row.id, row.value) for row in rows] == [(id_, id_ * 10) for id_ in ids]
+        assert rows[0]._fields == ("id", "value")
+        # the class is shared between the results selecting the same columns
+        other = await session.execute(self.select(ids), row_factory=RowFactory.NAMED_TUPLE)
+        assert type(other.first()) is type(rows[0])
+
+    async def test_dataclass(self, session, ids):
+        prepared = await session.create_prepared("SELECT id, value FROM test WHERE id = ?", row_factory=ValueRow)
+        result = await session.execute(prepared.bind([ids[0]]))
+
+        assert list(result) == [ValueRow(id=ids[0], value=ids[0] * 10)]
+
+    async def test_row(self, session, ids):
+        result = await session.execute(self.select(ids, row_factory=dict), row_factory=RowFactory.ROW)
+
+        assert sorted(row.as_tuple() for row in result) == [(id_, id_ * 10) for id_ in ids]
+
+    async def test_invalid(self, session, ids):
+        with pytest.raises(TypeError):
+            self.select(ids, row_factory="dict")
+        with pytest.raises(TypeError):
+            await session.execute(self.select(ids), row_factory=1)
+
+    async def test_fetchall(self, session, ids):
+        result = await session.execute(self.select(ids))
+
+        assert sorted(result.fetchall()) == [(id_, id_ * 10) for id_ in ids]
+        # rows already fetched are not returned again
+        assert result.fetchall() == []
+
+        result = await session.execute(self.select(ids), row_factory=RowFactory.DICT)
+        assert sorted(result.fetchall(), key=lambda row: row["id"]) == [{"id": id_, "value": id_ * 10} for id_ in ids]
+
+        result = await session.execute(self.select(ids))
+        assert sorted(result.fetchall(row_factory=ValueRow), key=lambda row: row.id) == [
+            ValueRow(id=id_, value=id_ * 10) for id_ in ids
+        ]
+        with pytest.raises(ValueError):
+            result.fetchall(row_factory=RowFactory.ROW)
+
+    async def test_fetchmany(self, session, ids):
+        result = await session.execute(self.select(ids))
+
+        rows = result.fetchmany(2)
+        assert len(rows) == 2
+        rows += result.fetchmany(2)
+        assert sorted(rows) == [(id_, id_ * 10) for id_ in ids]
+        assert result.fetchmany(2) == []
+        # iterating the result does not depend on the fetched rows
+        assert len(list(result)) == len(ids)
+
+
+class TestResultDecodeOptions:
+    async def test_zero_copy(self, session, id_generation):
+        id_ = next(id_generation)
+        blob = bytes(range(256)) * 512
+        prepared = await session.create_prepared("INSERT INTO test (id, value_blob, value_text) values (?, ?, ?)")
+        await session.execute(prepared.bind([id_, blob, "text"]))
+
+        statement = create_statement(
+            f"SELECT value_blob, value_text, value_int FROM test WHERE id = {id_}",
+            decode_options=DecodeOptions(zero_copy=True),
+        )
+        result = await session.execute(statement)
+        row = result.first()
+        value_blob, value_text, value_int = row.as_tuple()
+
+        assert isinstance(value_blob, memoryview)
+        assert value_blob.readonly
+        assert bytes(value_text) == b"text"
+        assert value_int is None
+        # the views keep the result alive
+        del result, row
+        gc.collect()
+        assert value_blob == blob
+
+    async def test_zero_copy_session_default(self, cluster, keyspace, id_generation):
+        id_ = next(id_generation)
+        session = await cluster.create_session(keyspace=keyspace, decode_options=DecodeOptions(zero_copy=True))
+        try:
+            await session.execute(create_statement(f"INSERT INTO test (id, value_blob) values ({id_}, 0x0102)"))
+            statement = create_statement(f"SELECT value_blob FROM test WHERE id = {id_}")
+
+            row = (await session.execute(statement)).first()
+            assert isinstance(row.value_blob, memoryview)
+
+            # options of the statement take precedence
+            statement.decode_options = DecodeOptions()
+            row = (await session.execute(statement)).first()
+            assert row.value_blob == b"\x01\x02"
+        finally:
+            await session.close()
+
+    @pytest.mark.parametrize("uuid_format", ["str", "uuid", "bytes"])
+    async def test_uuid(self, session, id_generation, uuid_format):
+        id_ = next(id_generation)
+        value_uuid = uuid4()
+        value_timeuuid = uuid1()
+        prepared = await session.create_prepared("INSERT INTO test (id, value_uuid, value_timeuuid) values (?, ?, ?)")
+        await session.execute(prepared.bind([id_, str(value_uuid), str(value_timeuuid)]))
+
+        statement = create_statement(
+            f"SELECT value_uuid, value_timeuuid, value_int FROM test WHERE id = {id_}",
+            decode_options=DecodeOptions(uuid=uuid_format),
+        )
+        row = (await session.execute(statement)).first()
+
+        expected = {
+            "str": (str(value_uuid), str(value_timeuuid)),
+            "uuid": (value_uuid, value_timeuuid),
+            "bytes": (value_uuid.bytes, value_timeuuid.bytes),
+        }[uuid_format]
+        assert (row.value_uuid, row.value_timeuuid) == expected
+        if uuid_format == "uuid":
+            assert row.value_timeuuid.version == 1
+            assert hash(row.value_uuid) == hash(value_uuid)
+
+    async def test_uuid_format_not_supported(self):
+        with pytest.raises(ValueError):
+            DecodeOptions(uuid="hex")
+
+    async def test_timestamp(self, session, id_generation):
+        prepared = await session.create_prepared("INSERT INTO test (id, value_timestamp) values (?, ?)")
+        for value in [
+            datetime(2021, 7, 21, 15, 24, 31, 123000, tzinfo=timezone.utc),
+            datetime(1969, 12, 31, 23, 59, 59, 999000, tzinfo=timezone.utc),
+            datetime(1, 1, 1, tzinfo=timezone.utc),
+        ]:
+            id_ = next(id_generation)
+            await session.execute(prepared.bind([id_, value]))
+            statement = create_statement(f"SELECT value_timestamp FROM test WHERE id = {id_}")
+
+            row = (await session.execute(statement)).first()
+            assert row.value_timestamp == value
+
+            row = (await session.execute(statement, native_types=True)).first()
+            assert row.value_timestamp == f"{value.year:04d}-{value:%m-%d %H:%M:%S}.{value.microsecond // 1000:03d}Z"
+
+            statement.decode_options = DecodeOptions(timestamp="epoch_ms")
+            row = (await session.execute(statement)).first()
+            assert row.value_timestamp == (value - datetime(1970, 1, 1, tzinfo=timezone.utc)) // timedelta(
+                milliseconds=1
+            )
+
+    async def test_timestamp_format_not_supported(self):
+        with pytest.raises(ValueError):
+            DecodeOptions(timestamp="epoch_s")
+
+    async def test_intern_columns(self, session, id_generation):
+        ids = [next(id_generation) for _ in range(4)]
+        prepared = await session.create_prepared("INSERT INTO test (id, value_text, value_ascii) values (?, ?, ?)")
+        for id_, value in zip(ids, ["active", "active", "disabled", "ünïcode"]):
+            await session.execute(prepared.bind([id_, value, "ascii"]))
+
+        statement = create_statement(
+            f"SELECT id, value_text, value_ascii FROM test WHERE id IN ({', '.join(map(str, ids))})",
+            decode_options=DecodeOptions(intern_columns=["value_text"]),
+        )
+        rows = {row.id: row for row in await session.execute(statement)}
+
+        assert [rows[id_].value_text for id_ in ids] == ["active", "active", "disabled", "ünïcode"]
+        assert rows[ids[0]].value_text is rows[ids[1]].value_text
+        # columns not selected are decoded as usual
+        assert rows[ids[0]].value_ascii == "ascii"
+        assert rows[ids[0]].value_ascii is not rows[ids[1]].value_ascii
+
+    async def test_intern_cache_size_not_supported(self):
+        with pytest.raises(ValueError):
+            DecodeOptions(intern_columns=["value_text"], intern_cache_size=0)
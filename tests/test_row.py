@@ -204,6 +204,20 @@ class TestRow:
 
         assert row.column_value("value_decimal") == value
 
+    async def test_decimal_scales(self, session, id_generation):
+        insert_statement = await session.create_prepared("INSERT INTO test (id, value_decimal) values (?, ?)")
+        select_statement = await session.create_prepared("SELECT value_decimal FROM test WHERE ( id = ? )")
+        for value in ["-3.14", "0.00", "-0.5", "1E+3", "12345678901234567890.123456789", "-128", "255"]:
+            id_ = next(id_generation)
+            await session.execute(insert_statement.bind([id_, Decimal(value)]))
+
+            row = (await session.execute(select_statement.bind([id_]))).first()
+            assert row.column_value("value_decimal") == Decimal(value)
+            assert row.column_value("value_decimal").as_tuple() == Decimal(value).as_tuple()
+
+            row = (await session.execute(select_statement.bind([id_]), native_types=True)).first()
+            assert row.column_value("value_decimal") == str(Decimal(value))
+
     async def test_uuid(self, session, id_generation):
         id_ = next(id_generation)
         value = uuid.UUID("550e8400-e29b-41d4-a716-446655440000")
@@ -332,7 +346,17 @@ class TestRow:
         result = await session.execute(select_statement)
         row = result.first()
 
-        assert row.column_value("value_varint") == value
+        assert row.column_value("value_varint") == int.from_bytes(value, "big", signed=True)
+
+    async def test_varint_int(self, session, id_generation):
+        insert_statement = await session.create_prepared("INSERT INTO test (id, value_varint) values (?, ?)")
+        select_statement = await session.create_prepared("SELECT value_varint FROM test WHERE ( id = ? )")
+        for value in [0, 1, -1, 127, 128, -128, -129, 2**63 - 1, -(2**63), 2**64, -(2**100) + 7]:
+            id_ = next(id_generation)
+            await session.execute(insert_statement.bind([id_, value]))
+
+            row = (await session.execute(select_statement.bind([id_]))).first()
+            assert row.column_value("value_varint") == value
 
     async def test_inet4(self, session, id_generation):
         id_ = next(id_generation)
@@ -677,3 +701,28 @@ class TestRow:
         result = await session.execute(prepared)
         row = result.first()
         assert row.column_value("id") == id_
+
+    async def test_nested_null_values(self, session, id_generation):
+        id_ = next(id_generation)
+
+        insert_statement = create_statement(
+            f"INSERT INTO test (id, value_map_udt, value_tuple_udt) values ({id_}, "
+            "{1: {value_bigint: 2, value_list_text: ['a', 'b'], value_nested_udt: {value_ascii: 'c'}}}, "
+            "({value_int: 4}, null))"
+        )
+        await session.execute(insert_statement)
+
+        select_statement = create_statement(
+            "SELECT value_map_udt, value_tuple_udt FROM test WHERE ( id = ? )", parameters=1
+        )
+        select_statement.bind(0, id_)
+        result = await session.execute(select_statement)
+
+        row = result.first()
+        udt = row.value_map_udt[1]
+        assert udt["value_bigint"] == 2
+        assert udt["value_list_text"] == ["a", "b"]
+        assert udt["value_nested_udt"] == {"value_ascii": "c", "value_bigint": None}
+        assert udt["value_text"] is None
+        assert row.value_tuple_udt[0]["value_int"] == 4
+        assert row.value_tuple_udt[1] is None
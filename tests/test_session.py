@@ -4,12 +4,24 @@ from acsylla import create_statement
 from acsylla.errors import CassErrorLibNoHostsAvailable
 from acsylla.errors import CassErrorServerInvalidQuery
 from acsylla.errors import CassErrorServerSyntaxError
+from concurrent.futures import ThreadPoolExecutor
 
+import asyncio
 import pytest
+import time
 
 pytestmark = pytest.mark.asyncio(loop_scope="class")
 
 
+async def wait_prepared_cache(session, predicate):
+    # Statements are prepared in the background by their first execution.
+    for _ in range(500):
+        if predicate(session.prepared_cache_metrics()):
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("statement not prepared")
+
+
 class TestClosedSession:
     async def test_execute_using_a_closed_session(self, session):
         await session.close()
@@ -112,3 +124,333 @@ class TestSession:
         assert metrics.stats_total_connections > 0
         assert metrics.errors_connection_timeouts == 0
         assert metrics.errors_request_timeouts == 0
+
+    async def test_bridge_metrics(self, session, id_generation):
+        before = session.bridge_metrics()
+
+        statements = []
+        for _ in range(10):
+            key_and_value = str(next(id_generation))
+            statements.append(
+                create_statement("INSERT INTO test (id, value) values(" + key_and_value + "," + key_and_value + ")")
+            )
+        await asyncio.gather(*[session.execute(statement) for statement in statements])
+
+        after = session.bridge_metrics()
+
+        assert after.completions - before.completions >= 10
+        assert 0 < after.wakeups - before.wakeups <= after.completions - before.completions
+
+    async def test_bridge_metrics_without_coalescing(self, host, keyspace, id_generation):
+        cluster = create_cluster([host], coalesce_wakeups=False)
+        session = await cluster.create_session(keyspace=keyspace)
+        statements = []
+        for _ in range(50):
+            key_and_value = str(next(id_generation))
+            statements.append(
+                create_statement("INSERT INTO test (id, value) values(" + key_and_value + "," + key_and_value + ")")
+            )
+        # The bridge is shared with the rest of the clusters of the loop, their
+        # log messages and host events might wake it up as well
+        before = session.bridge_metrics()
+        await asyncio.gather(*[session.execute(statement) for statement in statements])
+        after = session.bridge_metrics()
+
+        # even the completions of the burst got their own wakeup
+        assert after.completions - before.completions == 50
+        assert after.wakeups - before.wakeups >= 50
+
+        await session.close()
+
+    async def test_bridge_shared_between_clusters(self, session, host, keyspace, id_generation):
+        cluster = create_cluster([host])
+        other_session = await cluster.create_session(keyspace=keyspace)
+
+        key_and_value = str(next(id_generation))
+        statement = create_statement("INSERT INTO test (id, value) values(" + key_and_value + "," + key_and_value + ")")
+        await other_session.execute(statement)
+
+        assert other_session.bridge_metrics() == session.bridge_metrics()
+
+        await other_session.close()
+
+    async def test_execute_materialize_results(self, host, keyspace, id_generation):
+        cluster = create_cluster([host], materialize_results=True)
+        session = await cluster.create_session(keyspace=keyspace)
+
+        key_and_value = str(next(id_generation))
+        statement = create_statement("INSERT INTO test (id, value) values(" + key_and_value + "," + key_and_value + ")")
+        await session.execute(statement)
+
+        statement = create_statement("SELECT id, value FROM test WHERE id = " + key_and_value)
+        statement.set_tracing(True)
+        result = await session.execute(statement)
+        assert result.first().value == int(key_and_value)
+        assert result.tracing_id is not None
+
+        batch = create_batch_unlogged()
+        batch.add_statement(
+            create_statement("INSERT INTO test (id, value) values(" + key_and_value + "," + key_and_value + ")")
+        )
+        await session.execute_batch(batch)
+
+        with pytest.raises(CassErrorServerSyntaxError):
+            await session.execute(create_statement("foobar"))
+
+        await session.close()
+
+    async def test_query_prepared_cache(self, host, keyspace, id_generation):
+        cluster = create_cluster([host])
+        session = await cluster.create_session(keyspace=keyspace, prepared_cache_size=1)
+
+        key_and_value = next(id_generation)
+        await session.query("INSERT INTO test (id, value) values(?, ?)", [key_and_value, key_and_value])
+        await wait_prepared_cache(session, lambda metrics: metrics.size == 1)
+
+        metrics = session.prepared_cache_metrics()
+        assert metrics.size == 1
+        assert metrics.max_size == 1
+        assert metrics.misses == 1
+        assert metrics.hits == 0
+
+        statement = session.query("SELECT id, value FROM test WHERE id = ?", [key_and_value])
+        assert (await statement).first().value == key_and_value
+        await wait_prepared_cache(session, lambda metrics: metrics.evictions == 1)
+
+        result = await session.query("SELECT id, value FROM test WHERE id = ?", [key_and_value])
+        assert result.first().value == key_and_value
+
+        metrics = session.prepared_cache_metrics()
+        assert metrics.size == 1
+        assert metrics.hits == 1
+        assert metrics.misses == 2
+        assert metrics.evictions == 1
+
+        with pytest.raises(CassErrorServerSyntaxError):
+            await session.query("foobar")
+        assert session.prepared_cache_metrics().size == 1
+
+        await session.close()
+
+    async def test_query_prepared_cache_keyspace(self, host, keyspace):
+        cluster = create_cluster([host])
+        session = await cluster.create_session(keyspace=keyspace, prepared_cache_size=2)
+
+        await session.query("SELECT id FROM test LIMIT 1")
+        await wait_prepared_cache(session, lambda metrics: metrics.size == 1)
+
+        # The statement prepared in the former keyspace is not reused.
+        await session.use_keyspace("system_schema")
+        with pytest.raises(CassErrorServerInvalidQuery):
+            await session.query("SELECT id FROM test LIMIT 1")
+
+        metrics = session.prepared_cache_metrics()
+        assert metrics.hits == 0
+        assert metrics.misses == 2
+
+        await session.close()
+
+    async def test_query_prepared_cache_disabled(self, session, id_generation):
+        key_and_value = next(id_generation)
+        await session.query("INSERT INTO test (id, value) values(?, ?)", [key_and_value, key_and_value])
+
+        assert session.prepared_cache_metrics().misses == 0
+        assert session.prepared_cache_metrics().max_size == 0
+
+    async def test_submit(self, session, id_generation):
+        tracker = session.create_completion_tracker()
+        ids = [next(id_generation) for _ in range(100)]
+        for key_and_value in ids:
+            statement = create_statement(f"INSERT INTO test (id, value) values({key_and_value}, {key_and_value})")
+            session.submit(statement, tracker)
+
+        assert tracker.in_flight_requests() > 0
+        await tracker.drain()
+
+        assert tracker.in_flight_requests() == 0
+        assert tracker.succeeded_requests() == 100
+        assert tracker.failed_requests() == 0
+        assert tracker.last_error() is None
+
+        statement = create_statement(f"SELECT id, value FROM test WHERE id = {ids[-1]}")
+        result = await session.execute(statement)
+        assert result.first().value == ids[-1]
+
+    async def test_submit_errors(self, session):
+        session.submit(create_statement("foobar"))
+        session.submit(create_statement("foobar"))
+
+        tracker = session.completion_tracker()
+        await tracker.drain()
+
+        assert tracker.failed_requests() == 2
+        assert isinstance(tracker.last_error(), CassErrorServerSyntaxError)
+
+        # Drained trackers are completed right away
+        await tracker.drain()
+
+    async def test_submit_cluster_destroyed(self, host, keyspace, id_generation):
+        async def submit_and_destroy():
+            cluster = create_cluster([host])
+            session = await cluster.create_session(keyspace=keyspace)
+            tracker = session.create_completion_tracker()
+            for _ in range(100):
+                key_and_value = next(id_generation)
+                statement = create_statement(f"INSERT INTO test (id, value) values({key_and_value}, {key_and_value})")
+                session.submit(statement, tracker)
+            # Last user of the bridge of its loop, the requests in flight are abandoned
+            cluster.destroy()
+            try:
+                await asyncio.wait_for(tracker.drain(), 5)
+            except RuntimeError:
+                assert isinstance(tracker.last_error(), RuntimeError)
+            return tracker
+
+        # A loop of its own, the bridge of this one is shared by the fixtures
+        with ThreadPoolExecutor(1) as executor:
+            future = executor.submit(lambda: asyncio.run(submit_and_destroy()))
+            tracker = await asyncio.wrap_future(future)
+
+        assert tracker.in_flight_requests() == 0
+        assert tracker.succeeded_requests() + tracker.failed_requests() == 100
+
+    @pytest.mark.parametrize("ordered", [False, True])
+    async def test_scan(self, session, keyspace, id_generation, ordered):
+        ids = set()
+        for _ in range(50):
+            key_and_value = next(id_generation)
+            ids.add(key_and_value)
+            await session.execute(
+                create_statement(f"INSERT INTO test (id, value) values({key_and_value}, {key_and_value})")
+            )
+
+        scan = session.scan(keyspace, "test", ["id", "value"], splits=8, concurrency=3, page_size=7, ordered=ordered)
+        scanned = [row.value async for row in scan]
+
+        assert len(scanned) == len(set(scanned))
+        assert ids <= set(scanned)
+        assert all(token_range.finished for token_range in scan.checkpoint())
+
+    async def test_scan_pages_and_checkpoint(self, session, keyspace, id_generation):
+        ids = set()
+        for _ in range(50):
+            key_and_value = next(id_generation)
+            ids.add(key_and_value)
+            await session.execute(
+                create_statement(f"INSERT INTO test (id, value) values({key_and_value}, {key_and_value})")
+            )
+
+        scanned = set()
+        scan = session.scan(keyspace, "test", ["id"], splits=4, concurrency=2, page_size=5, pages=True)
+        async for page in scan:
+            scanned.update(row.id for row in page)
+            break
+        checkpoint = scan.checkpoint()
+        assert not all(token_range.finished for token_range in checkpoint)
+
+        async for row in session.scan(keyspace, "test", ["id"], concurrency=2, page_size=5, checkpoint=checkpoint):
+            scanned.add(row.id)
+
+        assert ids <= scanned
+
+    async def test_execute_sync(self, session, id_generation):
+        key_and_value = str(next(id_generation))
+        statement = create_statement("INSERT INTO test (id, value) values(" + key_and_value + "," + key_and_value + ")")
+        session.execute_sync(statement)
+
+        statement = create_statement("SELECT id, value FROM test WHERE id = " + key_and_value)
+        result = session.execute_sync(statement)
+        assert result.first().value == int(key_and_value)
+
+        with pytest.raises(CassErrorServerSyntaxError):
+            session.execute_sync(create_statement("foobar"))
+
+    async def test_execute_sync_from_threads(self, session, id_generation):
+        keys = [next(id_generation) for _ in range(100)]
+
+        def insert(key):
+            statement = create_statement("INSERT INTO test (id, value) values(" + str(key) + "," + str(key) + ")")
+            return session.execute_sync(statement)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(insert, keys))
+
+        assert len(results) == 100
+
+    async def test_bridge_latency_metrics(self, session, id_generation):
+        statements = []
+        for _ in range(10):
+            key_and_value = str(next(id_generation))
+            statements.append(
+                create_statement("INSERT INTO test (id, value) values(" + key_and_value + "," + key_and_value + ")")
+            )
+        await asyncio.gather(*[session.execute(statement) for statement in statements])
+
+        metrics = session.bridge_latency_metrics()
+
+        assert metrics.queue_delay.count >= 10
+        assert metrics.queue_delay.min <= metrics.queue_delay.percentile_50th <= metrics.queue_delay.max
+        assert sum(count for _, count in metrics.queue_delay.buckets) == metrics.queue_delay.count
+        assert metrics.drain_batch_size.count > 0
+        assert metrics.drain_batch_size.max >= 1
+        assert metrics.drain_duration.count == metrics.drain_batch_size.count
+
+    async def test_execute_burst(self, session, id_generation):
+        statements = []
+        for _ in range(500):
+            key_and_value = str(next(id_generation))
+            statements.append(
+                create_statement("INSERT INTO test (id, value) values(" + key_and_value + "," + key_and_value + ")")
+            )
+        before = session.bridge_metrics()
+        results = await asyncio.gather(*[session.execute(statement) for statement in statements])
+        after = session.bridge_metrics()
+
+        assert len(results) == 500
+        # every completion went through the ring or the overflow queue
+        assert after.completions - before.completions == 500
+        assert after.overflows - before.overflows == 0
+        # wakeups are coalesced
+        assert 1 <= after.wakeups - before.wakeups <= 500
+
+    async def test_bridge_overflow(self, session, id_generation):
+        # More completions than the 8192 entries of the ring
+        requests = 10000
+        tracker = session.create_completion_tracker()
+        statements = []
+        for _ in range(requests):
+            key_and_value = str(next(id_generation))
+            statements.append(
+                create_statement("INSERT INTO test (id, value) values(" + key_and_value + "," + key_and_value + ")")
+            )
+        before = session.bridge_metrics()
+        for statement in statements:
+            session.submit(statement, tracker)
+
+        # The loop is blocked, so the completions pile up until they overflow the ring
+        deadline = time.monotonic() + 30
+        while session.bridge_metrics().overflows == before.overflows and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert session.bridge_metrics().overflows > before.overflows
+
+        await tracker.drain()
+
+        # every completion was handed over once, either from the ring or from the overflow queue
+        assert tracker.in_flight_requests() == 0
+        assert tracker.succeeded_requests() + tracker.failed_requests() == requests
+
+    async def test_execute_cancelled(self, session, id_generation):
+        key_and_value = str(next(id_generation))
+        insert_statement = create_statement(
+            "INSERT INTO test (id, value) values(" + key_and_value + "," + key_and_value + ")"
+        )
+        task = asyncio.create_task(session.execute(insert_statement))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # Session remains usable once the cancelled request completes
+        select_statement = create_statement("SELECT id, value FROM test WHERE id = " + key_and_value)
+        result = await asyncio.wait_for(session.execute(select_statement), timeout=5)
+        assert result is not None